@@ -8,7 +8,7 @@ considering obstacles and environmental constraints.
 import numpy as np
 import math
 from typing import List, Tuple, Dict, Any, Optional
-from utils.geo_utils import calculate_distance, calculate_bearing, offset_position
+from utils.geo_utils import calculate_distance, calculate_distances, offset_position, AnchorFrame, METERS_PER_DEGREE
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +27,11 @@ class PathPlanner:
         safe_distance: Minimum safe distance in meters from obstacles
         grid_size: Size of grid cells in meters for discretized planning
         obstacles: List of obstacle positions and radii
+    
+    Obstacles are also kept as contiguous NumPy arrays (latitudes, longitudes
+    and radii) so that collision checks can test all obstacles at once.
+    Segment checks work in a local equirectangular frame in meters centered
+    on the start of the current plan.
     """
     
     def __init__(
@@ -47,8 +52,38 @@ class PathPlanner:
         self.safe_distance = safe_distance
         self.grid_size = grid_size
         self.obstacles = []  # List of (lat, lon, radius) tuples
+        self._obs_lat = np.empty(0)
+        self._obs_lon = np.empty(0)
+        self._obs_r = np.empty(0)
+        self._obs_x = np.empty(0)
+        self._obs_y = np.empty(0)
+        
+        # Local projection origin, set at the start of each plan
+        self._origin_set = False
+        self._lat0 = 0.0
+        self._lon0 = 0.0
+        self._cos_lat0 = 1.0
+        self._mpd_lon = METERS_PER_DEGREE
         logger.info(f"Path planner initialized with {planning_mode} mode")
     
+    @property
+    def planning_mode(self) -> str:
+        """The algorithm used for path planning."""
+        return self._planning_mode
+    
+    @planning_mode.setter
+    def planning_mode(self, planning_mode: str) -> None:
+        # Bind the planning algorithm once instead of dispatching on every call
+        self._planning_mode = planning_mode
+        self._planner = {
+            "waypoint": self._plan_direct_path,
+            "astar": self._plan_astar_path,
+            "rrt": self._plan_rrt_path,
+        }.get(planning_mode)
+        if self._planner is None:
+            logger.warning(f"Unknown planning mode: {planning_mode}, falling back to direct path")
+            self._planner = self._plan_direct_path
+    
     def set_obstacles(self, obstacles: List[Tuple[float, float, float]]) -> None:
         """
         Set the list of obstacles for path planning.
@@ -57,6 +92,17 @@ class PathPlanner:
             obstacles: List of (latitude, longitude, radius) tuples representing obstacles
         """
         self.obstacles = obstacles
+        
+        # Structure-of-arrays copy used by the collision checks
+        arr = np.asarray(obstacles, dtype=np.float64).reshape(-1, 3)
+        self._obs_lat = arr[:, 0].copy()
+        self._obs_lon = arr[:, 1].copy()
+        self._obs_r = arr[:, 2].copy()
+        
+        if not self._origin_set and self._obs_r.size:
+            self._set_origin(self._obs_lat[0], self._obs_lon[0])
+        else:
+            self._obs_x, self._obs_y = self._to_m(self._obs_lat, self._obs_lon)
         logger.info(f"Set {len(obstacles)} obstacles for path planning")
     
     def plan_path(
@@ -74,15 +120,52 @@ class PathPlanner:
         Returns:
             List of waypoints as (latitude, longitude) tuples forming the path
         """
-        if self.planning_mode == "waypoint":
-            return self._plan_direct_path(start, goal)
-        elif self.planning_mode == "astar":
-            return self._plan_astar_path(start, goal)
-        elif self.planning_mode == "rrt":
-            return self._plan_rrt_path(start, goal)
-        else:
-            logger.warning(f"Unknown planning mode: {self.planning_mode}, falling back to direct path")
-            return self._plan_direct_path(start, goal)
+        self._set_origin(start[0], start[1])
+        return self._planner(start, goal)
+    
+    def _set_origin(self, lat0: float, lon0: float) -> None:
+        """
+        Set the origin of the local metric projection.
+        
+        Caches the longitude scale factor for the origin latitude and
+        re-projects the obstacle centers into the new frame.
+        
+        Args:
+            lat0: Origin latitude in degrees
+            lon0: Origin longitude in degrees
+        """
+        self._origin_set = True
+        self._lat0 = float(lat0)
+        self._lon0 = float(lon0)
+        self._cos_lat0 = math.cos(math.radians(self._lat0))
+        self._mpd_lon = METERS_PER_DEGREE * self._cos_lat0
+        self._obs_x, self._obs_y = self._to_m(self._obs_lat, self._obs_lon)
+    
+    def _to_m(self, lat, lon):
+        """
+        Project geographic coordinates into the local metric frame.
+        
+        Args:
+            lat: Latitude in degrees (scalar or array)
+            lon: Longitude in degrees (scalar or array)
+            
+        Returns:
+            Tuple of (x, y) in meters east and north of the origin
+        """
+        return (lon - self._lon0) * self._mpd_lon, (lat - self._lat0) * METERS_PER_DEGREE
+    
+    def _to_ll(self, x, y):
+        """
+        Convert local metric coordinates back to geographic coordinates.
+        
+        Args:
+            x: Meters east of the origin (scalar or array)
+            y: Meters north of the origin (scalar or array)
+            
+        Returns:
+            Tuple of (latitude, longitude) in degrees
+        """
+        return self._lat0 + y / METERS_PER_DEGREE, self._lon0 + x / self._mpd_lon
     
     def _plan_direct_path(
         self, 
@@ -99,18 +182,12 @@ class PathPlanner:
         Returns:
             List containing start and goal waypoints
         """
-        logger.info(f"Planning direct path from {start} to {goal}")
-        
-        # Check for collision with obstacles
-        for obs_lat, obs_lon, obs_radius in self.obstacles:
-            # Check if the direct path intersects with any obstacle
-            intersects = self._line_intersects_circle(
-                start, goal, (obs_lat, obs_lon), obs_radius + self.safe_distance
-            )
-            
-            if intersects:
-                logger.warning("Direct path intersects obstacle, consider using A* or RRT planner")
-                # Still return direct path but with warning
+        logger.info("Planning direct path from %s to %s", start, goal)
+        
+        # Check if the direct path intersects with any obstacle
+        if self._segment_hits_any(start, goal):
+            logger.warning("Direct path intersects obstacle, consider using A* or RRT planner")
+            # Still return direct path but with warning
         
         return [start, goal]
     
@@ -129,7 +206,7 @@ class PathPlanner:
         Returns:
             List of waypoints forming the path
         """
-        logger.info(f"Planning A* path from {start} to {goal}")
+        logger.info("Planning A* path from %s to %s", start, goal)
         
         # Create simplified grid representation for demonstration purposes
         # Note: A full A* implementation would use a proper grid and heuristic
@@ -147,50 +224,58 @@ class PathPlanner:
         iteration = 0
         
         # Keep trying to reach the goal
-        while iteration < max_iterations and calculate_distance(current[0], current[1], goal[0], goal[1]) > self.grid_size:
+        while iteration < max_iterations:
+            # Distances, bearings and offsets below are all taken from the current point
+            anchor = AnchorFrame(current[0], current[1])
+            distance_to_goal = anchor.distance_to(goal[0], goal[1])
+            if not distance_to_goal > self.grid_size:
+                break
             iteration += 1
             
             # Direct bearing to goal
-            bearing = calculate_bearing(current[0], current[1], goal[0], goal[1])
+            bearing = anchor.bearing_to(goal[0], goal[1])
             
             # Tentative next point at one grid step towards goal
-            distance_to_goal = calculate_distance(current[0], current[1], goal[0], goal[1])
             step_distance = min(self.grid_size, distance_to_goal)
             
-            next_point = offset_position(current[0], current[1], bearing, step_distance)
+            next_point = anchor.offset(bearing, step_distance)
             
             # Check for obstacle collisions
             collision = False
             avoidance_point = None
             
-            for obs_lat, obs_lon, obs_radius in self.obstacles:
-                distance_to_obs = calculate_distance(next_point[0], next_point[1], obs_lat, obs_lon)
+            # Find the first obstacle (in list order) too close to the next point
+            distances_to_obs = self._distances_to_obstacles(next_point)
+            hits = np.flatnonzero(distances_to_obs < self._obs_r + self.safe_distance)
+            
+            if hits.size:
+                collision = True
+                idx = hits[0]
+                obs_lat = float(self._obs_lat[idx])
+                obs_lon = float(self._obs_lon[idx])
+                obs_radius = float(self._obs_r[idx])
+                
+                # Calculate avoidance waypoint
+                # Determine which side to go around the obstacle
+                obs_bearing = anchor.bearing_to(obs_lat, obs_lon)
+                bearing_diff = (obs_bearing - bearing) % 360
+                
+                if bearing_diff < 180:
+                    # Go right of obstacle
+                    avoidance_bearing = (obs_bearing + 90) % 360
+                else:
+                    # Go left of obstacle
+                    avoidance_bearing = (obs_bearing - 90) % 360
                 
-                if distance_to_obs < (obs_radius + self.safe_distance):
-                    collision = True
-                    
-                    # Calculate avoidance waypoint
-                    # Determine which side to go around the obstacle
-                    obs_bearing = calculate_bearing(current[0], current[1], obs_lat, obs_lon)
-                    bearing_diff = (obs_bearing - bearing) % 360
-                    
-                    if bearing_diff < 180:
-                        # Go right of obstacle
-                        avoidance_bearing = (obs_bearing + 90) % 360
-                    else:
-                        # Go left of obstacle
-                        avoidance_bearing = (obs_bearing - 90) % 360
-                    
-                    # Create waypoint that avoids the obstacle
-                    avoidance_distance = obs_radius + self.safe_distance + 5.0  # Extra margin
-                    avoidance_point = offset_position(obs_lat, obs_lon, avoidance_bearing, avoidance_distance)
-                    break
+                # Create waypoint that avoids the obstacle
+                avoidance_distance = obs_radius + self.safe_distance + 5.0  # Extra margin
+                avoidance_point = offset_position(obs_lat, obs_lon, avoidance_bearing, avoidance_distance)
             
             if collision and avoidance_point:
                 # Add the avoidance point to path
                 path.append(avoidance_point)
                 current = avoidance_point
-                logger.info(f"Added avoidance waypoint at {avoidance_point}")
+                logger.info("Added avoidance waypoint at %s", avoidance_point)
             else:
                 # No collision, proceed toward goal
                 path.append(next_point)
@@ -200,7 +285,7 @@ class PathPlanner:
         if path[-1] != goal:
             path.append(goal)
         
-        logger.info(f"A* planning completed with {len(path)} waypoints")
+        logger.info("A* planning completed with %d waypoints", len(path))
         return path
     
     def _plan_rrt_path(
@@ -218,15 +303,11 @@ class PathPlanner:
         Returns:
             List of waypoints forming the path
         """
-        logger.info(f"Planning RRT path from {start} to {goal}")
+        logger.info("Planning RRT path from %s to %s", start, goal)
         
         # Simple RRT implementation for demonstration
         # In a real implementation, this would be more sophisticated
         
-        # Initialize the tree with start position
-        tree = [start]
-        parents = {0: None}  # Maps node index to parent index
-        
         # Define the bounding box for sampling random points
         # Calculate a reasonable bounding box around start and goal
         lat_min = min(start[0], goal[0]) - 0.01  # Approx 1 km
@@ -239,6 +320,14 @@ class PathPlanner:
         goal_sample_rate = 0.1  # Probability of sampling the goal directly
         max_step_size = self.grid_size * 2
         
+        # Pre-allocate the tree (start, one node per iteration, goal) as an
+        # (N, 2) array of positions; n is the number of nodes in use
+        tree = np.empty((max_iterations + 2, 2))
+        parents = np.empty(max_iterations + 2, dtype=np.intp)  # Parent index per node
+        tree[0] = start
+        parents[0] = -1
+        n = 1
+        
         # Run RRT algorithm
         goal_idx = None
         
@@ -252,26 +341,28 @@ class PathPlanner:
                 random_point = (random_lat, random_lon)
             
             # Find nearest node in tree
-            nearest_idx = self._find_nearest_node(tree, random_point)
-            nearest_node = tree[nearest_idx]
+            nearest_idx = self._find_nearest_node(tree[:n], random_point)
+            nearest_node = (float(tree[nearest_idx, 0]), float(tree[nearest_idx, 1]))
             
             # Create new node in the direction of random point
-            bearing = calculate_bearing(nearest_node[0], nearest_node[1], random_point[0], random_point[1])
-            distance = calculate_distance(nearest_node[0], nearest_node[1], random_point[0], random_point[1])
+            anchor = AnchorFrame(nearest_node[0], nearest_node[1])
+            bearing = anchor.bearing_to(random_point[0], random_point[1])
+            distance = anchor.distance_to(random_point[0], random_point[1])
             
             # Limit step size
             if distance > max_step_size:
                 distance = max_step_size
             
             # Create new node
-            new_node = offset_position(nearest_node[0], nearest_node[1], bearing, distance)
+            new_node = anchor.offset(bearing, distance)
             
             # Check if new node collides with obstacles
             if self._is_collision_free(nearest_node, new_node):
                 # Add new node to tree
-                tree.append(new_node)
-                new_idx = len(tree) - 1
+                new_idx = n
+                tree[new_idx] = new_node
                 parents[new_idx] = nearest_idx
+                n += 1
                 
                 # Check if we can connect to goal
                 distance_to_goal = calculate_distance(new_node[0], new_node[1], goal[0], goal[1])
@@ -280,9 +371,10 @@ class PathPlanner:
                     # Try connecting to goal
                     if self._is_collision_free(new_node, goal):
                         # Successfully connected to goal
-                        tree.append(goal)
-                        goal_idx = len(tree) - 1
+                        goal_idx = n
+                        tree[goal_idx] = goal
                         parents[goal_idx] = new_idx
+                        n += 1
                         break
         
         # Reconstruct path if goal was reached
@@ -290,40 +382,63 @@ class PathPlanner:
         if goal_idx is not None:
             # Follow parents backward from goal to start
             current_idx = goal_idx
-            while current_idx is not None:
-                path.append(tree[current_idx])
+            while current_idx >= 0:
+                path.append((float(tree[current_idx, 0]), float(tree[current_idx, 1])))
                 current_idx = parents[current_idx]
             
             # Reverse path to get start-to-goal order
             path.reverse()
-            logger.info(f"RRT planning completed with {len(path)} waypoints")
+            
+            # Drop redundant intermediate nodes
+            path = self._smooth_path(path)
+            logger.info("RRT planning completed with %d waypoints", len(path))
         else:
             logger.warning("RRT failed to reach goal, fallback to direct path")
             path = [start, goal]
         
         return path
     
-    def _find_nearest_node(self, tree: List[Tuple[float, float]], point: Tuple[float, float]) -> int:
+    def _smooth_path(self, path: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """
+        Shortcut a path by skipping waypoints that have a clear line of sight.
+        
+        From each kept waypoint, jumps to the furthest later waypoint that can
+        be reached by a collision-free straight segment.
+        
+        Args:
+            path: List of waypoints from start to goal
+            
+        Returns:
+            Smoothed list of waypoints with the same start and goal
+        """
+        if len(path) <= 2:
+            return path
+        
+        smoothed = [path[0]]
+        i = 0
+        
+        while i < len(path) - 1:
+            j = len(path) - 1
+            while j > i + 1 and not self._is_collision_free(path[i], path[j]):
+                j -= 1
+            smoothed.append(path[j])
+            i = j
+        
+        return smoothed
+    
+    def _find_nearest_node(self, tree: np.ndarray, point: Tuple[float, float]) -> int:
         """
         Find the nearest node in the tree to the given point.
         
         Args:
-            tree: List of nodes in the tree
+            tree: Array of tree nodes with shape (N, 2) as (latitude, longitude)
             point: Target point
             
         Returns:
             Index of the nearest node in the tree
         """
-        min_dist = float('inf')
-        min_idx = 0
-        
-        for i, node in enumerate(tree):
-            dist = calculate_distance(node[0], node[1], point[0], point[1])
-            if dist < min_dist:
-                min_dist = dist
-                min_idx = i
-        
-        return min_idx
+        tree = np.asarray(tree, dtype=np.float64)
+        return int(np.argmin(calculate_distances(point[0], point[1], tree[:, 0], tree[:, 1])))
     
     def _is_collision_free(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
         """
@@ -336,63 +451,51 @@ class PathPlanner:
         Returns:
             True if the segment is collision-free, False otherwise
         """
-        for obs_lat, obs_lon, obs_radius in self.obstacles:
-            if self._line_intersects_circle(start, end, (obs_lat, obs_lon), obs_radius + self.safe_distance):
-                return False
-        
-        return True
+        return not self._segment_hits_any(start, end)
     
-    def _line_intersects_circle(
-        self, 
-        line_start: Tuple[float, float], 
-        line_end: Tuple[float, float],
-        circle_center: Tuple[float, float],
-        circle_radius: float
-    ) -> bool:
+    def _distances_to_obstacles(self, point: Tuple[float, float]) -> np.ndarray:
         """
-        Check if a line segment intersects with a circle.
+        Calculate the distance from a point to every obstacle center.
         
         Args:
-            line_start: Starting point of line segment
-            line_end: Ending point of line segment
-            circle_center: Center of the circle
-            circle_radius: Radius of the circle in meters
+            point: Position as (latitude, longitude)
             
         Returns:
-            True if the line intersects the circle, False otherwise
+            Array of Haversine distances in meters, one per obstacle
+        """
+        return calculate_distances(point[0], point[1], self._obs_lat, self._obs_lon)
+    
+    def _segment_hits_any(self, start: Tuple[float, float], end: Tuple[float, float]) -> bool:
         """
-        # Convert to simpler variable names for readability
-        x1, y1 = line_start
-        x2, y2 = line_end
-        cx, cy = circle_center
-        r = circle_radius
+        Check if a path segment intersects any obstacle's safety circle.
         
-        # Check if either endpoint is inside the circle
-        if calculate_distance(x1, y1, cx, cy) <= r or calculate_distance(x2, y2, cx, cy) <= r:
-            return True
+        Tests the segment against every obstacle at once, with radii
+        inflated by the safe distance, in the local metric frame.
+        
+        Args:
+            start: Starting point of segment
+            end: Ending point of segment
+            
+        Returns:
+            True if the segment intersects at least one obstacle, False otherwise
+        """
+        if not self._obs_r.size:
+            return False
         
-        # Calculate the closest point on the line segment to the circle center
-        # This is a simplified approximation since we're working with geographic coordinates
+        x1, y1 = self._to_m(start[0], start[1])
+        x2, y2 = self._to_m(end[0], end[1])
+        radii = self._obs_r + self.safe_distance
         
-        # Vector from line_start to line_end
         dx = x2 - x1
         dy = y2 - y1
-        
-        # Square of the length of the line segment
         line_length_sq = dx*dx + dy*dy
         
-        # If the line segment has zero length, it's just a point
+        # Project every obstacle center onto the segment (clamped to its endpoints)
         if line_length_sq == 0:
-            return False  # Already checked endpoints above
-        
-        # Calculate the projection of the circle center onto the line
-        t = max(0, min(1, ((cx - x1) * dx + (cy - y1) * dy) / line_length_sq))
-        
-        # Closest point on line segment to circle center
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-        
-        # Check if the closest point is within the circle radius
-        closest_distance = calculate_distance(closest_x, closest_y, cx, cy)
+            t = 0.0
+        else:
+            t = np.clip(((self._obs_x - x1) * dx + (self._obs_y - y1) * dy) / line_length_sq, 0.0, 1.0)
+        ex = x1 + t * dx - self._obs_x
+        ey = y1 + t * dy - self._obs_y
         
-        return closest_distance <= r
+        return bool(np.any(ex*ex + ey*ey <= radii * radii))
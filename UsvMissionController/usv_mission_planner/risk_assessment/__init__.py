@@ -7,11 +7,11 @@ USV missions, including environmental, collision, and operational risks.
 
 # Using relative imports for the internal modules
 from .risk_analyzer import RiskAnalyzer, RiskLevel, RiskFactor
-from .environmental_risks import EnvironmentalRiskAssessor
+from .environmental_risks import EnvironmentalRiskAssessor, EnvConditions
 from .collision_risks import CollisionRiskAssessor
 from .operational_risks import OperationalRiskAssessor
 
 __all__ = [
     'RiskAnalyzer', 'RiskLevel', 'RiskFactor',
-    'EnvironmentalRiskAssessor', 'CollisionRiskAssessor', 'OperationalRiskAssessor'
+    'EnvironmentalRiskAssessor', 'EnvConditions', 'CollisionRiskAssessor', 'OperationalRiskAssessor'
 ]
\ No newline at end of file
@@ -5,14 +5,249 @@ This module evaluates collision risks such as obstacles, shipping lanes,
 and proximity to shore or restricted areas.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 import math
+import numpy as np
 from utils.logger import get_logger
-from utils.geo_utils import calculate_distance
 from risk_assessment.risk_analyzer import RiskFactor, RiskLevel
+from risk_assessment.risk_kernels import (
+    project_local,
+    min_point_segment_dist,
+    segment_min_distances,
+    build_disk_index,
+    build_segment_index,
+    nearest_disk_clearance,
+    point_disk_clearances,
+    count_path_crossings
+)
 
 logger = get_logger(__name__)
 
+# Maximum number of prepared environments kept by each assessor
+_ENV_CACHE_SIZE = 8
+
+# Environment keys holding geometry that is prepared once per environment
+_GEOMETRY_KEYS = ('obstacles', 'shipping_lanes', 'shorelines', 'restricted_areas')
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    """Mark an array read-only so it can be shared safely."""
+    array.setflags(write=False)
+    return array
+
+# Default waypoints for San Francisco Bay if none provided
+_DEFAULT_WAYPOINTS = _frozen(np.array([
+    (37.7749, -122.4194),  # San Francisco
+    (37.8045, -122.4159),  # Golden Gate Bridge
+    (37.8265, -122.3806),  # Alcatraz
+    (37.8155, -122.3440),  # Berkeley
+    (37.7955, -122.3828)   # Bay Area
+]))
+
+# Default set of obstacles in San Francisco Bay as (lat, lon, radius km)
+_DEFAULT_OBSTACLES = _frozen(np.array([
+    (37.8270, -122.3770, 0.20),  # Obstacle near Alcatraz
+    (37.8100, -122.4000, 0.15),  # Obstacle in the bay
+    (37.7900, -122.3900, 0.10)   # Another obstacle
+]))
+
+# Default shipping lane in San Francisco Bay
+_DEFAULT_SHIPPING_LANES = (
+    {
+        'name': 'SF Bay Main Channel',
+        'points': (
+            (37.8090, -122.4410),  # Start near Golden Gate
+            (37.8230, -122.3850),  # Middle of Bay near Alcatraz
+            (37.7930, -122.3560)   # East Bay
+        ),
+        'width': 1.0  # km
+    },
+)
+
+# Simplified shoreline segments for San Francisco Bay
+_DEFAULT_SHORELINES = (
+    # San Francisco shoreline segment
+    (
+        (37.7580, -122.4150),
+        (37.7800, -122.4250),
+        (37.8000, -122.4400),
+        (37.8080, -122.4490)
+    ),
+    # Alcatraz Island
+    (
+        (37.8262, -122.4228),
+        (37.8271, -122.4223),
+        (37.8279, -122.4227),
+        (37.8276, -122.4236),
+        (37.8267, -122.4238),
+        (37.8262, -122.4228)
+    )
+)
+
+# Default restricted areas in San Francisco Bay
+_DEFAULT_RESTRICTED_AREAS = (
+    {
+        'name': 'Naval Restricted Zone',
+        'center': (37.7985, -122.3718),
+        'radius': 1.0  # km
+    },
+    {
+        'name': 'Protected Marine Area',
+        'center': (37.8290, -122.4020),
+        'radius': 0.5  # km
+    }
+)
+
+# Number of threads used by an assessor created with parallel=True
+_PARALLEL_WORKERS = 4
+
+# Risk level tables as (upper distance bound in meters, level, description,
+# mitigation) rows; the first row whose bound exceeds the distance applies
+_OBSTACLE_LEVELS = (
+    (0, RiskLevel.CRITICAL, "Mission path intersects with an obstacle.",
+     "Reroute mission path to avoid obstacle."),
+    (50, RiskLevel.HIGH, "Mission path passes extremely close to an obstacle.",
+     "Increase clearance from obstacle or add waypoints for safer navigation."),
+    (200, RiskLevel.MEDIUM, "Mission path passes close to an obstacle.",
+     "Monitor obstacle during mission execution and be prepared to adjust course."),
+    (math.inf, RiskLevel.LOW, "Mission path maintains safe distance from all obstacles.",
+     "Standard obstacle avoidance procedures are sufficient.")
+)
+
+_LANE_LEVELS = (
+    (100, RiskLevel.MEDIUM, "Mission path passes very close to a shipping lane.",
+     "Monitor marine traffic and be prepared to give way."),
+    (500, RiskLevel.LOW, "Mission path passes near a shipping lane.",
+     "Standard traffic monitoring procedures are sufficient."),
+    (math.inf, RiskLevel.LOW, "Mission path maintains safe distance from all shipping lanes.",
+     "Normal traffic awareness procedures are sufficient.")
+)
+
+_LANE_CROSSING = (RiskLevel.HIGH, "Mission path crosses {} shipping lane(s).",
+                  "Plan crossing perpendicular to lane direction and monitor marine traffic.")
+
+_SHORE_LEVELS = (
+    (25, RiskLevel.CRITICAL, "Mission path passes dangerously close to shore.",
+     "Reroute to maintain safe distance from shore."),
+    (100, RiskLevel.HIGH, "Mission path passes very close to shore.",
+     "Adjust waypoints to increase clearance from shore."),
+    (250, RiskLevel.MEDIUM, "Mission path passes near shore.",
+     "Monitor position carefully when near shore."),
+    (math.inf, RiskLevel.LOW, "Mission path maintains safe distance from shore.",
+     "Standard navigation procedures are sufficient.")
+)
+
+_RESTRICTED_LEVELS = (
+    (100, RiskLevel.HIGH, "Mission path passes very close to a restricted area.",
+     "Adjust waypoints to increase clearance from restricted area."),
+    (500, RiskLevel.MEDIUM, "Mission path passes near a restricted area.",
+     "Monitor position carefully when near restricted area."),
+    (math.inf, RiskLevel.LOW, "Mission path maintains safe distance from all restricted areas.",
+     "Standard navigation procedures are sufficient.")
+)
+
+_RESTRICTED_INSIDE = (RiskLevel.CRITICAL, "Mission path enters restricted area(s): {}.",
+                      "Reroute mission to avoid all restricted areas.")
+
+# Traffic density classifications as (level, description, mitigation)
+_TRAFFIC_LEVELS = {
+    'low': (RiskLevel.LOW, "Low vessel traffic density in the operational area.",
+            "Standard collision avoidance procedures are sufficient."),
+    'medium': (RiskLevel.MEDIUM, "Medium vessel traffic density in the operational area.",
+               "Maintain vigilant watch and be prepared to adjust course frequently."),
+    'high': (RiskLevel.HIGH, "High vessel traffic density in the operational area.",
+             "Consider rescheduling mission during lower traffic periods.")
+}
+
+_TRAFFIC_UNKNOWN = (RiskLevel.MEDIUM, "Unknown traffic density, assuming medium risk.",
+                    "Maintain vigilant watch and be prepared to adjust course.")
+
+def _classify(distance: float, levels: Tuple[Tuple[float, RiskLevel, str, str], ...]) -> Tuple[RiskLevel, str, str]:
+    """
+    Look up the risk level, description and mitigation for a distance.
+    
+    Args:
+        distance: Distance in meters
+        levels: Risk level table ordered by increasing distance bound
+        
+    Returns:
+        Tuple of (level, description, mitigation)
+    """
+    for bound, level, desc, mitigation in levels:
+        if distance < bound:
+            return level, desc, mitigation
+    return levels[-1][1:]
+
+def _distance_text(template: str, distance: float) -> str:
+    """Format a distance sentence, or nothing if the distance is not finite."""
+    return template.format(distance) if math.isfinite(distance) else ""
+
+@dataclass
+class PreparedEnvironment:
+    """
+    Environment geometry projected into a local metric frame.
+    
+    Attributes:
+        lat0: Latitude of the local frame origin in degrees
+        lon0: Longitude of the local frame origin in degrees
+        obstacles: Obstacles as an array of shape (N, 3) with (lat, lon, radius)
+            in degrees and km
+        obstacles_xyr: Obstacle centers and radii in meters, shape (N, 3)
+        obstacle_index: Spatial index over the obstacle centers, if built
+        shipping_lanes: Shipping lanes as given
+        lane_segments_ab: Segments of all shipping lanes, shape (S, 4) with
+            (ax, ay, bx, by) in meters
+        lane_ids: Index of the shipping lane each segment belongs to, shape (S,)
+        lane_half_widths: Half width of each shipping lane in meters, shape (L,)
+        shore_segments_ab: Shoreline segments of shape (M, 4) with
+            (ax, ay, bx, by) in meters
+        shore_index: Spatial index over the shoreline segments, if built
+        restricted_areas: Restricted areas as given
+        restricted_xyr: Restricted area centers and radii in meters, shape (K, 3)
+    """
+    lat0: float
+    lon0: float
+    obstacles: np.ndarray
+    obstacles_xyr: np.ndarray
+    obstacle_index: Optional[Any]
+    shipping_lanes: Sequence[Dict[str, Any]]
+    lane_segments_ab: np.ndarray
+    lane_ids: np.ndarray
+    lane_half_widths: np.ndarray
+    shore_segments_ab: np.ndarray
+    shore_index: Optional[Any]
+    restricted_areas: Sequence[Dict[str, Any]]
+    restricted_xyr: np.ndarray
+
+def _polyline_segments(points: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split a polyline into segment start and end point arrays.
+    
+    Args:
+        points: Sequence of (lat, lon) points
+        
+    Returns:
+        Tuple of (starts, ends) arrays of shape (S, 2)
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return pts[:-1], pts[1:]
+
+def _project_segments(a: np.ndarray, b: np.ndarray, lat0: float, lon0: float) -> np.ndarray:
+    """
+    Project segment end points into a local frame as a single array.
+    
+    Args:
+        a: Segment start points of shape (S, 2) with (lat, lon) in degrees
+        b: Segment end points of shape (S, 2) with (lat, lon) in degrees
+        lat0: Origin latitude in degrees
+        lon0: Origin longitude in degrees
+        
+    Returns:
+        Array of shape (S, 4) with (ax, ay, bx, by) in meters
+    """
+    return np.hstack([project_local(a, lat0, lon0), project_local(b, lat0, lon0)])
+
 class CollisionRiskAssessor:
     """
     Assesses collision risks for USV missions.
@@ -25,10 +260,39 @@ class CollisionRiskAssessor:
     - Traffic density
     """
     
-    def __init__(self):
-        """Initialize the collision risk assessor."""
+    def __init__(self, parallel: bool = False):
+        """
+        Initialize the collision risk assessor.
+        
+        Args:
+            parallel: Run the individual risk assessments concurrently on a
+                thread pool. Only worthwhile for large environments, where the
+                geometry kernels (which release the GIL) dominate. Call
+                close, or use the assessor as a context manager, to release
+                the threads.
+        """
+        # Prepared geometry keyed by id() of the environment data, stored
+        # with the environment and its geometry lists to validate hits
+        self._env_cache: Dict[int, Tuple[Any, Tuple[Any, ...], PreparedEnvironment]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=_PARALLEL_WORKERS) if parallel else None
         logger.info("Collision risk assessor initialized")
     
+    def close(self) -> None:
+        """
+        Shut down the thread pool of a parallel assessor.
+        
+        The assessor stays usable and runs later assessments serially.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self) -> 'CollisionRiskAssessor':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def assess_risks(
         self, 
         mission_data: Dict[str, Any],
@@ -44,42 +308,35 @@ class CollisionRiskAssessor:
         Returns:
             List of collision risk factors
         """
-        risk_factors = []
-        
         # Extract waypoints from mission data
         waypoints = self._extract_waypoints(mission_data)
         
-        # Get obstacle data (static or from environment data)
-        obstacles = self._get_obstacles(environment_data)
-        
-        # Assess risks related to static obstacles
-        obstacle_risk = self._assess_obstacle_risk(waypoints, obstacles)
-        risk_factors.append(obstacle_risk)
-        
-        # Assess proximity to shipping lanes
-        shipping_lanes = self._get_shipping_lanes(environment_data)
-        shipping_risk = self._assess_shipping_lane_risk(waypoints, shipping_lanes)
-        risk_factors.append(shipping_risk)
-        
-        # Assess proximity to shore
-        shorelines = self._get_shorelines(environment_data)
-        shore_risk = self._assess_shore_proximity_risk(waypoints, shorelines)
-        risk_factors.append(shore_risk)
-        
-        # Assess restricted areas
-        restricted_areas = self._get_restricted_areas(environment_data)
-        restricted_risk = self._assess_restricted_area_risk(waypoints, restricted_areas)
-        risk_factors.append(restricted_risk)
-        
-        # Assess traffic density
+        # Get environment geometry (static or from environment data) and
+        # project the waypoints into its local frame
+        env = self._prepare_environment(environment_data)
+        wp_xy = project_local(waypoints, env.lat0, env.lon0)
         traffic_density = environment_data.get('traffic_density', 'low') if environment_data else 'low'
-        traffic_risk = self._assess_traffic_density_risk(traffic_density)
-        risk_factors.append(traffic_risk)
+        
+        # Assess risks related to static obstacles, proximity to shipping
+        # lanes and shore, restricted areas and traffic density
+        assessments = [
+            (self._assess_obstacle_risk, wp_xy, env),
+            (self._assess_shipping_lane_risk, wp_xy, env),
+            (self._assess_shore_proximity_risk, wp_xy, env),
+            (self._assess_restricted_area_risk, wp_xy, env),
+            (self._assess_traffic_density_risk, traffic_density)
+        ]
+        
+        if self._executor is not None:
+            futures = [self._executor.submit(*assessment) for assessment in assessments]
+            risk_factors = [future.result() for future in futures]
+        else:
+            risk_factors = [assess(*args) for assess, *args in assessments]
         
         logger.info(f"Completed collision risk assessment with {len(risk_factors)} factors")
         return risk_factors
     
-    def _extract_waypoints(self, mission_data: Dict[str, Any]) -> List[Tuple[float, float]]:
+    def _extract_waypoints(self, mission_data: Dict[str, Any]) -> np.ndarray:
         """
         Extract waypoints from mission data.
         
@@ -87,7 +344,7 @@ class CollisionRiskAssessor:
             mission_data: Mission configuration and waypoints
             
         Returns:
-            List of waypoints as (lat, lon) tuples
+            Array of shape (N, 2) with waypoint (lat, lon) in degrees
         """
         waypoints = []
         
@@ -100,24 +357,19 @@ class CollisionRiskAssessor:
             waypoints = mission_data['path']
         
         # For a complex mission with multiple segments
-        if not waypoints and 'segments' in mission_data:
+        if not len(waypoints) and 'segments' in mission_data:
+            waypoints = []
             for segment in mission_data['segments']:
                 if 'waypoints' in segment:
                     waypoints.extend(segment['waypoints'])
         
         # Default waypoint for San Francisco Bay if none provided
-        if not waypoints:
-            waypoints = [
-                (37.7749, -122.4194),  # San Francisco
-                (37.8045, -122.4159),  # Golden Gate Bridge
-                (37.8265, -122.3806),  # Alcatraz
-                (37.8155, -122.3440),  # Berkeley
-                (37.7955, -122.3828)   # Bay Area
-            ]
-        
-        return waypoints
+        if not len(waypoints):
+            return _DEFAULT_WAYPOINTS
+        
+        return np.asarray(waypoints, dtype=np.float64).reshape(-1, 2)
     
-    def _get_obstacles(self, environment_data: Optional[Dict[str, Any]]) -> List[Tuple[float, float, float]]:
+    def _get_obstacles(self, environment_data: Optional[Dict[str, Any]]) -> np.ndarray:
         """
         Get obstacles from environment data.
         
@@ -125,19 +377,14 @@ class CollisionRiskAssessor:
             environment_data: Environmental data including obstacles
             
         Returns:
-            List of obstacles as (lat, lon, radius) tuples
+            Array of shape (N, 3) with obstacle (lat, lon, radius) in degrees and km
         """
         if not environment_data or 'obstacles' not in environment_data:
-            # Default set of obstacles in San Francisco Bay
-            return [
-                (37.8270, -122.3770, 0.20),  # Obstacle near Alcatraz
-                (37.8100, -122.4000, 0.15),  # Obstacle in the bay
-                (37.7900, -122.3900, 0.10)   # Another obstacle
-            ]
-        
-        return environment_data['obstacles']
+            return _DEFAULT_OBSTACLES
+        
+        return np.asarray(environment_data['obstacles'], dtype=np.float64).reshape(-1, 3)
     
-    def _get_shipping_lanes(self, environment_data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _get_shipping_lanes(self, environment_data: Optional[Dict[str, Any]]) -> Sequence[Dict[str, Any]]:
         """
         Get shipping lanes from environment data.
         
@@ -148,22 +395,11 @@ class CollisionRiskAssessor:
             List of shipping lanes
         """
         if not environment_data or 'shipping_lanes' not in environment_data:
-            # Default shipping lane in San Francisco Bay
-            return [
-                {
-                    'name': 'SF Bay Main Channel',
-                    'points': [
-                        (37.8090, -122.4410),  # Start near Golden Gate
-                        (37.8230, -122.3850),  # Middle of Bay near Alcatraz
-                        (37.7930, -122.3560)   # East Bay
-                    ],
-                    'width': 1.0  # km
-                }
-            ]
+            return _DEFAULT_SHIPPING_LANES
         
         return environment_data['shipping_lanes']
     
-    def _get_shorelines(self, environment_data: Optional[Dict[str, Any]]) -> List[List[Tuple[float, float]]]:
+    def _get_shorelines(self, environment_data: Optional[Dict[str, Any]]) -> Sequence[Sequence[Tuple[float, float]]]:
         """
         Get shorelines from environment data.
         
@@ -174,29 +410,11 @@ class CollisionRiskAssessor:
             List of shoreline coordinates
         """
         if not environment_data or 'shorelines' not in environment_data:
-            # Simplified shoreline segments for San Francisco Bay
-            return [
-                # San Francisco shoreline segment
-                [
-                    (37.7580, -122.4150),
-                    (37.7800, -122.4250),
-                    (37.8000, -122.4400),
-                    (37.8080, -122.4490)
-                ],
-                # Alcatraz Island
-                [
-                    (37.8262, -122.4228),
-                    (37.8271, -122.4223),
-                    (37.8279, -122.4227),
-                    (37.8276, -122.4236),
-                    (37.8267, -122.4238),
-                    (37.8262, -122.4228)
-                ]
-            ]
+            return _DEFAULT_SHORELINES
         
         return environment_data['shorelines']
     
-    def _get_restricted_areas(self, environment_data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _get_restricted_areas(self, environment_data: Optional[Dict[str, Any]]) -> Sequence[Dict[str, Any]]:
         """
         Get restricted areas from environment data.
         
@@ -207,38 +425,95 @@ class CollisionRiskAssessor:
             List of restricted areas
         """
         if not environment_data or 'restricted_areas' not in environment_data:
-            # Default restricted areas in San Francisco Bay
-            return [
-                {
-                    'name': 'Naval Restricted Zone',
-                    'center': (37.7985, -122.3718),
-                    'radius': 1.0  # km
-                },
-                {
-                    'name': 'Protected Marine Area',
-                    'center': (37.8290, -122.4020),
-                    'radius': 0.5  # km
-                }
-            ]
+            return _DEFAULT_RESTRICTED_AREAS
         
         return environment_data['restricted_areas']
     
+    def _prepare_environment(self, environment_data: Optional[Dict[str, Any]]) -> PreparedEnvironment:
+        """
+        Get the environment geometry as arrays in a local metric frame.
+        
+        The prepared geometry is cached per environment, so repeated
+        assessments against the same environment only project the waypoints.
+        Entries are invalidated when a geometry list is replaced; lists that
+        are modified in place must be replaced to be picked up.
+        
+        Args:
+            environment_data: Environmental data including obstacles, shipping
+                lanes, shorelines and restricted areas
+                
+        Returns:
+            Prepared environment geometry
+        """
+        key = id(environment_data)
+        sources = tuple(environment_data.get(k) for k in _GEOMETRY_KEYS) if environment_data else ()
+        
+        cached = self._env_cache.get(key)
+        if (cached is not None and cached[0] is environment_data and
+                len(cached[1]) == len(sources) and
+                all(a is b for a, b in zip(cached[1], sources))):
+            return cached[2]
+        
+        obstacles = self._get_obstacles(environment_data)
+        shipping_lanes = self._get_shipping_lanes(environment_data)
+        shorelines = self._get_shorelines(environment_data)
+        restricted_areas = self._get_restricted_areas(environment_data)
+        
+        lanes = [_polyline_segments(lane['points']) for lane in shipping_lanes]
+        lane_a = np.concatenate([a for a, _ in lanes]) if lanes else np.empty((0, 2))
+        lane_b = np.concatenate([b for _, b in lanes]) if lanes else np.empty((0, 2))
+        lane_ids = np.repeat(np.arange(len(lanes)), [len(a) for a, _ in lanes])
+        shores = [_polyline_segments(shoreline) for shoreline in shorelines]
+        shore_a = np.concatenate([a for a, _ in shores]) if shores else np.empty((0, 2))
+        shore_b = np.concatenate([b for _, b in shores]) if shores else np.empty((0, 2))
+        centers = np.array([area['center'] for area in restricted_areas], dtype=np.float64).reshape(-1, 2)
+        radii = np.array([area['radius'] for area in restricted_areas], dtype=np.float64)
+        
+        # Center the local frame on the environment geometry
+        all_points = np.concatenate([obstacles[:, :2], lane_a, lane_b, shore_a, shore_b, centers])
+        lat0, lon0 = all_points.mean(axis=0) if len(all_points) else (0.0, 0.0)
+        
+        obstacles_xyr = np.column_stack([project_local(obstacles[:, :2], lat0, lon0), obstacles[:, 2] * 1000])
+        shore_segments_ab = _project_segments(shore_a, shore_b, lat0, lon0)
+        
+        env = PreparedEnvironment(
+            lat0=float(lat0),
+            lon0=float(lon0),
+            obstacles=obstacles,
+            obstacles_xyr=obstacles_xyr,
+            obstacle_index=build_disk_index(obstacles_xyr[:, :2]),
+            shipping_lanes=shipping_lanes,
+            lane_segments_ab=_project_segments(lane_a, lane_b, lat0, lon0),
+            lane_ids=lane_ids,
+            lane_half_widths=np.array([lane['width'] * 500 for lane in shipping_lanes], dtype=np.float64),
+            shore_segments_ab=shore_segments_ab,
+            shore_index=build_segment_index(shore_segments_ab[:, :2], shore_segments_ab[:, 2:]),
+            restricted_areas=restricted_areas,
+            restricted_xyr=np.column_stack([project_local(centers, lat0, lon0), radii * 1000])
+        )
+        
+        self._env_cache.pop(key, None)
+        if len(self._env_cache) >= _ENV_CACHE_SIZE:
+            self._env_cache.pop(next(iter(self._env_cache)))
+        self._env_cache[key] = (environment_data, sources, env)
+        return env
+    
     def _assess_obstacle_risk(
         self, 
-        waypoints: List[Tuple[float, float]],
-        obstacles: List[Tuple[float, float, float]]
+        wp_xy: np.ndarray,
+        env: PreparedEnvironment
     ) -> RiskFactor:
         """
         Assess risk from obstacles along the mission path.
         
         Args:
-            waypoints: List of mission waypoints
-            obstacles: List of obstacles as (lat, lon, radius) tuples
+            wp_xy: Mission waypoints in the environment's local frame, shape (N, 2)
+            env: Prepared environment geometry
             
         Returns:
             Obstacle risk factor
         """
-        if not obstacles:
+        if not len(env.obstacles):
             return RiskFactor(
                 name="Obstacle Collision",
                 category="Collision",
@@ -248,48 +523,16 @@ class CollisionRiskAssessor:
                 weight=1.0
             )
         
-        # Calculate minimum distance to any obstacle from any path segment
-        min_distance = float('inf')
+        # Find the obstacle with the minimum clearance (distance to its edge)
+        # from the mission path, in meters
         closest_obstacle = None
-        
-        for i in range(len(waypoints) - 1):
-            start = waypoints[i]
-            end = waypoints[i + 1]
-            
-            for obstacle in obstacles:
-                obs_lat, obs_lon, obs_radius = obstacle
-                
-                # Convert radius from km to meters for comparison
-                obs_radius_m = obs_radius * 1000
-                
-                # Check distance from path segment to obstacle
-                distance = self._point_to_line_segment_distance(
-                    (obs_lat, obs_lon), start, end)
-                
-                # Convert to meters for comparison
-                distance_m = distance * 1000
-                
-                if distance_m - obs_radius_m < min_distance:
-                    min_distance = distance_m - obs_radius_m
-                    closest_obstacle = obstacle
+        obs = env.obstacles_xyr
+        min_distance, idx = nearest_disk_clearance(wp_xy, obs[:, :2], obs[:, 2], env.obstacle_index)
+        if idx >= 0:
+            closest_obstacle = tuple(env.obstacles[idx].tolist())
         
         # Assess risk based on minimum distance
-        if min_distance < 0:  # Path intersects obstacle
-            level = RiskLevel.CRITICAL
-            desc = "Mission path intersects with an obstacle."
-            mitigation = "Reroute mission path to avoid obstacle."
-        elif min_distance < 50:
-            level = RiskLevel.HIGH
-            desc = "Mission path passes extremely close to an obstacle."
-            mitigation = "Increase clearance from obstacle or add waypoints for safer navigation."
-        elif min_distance < 200:
-            level = RiskLevel.MEDIUM
-            desc = "Mission path passes close to an obstacle."
-            mitigation = "Monitor obstacle during mission execution and be prepared to adjust course."
-        else:
-            level = RiskLevel.LOW
-            desc = "Mission path maintains safe distance from all obstacles."
-            mitigation = "Standard obstacle avoidance procedures are sufficient."
+        level, desc, mitigation = _classify(min_distance, _OBSTACLE_LEVELS)
         
         obstacle_info = ""
         if closest_obstacle:
@@ -300,27 +543,27 @@ class CollisionRiskAssessor:
             name="Obstacle Collision",
             category="Collision",
             level=level,
-            description=desc + f" Minimum clearance: {max(0, min_distance):.1f}m." + obstacle_info,
+            description=desc + _distance_text(" Minimum clearance: {:.1f}m.", max(0, min_distance)) + obstacle_info,
             mitigation=mitigation,
             weight=1.0
         )
     
     def _assess_shipping_lane_risk(
         self, 
-        waypoints: List[Tuple[float, float]],
-        shipping_lanes: List[Dict[str, Any]]
+        wp_xy: np.ndarray,
+        env: PreparedEnvironment
     ) -> RiskFactor:
         """
         Assess risk from proximity to shipping lanes.
         
         Args:
-            waypoints: List of mission waypoints
-            shipping_lanes: List of shipping lanes
+            wp_xy: Mission waypoints in the environment's local frame, shape (N, 2)
+            env: Prepared environment geometry
             
         Returns:
             Shipping lane risk factor
         """
-        if not shipping_lanes:
+        if not env.shipping_lanes:
             return RiskFactor(
                 name="Shipping Lane Proximity",
                 category="Collision",
@@ -335,58 +578,44 @@ class CollisionRiskAssessor:
         crossing_lanes = 0
         closest_lane = None
         
-        for i in range(len(waypoints) - 1):
-            path_segment = (waypoints[i], waypoints[i + 1])
+        if len(wp_xy) > 1:
+            lane_ab = env.lane_segments_ab
             
-            for lane in shipping_lanes:
-                lane_points = lane['points']
-                lane_width = lane['width']  # in km
+            # Count path segments crossing each lane
+            crossings = count_path_crossings(
+                wp_xy, lane_ab[:, :2], lane_ab[:, 2:], env.lane_ids, len(env.shipping_lanes))
+            crossing_lanes = int(crossings.sum())
+            
+            if crossing_lanes:
+                min_distance = 0
                 
-                # Check if path crosses this lane
-                for j in range(len(lane_points) - 1):
-                    lane_segment = (lane_points[j], lane_points[j + 1])
-                    
-                    if self._line_segments_intersect(path_segment, lane_segment):
-                        crossing_lanes += 1
-                        min_distance = 0
-                        closest_lane = lane
+                # Report the last lane crossed along the path: the highest
+                # index lane crossed by the last path segment crossing any
+                for i in range(len(wp_xy) - 2, -1, -1):
+                    segment_crossings = count_path_crossings(
+                        wp_xy[i:i + 2], lane_ab[:, :2], lane_ab[:, 2:], env.lane_ids, len(env.shipping_lanes))
+                    if segment_crossings.any():
+                        closest_lane = env.shipping_lanes[int(np.flatnonzero(segment_crossings)[-1])]
                         break
+            else:
+                # Find minimum distance to each lane edge (half the lane width
+                # on each side), measuring all lane segments in one pass
+                lane_dist = np.full(len(env.shipping_lanes), np.inf)
+                np.minimum.at(lane_dist, env.lane_ids,
+                              segment_min_distances(wp_xy, lane_ab[:, :2], lane_ab[:, 2:]))
+                lane_dist -= env.lane_half_widths
                 
-                if min_distance == 0:
-                    continue
-                
-                # If not crossing, find minimum distance to lane
-                for j in range(len(lane_points) - 1):
-                    lane_segment = (lane_points[j], lane_points[j + 1])
-                    
-                    # Calculate minimum distance between path and lane segment
-                    for wp in waypoints:
-                        dist = self._point_to_line_segment_distance(wp, lane_segment[0], lane_segment[1])
-                        
-                        # Convert to meters and account for lane width
-                        dist_m = (dist * 1000) - (lane_width * 500)  # Half width on each side
-                        
-                        if dist_m < min_distance:
-                            min_distance = dist_m
-                            closest_lane = lane
+                idx = int(np.argmin(lane_dist))
+                if np.isfinite(lane_dist[idx]):
+                    min_distance = float(lane_dist[idx])
+                    closest_lane = env.shipping_lanes[idx]
         
         # Assess risk based on crossing and minimum distance
         if crossing_lanes > 0:
-            level = RiskLevel.HIGH
-            desc = f"Mission path crosses {crossing_lanes} shipping lane(s)."
-            mitigation = "Plan crossing perpendicular to lane direction and monitor marine traffic."
-        elif min_distance < 100:
-            level = RiskLevel.MEDIUM
-            desc = "Mission path passes very close to a shipping lane."
-            mitigation = "Monitor marine traffic and be prepared to give way."
-        elif min_distance < 500:
-            level = RiskLevel.LOW
-            desc = "Mission path passes near a shipping lane."
-            mitigation = "Standard traffic monitoring procedures are sufficient."
+            level, desc, mitigation = _LANE_CROSSING
+            desc = desc.format(crossing_lanes)
         else:
-            level = RiskLevel.LOW
-            desc = "Mission path maintains safe distance from all shipping lanes."
-            mitigation = "Normal traffic awareness procedures are sufficient."
+            level, desc, mitigation = _classify(min_distance, _LANE_LEVELS)
         
         lane_info = ""
         if closest_lane:
@@ -396,27 +625,27 @@ class CollisionRiskAssessor:
             name="Shipping Lane Proximity",
             category="Collision",
             level=level,
-            description=desc + f" Minimum distance: {max(0, min_distance):.1f}m." + lane_info,
+            description=desc + _distance_text(" Minimum distance: {:.1f}m.", max(0, min_distance)) + lane_info,
             mitigation=mitigation,
             weight=0.9
         )
     
     def _assess_shore_proximity_risk(
         self, 
-        waypoints: List[Tuple[float, float]],
-        shorelines: List[List[Tuple[float, float]]]
+        wp_xy: np.ndarray,
+        env: PreparedEnvironment
     ) -> RiskFactor:
         """
         Assess risk from proximity to shore.
         
         Args:
-            waypoints: List of mission waypoints
-            shorelines: List of shoreline coordinate lists
+            wp_xy: Mission waypoints in the environment's local frame, shape (N, 2)
+            env: Prepared environment geometry
             
         Returns:
             Shore proximity risk factor
         """
-        if not shorelines:
+        if not len(env.shore_segments_ab):
             return RiskFactor(
                 name="Shore Proximity",
                 category="Collision",
@@ -426,66 +655,39 @@ class CollisionRiskAssessor:
                 weight=0.8
             )
         
-        # Calculate minimum distance to any shoreline from any waypoint
-        min_distance = float('inf')
-        
-        for waypoint in waypoints:
-            for shoreline in shorelines:
-                for i in range(len(shoreline) - 1):
-                    shore_segment = (shoreline[i], shoreline[i + 1])
-                    
-                    dist = self._point_to_line_segment_distance(
-                        waypoint, shore_segment[0], shore_segment[1])
-                    
-                    # Convert to meters
-                    dist_m = dist * 1000
-                    
-                    if dist_m < min_distance:
-                        min_distance = dist_m
+        # Calculate minimum distance to any shoreline from any waypoint,
+        # for all waypoint/segment pairs at once in a local metric frame
+        shore_ab = env.shore_segments_ab
+        min_distance = min_point_segment_dist(wp_xy, shore_ab[:, :2], shore_ab[:, 2:], env.shore_index)
         
         # Assess risk based on minimum distance to shore
-        if min_distance < 25:
-            level = RiskLevel.CRITICAL
-            desc = "Mission path passes dangerously close to shore."
-            mitigation = "Reroute to maintain safe distance from shore."
-        elif min_distance < 100:
-            level = RiskLevel.HIGH
-            desc = "Mission path passes very close to shore."
-            mitigation = "Adjust waypoints to increase clearance from shore."
-        elif min_distance < 250:
-            level = RiskLevel.MEDIUM
-            desc = "Mission path passes near shore."
-            mitigation = "Monitor position carefully when near shore."
-        else:
-            level = RiskLevel.LOW
-            desc = "Mission path maintains safe distance from shore."
-            mitigation = "Standard navigation procedures are sufficient."
+        level, desc, mitigation = _classify(min_distance, _SHORE_LEVELS)
         
         return RiskFactor(
             name="Shore Proximity",
             category="Collision",
             level=level,
-            description=desc + f" Minimum distance to shore: {min_distance:.1f}m.",
+            description=desc + _distance_text(" Minimum distance to shore: {:.1f}m.", min_distance),
             mitigation=mitigation,
             weight=0.8
         )
     
     def _assess_restricted_area_risk(
         self, 
-        waypoints: List[Tuple[float, float]],
-        restricted_areas: List[Dict[str, Any]]
+        wp_xy: np.ndarray,
+        env: PreparedEnvironment
     ) -> RiskFactor:
         """
         Assess risk from proximity to restricted areas.
         
         Args:
-            waypoints: List of mission waypoints
-            restricted_areas: List of restricted areas
+            wp_xy: Mission waypoints in the environment's local frame, shape (N, 2)
+            env: Prepared environment geometry
             
         Returns:
             Restricted area risk factor
         """
-        if not restricted_areas:
+        if not env.restricted_areas:
             return RiskFactor(
                 name="Restricted Areas",
                 category="Collision",
@@ -495,48 +697,27 @@ class CollisionRiskAssessor:
                 weight=0.7
             )
         
-        # Check if any waypoint is inside a restricted area
+        # Calculate the clearance of every restricted area from the waypoints;
+        # a negative clearance means a waypoint is inside the area
         inside_areas = []
-        min_distance = float('inf')
+        min_distance_m = float('inf')
         closest_area = None
         
-        for waypoint in waypoints:
-            for area in restricted_areas:
-                center = area['center']
-                radius = area['radius']  # in km
-                
-                # Calculate distance to area center
-                dist = calculate_distance(
-                    waypoint[0], waypoint[1], center[0], center[1]) / 1000  # convert to km
-                
-                if dist < radius:
-                    # Waypoint is inside restricted area
-                    inside_areas.append(area['name'])
-                elif dist - radius < min_distance:
-                    min_distance = dist - radius
-                    closest_area = area
-        
-        # Convert min_distance back to meters for display
-        min_distance_m = min_distance * 1000
+        if len(wp_xy):
+            areas = env.restricted_xyr
+            clearances = point_disk_clearances(wp_xy, areas[:, :2], areas[:, 2])
+            
+            inside_areas = [area['name'] for area, c in zip(env.restricted_areas, clearances) if c < 0]
+            idx = int(np.argmin(clearances))
+            min_distance_m = float(clearances[idx])
+            closest_area = env.restricted_areas[idx]
         
         # Assess risk based on inside areas and minimum distance
         if inside_areas:
-            level = RiskLevel.CRITICAL
-            areas_str = ", ".join(inside_areas)
-            desc = f"Mission path enters restricted area(s): {areas_str}."
-            mitigation = "Reroute mission to avoid all restricted areas."
-        elif min_distance_m < 100:
-            level = RiskLevel.HIGH
-            desc = "Mission path passes very close to a restricted area."
-            mitigation = "Adjust waypoints to increase clearance from restricted area."
-        elif min_distance_m < 500:
-            level = RiskLevel.MEDIUM
-            desc = "Mission path passes near a restricted area."
-            mitigation = "Monitor position carefully when near restricted area."
+            level, desc, mitigation = _RESTRICTED_INSIDE
+            desc = desc.format(", ".join(inside_areas))
         else:
-            level = RiskLevel.LOW
-            desc = "Mission path maintains safe distance from all restricted areas."
-            mitigation = "Standard navigation procedures are sufficient."
+            level, desc, mitigation = _classify(min_distance_m, _RESTRICTED_LEVELS)
         
         area_info = ""
         if closest_area and not inside_areas:
@@ -546,7 +727,7 @@ class CollisionRiskAssessor:
             name="Restricted Areas",
             category="Collision",
             level=level,
-            description=desc + f" Minimum distance: {max(0, min_distance_m):.1f}m." + area_info,
+            description=desc + _distance_text(" Minimum distance: {:.1f}m.", max(0, min_distance_m)) + area_info,
             mitigation=mitigation,
             weight=0.7
         )
@@ -561,22 +742,7 @@ class CollisionRiskAssessor:
         Returns:
             Traffic density risk factor
         """
-        if traffic_density.lower() == 'low':
-            level = RiskLevel.LOW
-            desc = "Low vessel traffic density in the operational area."
-            mitigation = "Standard collision avoidance procedures are sufficient."
-        elif traffic_density.lower() == 'medium':
-            level = RiskLevel.MEDIUM
-            desc = "Medium vessel traffic density in the operational area."
-            mitigation = "Maintain vigilant watch and be prepared to adjust course frequently."
-        elif traffic_density.lower() == 'high':
-            level = RiskLevel.HIGH
-            desc = "High vessel traffic density in the operational area."
-            mitigation = "Consider rescheduling mission during lower traffic periods."
-        else:
-            level = RiskLevel.MEDIUM
-            desc = "Unknown traffic density, assuming medium risk."
-            mitigation = "Maintain vigilant watch and be prepared to adjust course."
+        level, desc, mitigation = _TRAFFIC_LEVELS.get(traffic_density.lower(), _TRAFFIC_UNKNOWN)
         
         return RiskFactor(
             name="Traffic Density",
@@ -585,90 +751,4 @@ class CollisionRiskAssessor:
             description=desc,
             mitigation=mitigation,
             weight=0.6
-        )
-    
-    def _point_to_line_segment_distance(
-        self,
-        point: Tuple[float, float],
-        line_start: Tuple[float, float],
-        line_end: Tuple[float, float]
-    ) -> float:
-        """
-        Calculate the shortest distance from a point to a line segment.
-        
-        Args:
-            point: The point (lat, lon)
-            line_start: Start of line segment (lat, lon)
-            line_end: End of line segment (lat, lon)
-            
-        Returns:
-            Distance in kilometers
-        """
-        # Convert to simpler variable names
-        p = point
-        a = line_start
-        b = line_end
-        
-        # Calculate full distance in km
-        ab_dist = calculate_distance(a[0], a[1], b[0], b[1]) / 1000
-        
-        # If segment is actually a point, return distance to the point
-        if ab_dist < 1e-10:
-            return calculate_distance(p[0], p[1], a[0], a[1]) / 1000
-        
-        # Calculate projection of point onto line
-        # This is an approximation for small distances
-        ap_dist = calculate_distance(a[0], a[1], p[0], p[1]) / 1000
-        ab_bearing = math.atan2(b[1] - a[1], b[0] - a[0])
-        ap_bearing = math.atan2(p[1] - a[1], p[0] - a[0])
-        
-        # Calculate the angle between the vectors
-        angle = abs(ab_bearing - ap_bearing)
-        
-        # Calculate the projection length
-        projection = ap_dist * math.cos(angle)
-        
-        # Clamp projection to segment
-        projection = max(0, min(ab_dist, projection))
-        
-        # Calculate closest point on segment
-        t = projection / ab_dist
-        closest_lat = a[0] + t * (b[0] - a[0])
-        closest_lon = a[1] + t * (b[1] - a[1])
-        
-        # Return distance to closest point in km
-        return calculate_distance(p[0], p[1], closest_lat, closest_lon) / 1000
-    
-    def _line_segments_intersect(
-        self,
-        segment1: Tuple[Tuple[float, float], Tuple[float, float]],
-        segment2: Tuple[Tuple[float, float], Tuple[float, float]]
-    ) -> bool:
-        """
-        Check if two line segments intersect.
-        
-        Args:
-            segment1: First line segment ((lat1, lon1), (lat2, lon2))
-            segment2: Second line segment ((lat1, lon1), (lat2, lon2))
-            
-        Returns:
-            True if segments intersect, False otherwise
-        """
-        # Extract points
-        p1, p2 = segment1
-        p3, p4 = segment2
-        
-        # Convert to simpler variable names
-        x1, y1 = p1
-        x2, y2 = p2
-        x3, y3 = p3
-        x4, y4 = p4
-        
-        # Calculate determinants
-        d1 = (x1 - x3) * (y4 - y3) - (y1 - y3) * (x4 - x3)
-        d2 = (x2 - x3) * (y4 - y3) - (y2 - y3) * (x4 - x3)
-        d3 = (x1 - x3) * (y2 - y1) - (y1 - y3) * (x2 - x1)
-        d4 = (x4 - x3) * (y2 - y1) - (y4 - y3) * (x2 - x1)
-        
-        # Check for intersection
-        return (d1 * d2 <= 0) and (d3 * d4 <= 0)
\ No newline at end of file
+        )
\ No newline at end of file
@@ -5,12 +5,275 @@ This module evaluates environmental risks such as weather conditions,
 water currents, and tide levels that may impact mission safety.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+import logging
+import operator
+import sys
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple, Union
+import numpy as np
 from utils.logger import get_logger
 from risk_assessment.risk_analyzer import RiskFactor, RiskLevel
+from risk_assessment.risk_kernels import HAVE_NUMBA, njit, prange
 
 logger = get_logger(__name__)
 
+class EnvConditions(NamedTuple):
+    """
+    Environmental conditions for risk assessment.
+    
+    Field defaults are the conditions assumed when a value is not provided.
+    """
+    wind_speed: float = 5.0  # m/s
+    wave_height: float = 0.5  # meters
+    visibility: float = 10.0  # kilometers
+    current_speed: float = 0.5  # m/s
+    is_daytime: bool = True
+    precipitation: float = 0.0  # mm/hour
+
+# Category shared by every environmental risk factor
+_CATEGORY = sys.intern("Environmental")
+
+# Mitigation shared by every LOW risk environmental factor
+_NO_MITIGATION = sys.intern("No specific mitigation required.")
+
+# Risk level values indexed by bin, for batched lookups
+_LEVEL_VALUES = np.array([level.value for level in RiskLevel], dtype=np.int8)
+
+# Risk levels, descriptions and mitigations are indexed by the number of
+# thresholds the measured value has reached, and *_SUFFIX_FMT appends the
+# measured value to the description. Scalar assessments compare against the
+# plain *_THRESHOLDS tuples; batches digitize against *_BINS. Counting down
+# from CRITICAL keeps NaN readings at CRITICAL, as before.
+_LEVELS = tuple(RiskLevel)
+
+_WIND_THRESHOLDS = (5.0, 10.0, 15.0)  # m/s
+_WIND_BINS = np.array(_WIND_THRESHOLDS)
+_WIND_DESCS = (
+    "Light winds, minimal impact on vessel operations.",
+    "Moderate winds may affect vessel control.",
+    "Strong winds will significantly affect vessel control and mission duration.",
+    "Severe winds make safe operation extremely difficult."
+)
+_WIND_MITS = (
+    _NO_MITIGATION,
+    "Adjust course to minimize crosswind exposure.",
+    "Consider postponing mission or limiting operational area.",
+    "Mission should be postponed until winds decrease."
+)
+_WIND_SUFFIX_FMT = " Current wind speed: %.1f m/s."
+
+_WAVE_THRESHOLDS = (0.5, 1.0, 2.0)  # meters
+_WAVE_BINS = np.array(_WAVE_THRESHOLDS)
+_WAVE_DESCS = (
+    "Calm water conditions.",
+    "Moderate waves may affect sensor readings and stability.",
+    "Rough water conditions will significantly impact operations.",
+    "Severe wave conditions make safe operation hazardous."
+)
+_WAVE_MITS = (
+    _NO_MITIGATION,
+    "Adjust mission parameters for increased stability requirements.",
+    "Consider postponing mission or limiting operational area.",
+    "Mission should be postponed until water conditions improve."
+)
+_WAVE_SUFFIX_FMT = " Current wave height: %.1f meters."
+
+# Visibility risk rises as visibility falls: LOW above 5 km, MEDIUM above
+# 2 km, HIGH above 0.5 km. Batches are binned on the negated value.
+_VISIBILITY_THRESHOLDS = (5.0, 2.0, 0.5)  # kilometers
+_VISIBILITY_BINS = -np.array(_VISIBILITY_THRESHOLDS)
+_VISIBILITY_DESCS = (
+    "Good visibility allows for safe visual operations.",
+    "Reduced visibility increases collision risks.",
+    "Poor visibility significantly increases operational risks.",
+    "Extremely poor visibility makes safe operation hazardous."
+)
+_VISIBILITY_MITS = (
+    _NO_MITIGATION,
+    "Reduce operational speed and increase sensor reliance.",
+    "Consider postponing mission or operate only in open areas.",
+    "Mission should be postponed until visibility improves."
+)
+_VISIBILITY_SUFFIX_FMT = " Current visibility: %.1f km."
+
+_CURRENT_THRESHOLDS = (0.5, 1.0, 2.0)  # m/s
+_CURRENT_BINS = np.array(_CURRENT_THRESHOLDS)
+_CURRENT_DESCS = (
+    "Light currents, minimal impact on vessel operations.",
+    "Moderate currents may affect precise positioning.",
+    "Strong currents will significantly affect vessel control.",
+    "Severe currents make safe operation extremely difficult."
+)
+_CURRENT_MITS = (
+    _NO_MITIGATION,
+    "Account for drift in mission planning.",
+    "Adjust mission plan to account for currents, increase power reserves.",
+    "Mission should be postponed until currents decrease."
+)
+_CURRENT_SUFFIX_FMT = " Current speed: %.1f m/s."
+
+_PRECIPITATION_THRESHOLDS = (1.0, 5.0, 10.0)  # mm/hour
+_PRECIPITATION_BINS = np.array(_PRECIPITATION_THRESHOLDS)
+_PRECIPITATION_DESCS = (
+    "No or light precipitation, minimal impact on operations.",
+    "Moderate precipitation may affect sensor performance.",
+    "Heavy precipitation will impact visibility and may affect electronics.",
+    "Severe precipitation makes safe operation hazardous."
+)
+_PRECIPITATION_MITS = (
+    _NO_MITIGATION,
+    "Ensure water-sensitive equipment is properly protected.",
+    "Consider postponing mission or limiting duration.",
+    "Mission should be postponed until precipitation decreases."
+)
+_PRECIPITATION_SUFFIX_FMT = " Current precipitation: %.1f mm/hour."
+
+_TIME_OF_DAY_DESCS = (
+    "Daytime operations provide optimal visibility.",
+    "Night operations have inherently higher risk due to reduced visibility."
+)
+_TIME_OF_DAY_MITS = (
+    _NO_MITIGATION,
+    "Use additional lighting and rely more on non-visual sensors."
+)
+
+def _factor_templates(name: str, descs: Tuple[str, ...], mitigations: Tuple[str, ...],
+                      weight: float) -> Tuple[RiskFactor, ...]:
+    """
+    Build the per-level risk factors for one environmental variable.
+    
+    All templates share interned name and category strings, which assessed
+    factors reference rather than copy.
+    
+    Args:
+        name: Risk factor name
+        descs: Description for each risk level
+        mitigations: Mitigation for each risk level
+        weight: Risk factor weight
+        
+    Returns:
+        Risk factor templates indexed by bin
+    """
+    return tuple(
+        RiskFactor(sys.intern(name), _CATEGORY, level, desc, mitigation, weight)
+        for level, desc, mitigation in zip(_LEVELS, descs, mitigations)
+    )
+
+# Assessments copy these templates and only fill in the measured value
+_WIND_FACTORS = _factor_templates("Wind Conditions", _WIND_DESCS, _WIND_MITS, 0.9)
+_WAVE_FACTORS = _factor_templates("Wave Conditions", _WAVE_DESCS, _WAVE_MITS, 0.8)
+_VISIBILITY_FACTORS = _factor_templates("Visibility Conditions", _VISIBILITY_DESCS, _VISIBILITY_MITS, 0.9)
+_CURRENT_FACTORS = _factor_templates("Current Conditions", _CURRENT_DESCS, _CURRENT_MITS, 0.7)
+_PRECIPITATION_FACTORS = _factor_templates("Precipitation", _PRECIPITATION_DESCS, _PRECIPITATION_MITS, 0.5)
+_TIME_OF_DAY_FACTORS = _factor_templates("Time of Day", _TIME_OF_DAY_DESCS, _TIME_OF_DAY_MITS, 0.6)
+
+# Assessment specs as (templates, thresholds, suffix format, descending)
+# rows. Time of day has no thresholds: its value selects the daytime or
+# night template directly.
+_WIND_SPEC = (_WIND_FACTORS, _WIND_THRESHOLDS, _WIND_SUFFIX_FMT, False)
+_WAVE_SPEC = (_WAVE_FACTORS, _WAVE_THRESHOLDS, _WAVE_SUFFIX_FMT, False)
+_VISIBILITY_SPEC = (_VISIBILITY_FACTORS, _VISIBILITY_THRESHOLDS, _VISIBILITY_SUFFIX_FMT, True)
+_CURRENT_SPEC = (_CURRENT_FACTORS, _CURRENT_THRESHOLDS, _CURRENT_SUFFIX_FMT, False)
+_TIME_OF_DAY_SPEC = (_TIME_OF_DAY_FACTORS, None, None, False)
+_PRECIPITATION_SPEC = (_PRECIPITATION_FACTORS, _PRECIPITATION_THRESHOLDS, _PRECIPITATION_SUFFIX_FMT, False)
+
+# Specs in EnvConditions field order
+_FACTOR_SPECS = (
+    _WIND_SPEC, _WAVE_SPEC, _VISIBILITY_SPEC,
+    _CURRENT_SPEC, _TIME_OF_DAY_SPEC, _PRECIPITATION_SPEC
+)
+
+# Fetches every EnvConditions field from a dictionary holding all of them in
+# a single call
+_GET_CONDITIONS = operator.itemgetter(*EnvConditions._fields)
+_CONDITION_FIELDS = frozenset(EnvConditions._fields)
+
+def _to_conditions(environment_data: Union[Dict[str, Any], EnvConditions]) -> EnvConditions:
+    """
+    Normalize environmental data to an EnvConditions tuple.
+    
+    Args:
+        environment_data: EnvConditions tuple or dictionary keyed by its fields
+        
+    Returns:
+        Environmental conditions, with defaults for missing values
+    """
+    if isinstance(environment_data, EnvConditions):
+        return environment_data
+    
+    # Dictionaries providing the full schema skip the per-key defaults
+    if _CONDITION_FIELDS <= environment_data.keys():
+        return EnvConditions._make(_GET_CONDITIONS(environment_data))
+    return EnvConditions._make(
+        environment_data.get(key, default) for key, default in EnvConditions._field_defaults.items()
+    )
+
+def _bin_index(spec: Tuple[Any, ...], value: Any) -> int:
+    """
+    Classify one environmental value into its template index.
+    
+    Args:
+        spec: Assessment spec from _FACTOR_SPECS
+        value: Measured value, or the daylight flag for time of day
+        
+    Returns:
+        Index into the spec's templates
+    """
+    _, thresholds, _, descending = spec
+    if thresholds is None:
+        return 0 if value else 1
+    
+    t0, t1, t2 = thresholds
+    if descending:
+        return 3 - (value > t0) - (value > t1) - (value > t2)
+    return 3 - (value < t0) - (value < t1) - (value < t2)
+
+def _assess_factor(spec: Tuple[Any, ...], value: Any) -> RiskFactor:
+    """
+    Classify one environmental value and build its risk factor.
+    
+    Args:
+        spec: Assessment spec from _FACTOR_SPECS
+        value: Measured value, or the daylight flag for time of day
+        
+    Returns:
+        Risk factor for the value
+    """
+    templates, thresholds, suffix_fmt, _ = spec
+    template = templates[_bin_index(spec, value)]
+    if thresholds is None:
+        return template
+    
+    return RiskFactor(template.name, template.category, template.level,
+                      template.description + suffix_fmt % value,
+                      template.mitigation, template.weight)
+
+@njit(cache=True, parallel=True)
+def _bin_all(wind, wave, visibility, current, daytime, precipitation, out):
+    """
+    Classify a batch of environmental samples into risk level values.
+    
+    Args:
+        wind: Wind speeds in m/s, shape (N,)
+        wave: Wave heights in meters, shape (N,)
+        visibility: Visibility in kilometers, shape (N,)
+        current: Current speeds in m/s, shape (N,)
+        daytime: Daylight flags, shape (N,)
+        precipitation: Precipitation in mm/hour, shape (N,)
+        out: Output array of shape (N, 6) receiving risk level values (1-4)
+    """
+    w0, w1, w2 = _WIND_THRESHOLDS
+    h0, h1, h2 = _WAVE_THRESHOLDS
+    v0, v1, v2 = _VISIBILITY_THRESHOLDS
+    c0, c1, c2 = _CURRENT_THRESHOLDS
+    p0, p1, p2 = _PRECIPITATION_THRESHOLDS
+    for i in prange(wind.shape[0]):
+        out[i, 0] = 4 - (wind[i] < w0) - (wind[i] < w1) - (wind[i] < w2)
+        out[i, 1] = 4 - (wave[i] < h0) - (wave[i] < h1) - (wave[i] < h2)
+        out[i, 2] = 4 - (visibility[i] > v0) - (visibility[i] > v1) - (visibility[i] > v2)
+        out[i, 3] = 4 - (current[i] < c0) - (current[i] < c1) - (current[i] < c2)
+        out[i, 4] = 1 if daytime[i] else 2
+        out[i, 5] = 4 - (precipitation[i] < p0) - (precipitation[i] < p1) - (precipitation[i] < p2)
+
 class EnvironmentalRiskAssessor:
     """
     Assesses environmental risks for USV missions.
@@ -24,60 +287,122 @@ class EnvironmentalRiskAssessor:
     
     def __init__(self):
         """Initialize the environmental risk assessor."""
-        logger.info("Environmental risk assessor initialized")
+        logger.debug("Environmental risk assessor initialized")
     
     def assess_risks(
         self, 
         mission_data: Dict[str, Any],
-        environment_data: Optional[Dict[str, Any]] = None
+        environment_data: Optional[Union[Dict[str, Any], EnvConditions]] = None
     ) -> List[RiskFactor]:
         """
         Assess environmental risks for a mission.
         
         Args:
             mission_data: Mission configuration and waypoints
-            environment_data: Environmental conditions data
+            environment_data: Environmental conditions, either as an
+                EnvConditions tuple or as a dictionary keyed by its fields
+                
+        Returns:
+            List of environmental risk factors
+        """
+        # Use provided environmental data or default to safe conditions,
+        # whose (immutable) risk factors are computed once at import
+        if not environment_data:
+            risk_factors = list(_DEFAULT_RISKS)
+        else:
+            risk_factors = self._assess_conditions(_to_conditions(environment_data))
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Completed environmental risk assessment with %d factors", len(risk_factors))
+        return risk_factors
+    
+    def _assess_conditions(self, conditions: EnvConditions) -> List[RiskFactor]:
+        """
+        Assess each environmental factor for a set of conditions.
+        
+        Args:
+            conditions: Environmental conditions
             
         Returns:
             List of environmental risk factors
         """
-        risk_factors = []
+        return [_assess_factor(spec, value) for spec, value in zip(_FACTOR_SPECS, conditions)]
+    
+    def assess_risks_aggregate(
+        self,
+        environment_data: Optional[Union[Dict[str, Any], EnvConditions]] = None
+    ) -> Tuple[RiskLevel, float]:
+        """
+        Summarize environmental risk without building risk factors.
         
-        # Use provided environmental data or default to safe conditions
-        env_data = environment_data or {}
+        For callers that only need aggregate risk; use assess_risks when
+        descriptions and mitigations are required.
         
-        # Assess wind conditions
-        wind_speed = env_data.get('wind_speed', 5.0)  # m/s
-        wind_risk = self._assess_wind_risk(wind_speed)
-        risk_factors.append(wind_risk)
+        Args:
+            environment_data: Environmental conditions, as for assess_risks
+            
+        Returns:
+            Tuple of (highest risk level, weighted sum of risk level values)
+        """
+        conditions = _to_conditions(environment_data or {})
         
-        # Assess wave conditions
-        wave_height = env_data.get('wave_height', 0.5)  # meters
-        wave_risk = self._assess_wave_risk(wave_height)
-        risk_factors.append(wave_risk)
+        max_level = RiskLevel.LOW
+        weighted_sum = 0.0
+        for spec, value in zip(_FACTOR_SPECS, conditions):
+            template = spec[0][_bin_index(spec, value)]
+            if template.level > max_level:
+                max_level = template.level
+            weighted_sum += template.level * template.weight
         
-        # Assess visibility conditions
-        visibility = env_data.get('visibility', 10.0)  # kilometers
-        visibility_risk = self._assess_visibility_risk(visibility)
-        risk_factors.append(visibility_risk)
+        return max_level, weighted_sum
+    
+    def assess_risks_batch(self, env_arrays: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Assess environmental risk levels for a batch of samples.
+        
+        Intended for scoring forecast time series, Monte Carlo ensembles or
+        gridded forecasts, this classifies every sample in one vectorized
+        pass and returns numeric risk levels instead of RiskFactor objects.
+        Inputs of any shape are supported and the output keeps that shape. With Numba
+        installed the samples are classified in a parallel compiled loop.
         
-        # Assess current speed
-        current_speed = env_data.get('current_speed', 0.5)  # m/s
-        current_risk = self._assess_current_risk(current_speed)
-        risk_factors.append(current_risk)
+        Args:
+            env_arrays: Arrays of environmental conditions keyed as in
+                assess_risks; missing variables use the same defaults and
+                all inputs are broadcast against each other
+                
+        Returns:
+            Dictionary mapping each environmental variable to an int8 array
+            of risk level values (1-4, matching RiskLevel values) with the
+            broadcast input shape
+        """
+        keys = EnvConditions._fields
+        defaults = EnvConditions._field_defaults
+        samples = dict(zip(keys, np.broadcast_arrays(
+            *(np.asarray(env_arrays.get(key, defaults[key])) for key in keys))))
+        shape = samples['wind_speed'].shape
         
-        # Assess time of day
-        is_daytime = env_data.get('is_daytime', True)
-        time_risk = self._assess_time_of_day_risk(is_daytime)
-        risk_factors.append(time_risk)
+        if HAVE_NUMBA:
+            columns = [
+                np.ravel(samples[key]).astype(bool if key == 'is_daytime' else np.float64)
+                for key in keys
+            ]
+            levels = np.empty((len(columns[0]), len(keys)), dtype=np.int8)
+            _bin_all(*columns, levels)
+            logger.info("Completed batched environmental risk assessment for %d samples", levels.shape[0])
+            return {key: levels[:, j].reshape(shape) for j, key in enumerate(keys)}
         
-        # Assess precipitation
-        precipitation = env_data.get('precipitation', 0.0)  # mm/hour
-        precip_risk = self._assess_precipitation_risk(precipitation)
-        risk_factors.append(precip_risk)
+        indices = {
+            'wind_speed': np.digitize(samples['wind_speed'], _WIND_BINS),
+            'wave_height': np.digitize(samples['wave_height'], _WAVE_BINS),
+            'visibility': np.digitize(-samples['visibility'], _VISIBILITY_BINS),
+            'current_speed': np.digitize(samples['current_speed'], _CURRENT_BINS),
+            'is_daytime': np.logical_not(samples['is_daytime']).astype(np.intp),
+            'precipitation': np.digitize(samples['precipitation'], _PRECIPITATION_BINS)
+        }
         
-        logger.info(f"Completed environmental risk assessment with {len(risk_factors)} factors")
-        return risk_factors
+        logger.info("Completed batched environmental risk assessment for %d samples", samples['wind_speed'].size)
+        return {key: _LEVEL_VALUES[idx] for key, idx in indices.items()}
     
     def _assess_wind_risk(self, wind_speed: float) -> RiskFactor:
         """
@@ -89,31 +414,7 @@ class EnvironmentalRiskAssessor:
         Returns:
             Wind risk factor
         """
-        if wind_speed < 5.0:
-            level = RiskLevel.LOW
-            desc = "Light winds, minimal impact on vessel operations."
-            mitigation = "No specific mitigation required."
-        elif wind_speed < 10.0:
-            level = RiskLevel.MEDIUM
-            desc = "Moderate winds may affect vessel control."
-            mitigation = "Adjust course to minimize crosswind exposure."
-        elif wind_speed < 15.0:
-            level = RiskLevel.HIGH
-            desc = "Strong winds will significantly affect vessel control and mission duration."
-            mitigation = "Consider postponing mission or limiting operational area."
-        else:
-            level = RiskLevel.CRITICAL
-            desc = "Severe winds make safe operation extremely difficult."
-            mitigation = "Mission should be postponed until winds decrease."
-        
-        return RiskFactor(
-            name="Wind Conditions",
-            category="Environmental",
-            level=level,
-            description=desc + f" Current wind speed: {wind_speed:.1f} m/s.",
-            mitigation=mitigation,
-            weight=0.9
-        )
+        return _assess_factor(_WIND_SPEC, wind_speed)
     
     def _assess_wave_risk(self, wave_height: float) -> RiskFactor:
         """
@@ -125,31 +426,7 @@ class EnvironmentalRiskAssessor:
         Returns:
             Wave risk factor
         """
-        if wave_height < 0.5:
-            level = RiskLevel.LOW
-            desc = "Calm water conditions."
-            mitigation = "No specific mitigation required."
-        elif wave_height < 1.0:
-            level = RiskLevel.MEDIUM
-            desc = "Moderate waves may affect sensor readings and stability."
-            mitigation = "Adjust mission parameters for increased stability requirements."
-        elif wave_height < 2.0:
-            level = RiskLevel.HIGH
-            desc = "Rough water conditions will significantly impact operations."
-            mitigation = "Consider postponing mission or limiting operational area."
-        else:
-            level = RiskLevel.CRITICAL
-            desc = "Severe wave conditions make safe operation hazardous."
-            mitigation = "Mission should be postponed until water conditions improve."
-        
-        return RiskFactor(
-            name="Wave Conditions",
-            category="Environmental",
-            level=level,
-            description=desc + f" Current wave height: {wave_height:.1f} meters.",
-            mitigation=mitigation,
-            weight=0.8
-        )
+        return _assess_factor(_WAVE_SPEC, wave_height)
     
     def _assess_visibility_risk(self, visibility: float) -> RiskFactor:
         """
@@ -161,31 +438,7 @@ class EnvironmentalRiskAssessor:
         Returns:
             Visibility risk factor
         """
-        if visibility > 5.0:
-            level = RiskLevel.LOW
-            desc = "Good visibility allows for safe visual operations."
-            mitigation = "No specific mitigation required."
-        elif visibility > 2.0:
-            level = RiskLevel.MEDIUM
-            desc = "Reduced visibility increases collision risks."
-            mitigation = "Reduce operational speed and increase sensor reliance."
-        elif visibility > 0.5:
-            level = RiskLevel.HIGH
-            desc = "Poor visibility significantly increases operational risks."
-            mitigation = "Consider postponing mission or operate only in open areas."
-        else:
-            level = RiskLevel.CRITICAL
-            desc = "Extremely poor visibility makes safe operation hazardous."
-            mitigation = "Mission should be postponed until visibility improves."
-        
-        return RiskFactor(
-            name="Visibility Conditions",
-            category="Environmental",
-            level=level,
-            description=desc + f" Current visibility: {visibility:.1f} km.",
-            mitigation=mitigation,
-            weight=0.9
-        )
+        return _assess_factor(_VISIBILITY_SPEC, visibility)
     
     def _assess_current_risk(self, current_speed: float) -> RiskFactor:
         """
@@ -197,31 +450,7 @@ class EnvironmentalRiskAssessor:
         Returns:
             Current risk factor
         """
-        if current_speed < 0.5:
-            level = RiskLevel.LOW
-            desc = "Light currents, minimal impact on vessel operations."
-            mitigation = "No specific mitigation required."
-        elif current_speed < 1.0:
-            level = RiskLevel.MEDIUM
-            desc = "Moderate currents may affect precise positioning."
-            mitigation = "Account for drift in mission planning."
-        elif current_speed < 2.0:
-            level = RiskLevel.HIGH
-            desc = "Strong currents will significantly affect vessel control."
-            mitigation = "Adjust mission plan to account for currents, increase power reserves."
-        else:
-            level = RiskLevel.CRITICAL
-            desc = "Severe currents make safe operation extremely difficult."
-            mitigation = "Mission should be postponed until currents decrease."
-        
-        return RiskFactor(
-            name="Current Conditions",
-            category="Environmental",
-            level=level,
-            description=desc + f" Current speed: {current_speed:.1f} m/s.",
-            mitigation=mitigation,
-            weight=0.7
-        )
+        return _assess_factor(_CURRENT_SPEC, current_speed)
     
     def _assess_time_of_day_risk(self, is_daytime: bool) -> RiskFactor:
         """
@@ -233,23 +462,7 @@ class EnvironmentalRiskAssessor:
         Returns:
             Time of day risk factor
         """
-        if is_daytime:
-            level = RiskLevel.LOW
-            desc = "Daytime operations provide optimal visibility."
-            mitigation = "No specific mitigation required."
-        else:
-            level = RiskLevel.MEDIUM
-            desc = "Night operations have inherently higher risk due to reduced visibility."
-            mitigation = "Use additional lighting and rely more on non-visual sensors."
-        
-        return RiskFactor(
-            name="Time of Day",
-            category="Environmental",
-            level=level,
-            description=desc,
-            mitigation=mitigation,
-            weight=0.6
-        )
+        return _assess_factor(_TIME_OF_DAY_SPEC, is_daytime)
     
     def _assess_precipitation_risk(self, precipitation: float) -> RiskFactor:
         """
@@ -261,28 +474,7 @@ class EnvironmentalRiskAssessor:
         Returns:
             Precipitation risk factor
         """
-        if precipitation < 1.0:
-            level = RiskLevel.LOW
-            desc = "No or light precipitation, minimal impact on operations."
-            mitigation = "No specific mitigation required."
-        elif precipitation < 5.0:
-            level = RiskLevel.MEDIUM
-            desc = "Moderate precipitation may affect sensor performance."
-            mitigation = "Ensure water-sensitive equipment is properly protected."
-        elif precipitation < 10.0:
-            level = RiskLevel.HIGH
-            desc = "Heavy precipitation will impact visibility and may affect electronics."
-            mitigation = "Consider postponing mission or limiting duration."
-        else:
-            level = RiskLevel.CRITICAL
-            desc = "Severe precipitation makes safe operation hazardous."
-            mitigation = "Mission should be postponed until precipitation decreases."
-        
-        return RiskFactor(
-            name="Precipitation",
-            category="Environmental",
-            level=level,
-            description=desc + f" Current precipitation: {precipitation:.1f} mm/hour.",
-            mitigation=mitigation,
-            weight=0.5
-        )
\ No newline at end of file
+        return _assess_factor(_PRECIPITATION_SPEC, precipitation)
+
+# Risk factors for the default (safe) conditions
+_DEFAULT_RISKS = tuple(EnvironmentalRiskAssessor()._assess_conditions(EnvConditions()))
\ No newline at end of file
@@ -5,14 +5,218 @@ This module evaluates operational risks such as mission complexity,
 battery/fuel requirements, and communication reliability.
 """
 
+import bisect
 import math
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+import numpy as np
 from utils.logger import get_logger
-from utils.geo_utils import calculate_distance, calculate_bearing
+from utils.geo_utils import calculate_distances, calculate_bearings
 from risk_assessment.risk_analyzer import RiskFactor, RiskLevel
+from risk_assessment.risk_kernels import HAVE_NUMBA, njit, prange
 
 logger = get_logger(__name__)
 
+# Default route in San Francisco Bay, used when a mission has no waypoints
+_DEFAULT_WAYPOINTS = np.array([
+    (37.7749, -122.4194),  # San Francisco
+    (37.8045, -122.4159),  # Golden Gate Bridge
+    (37.8265, -122.3806),  # Alcatraz
+    (37.8155, -122.3440),  # Berkeley
+    (37.7955, -122.3828)   # Bay Area
+], dtype=np.float64)
+_DEFAULT_WAYPOINTS.setflags(write=False)
+
+# Maximum number of analyzed routes kept by each assessor
+_ROUTE_CACHE_SIZE = 8
+
+# Without Numba, routes up to this many waypoints are analyzed with a plain
+# Python loop, which beats NumPy's per-call overhead on short routes
+_SCALAR_ROUTE_MAX = 16
+
+# Power consumption multipliers by mission type
+_MISSION_POWER_MULT = {
+    'docking': 1.3,  # Docking uses more power for precision movements
+    'station_keeping': 1.2  # Station keeping involves maintaining position
+}
+
+# Power margin thresholds (%) and the matching (level, description
+# template, mitigation) rows; margins below the first threshold are CRITICAL.
+# Each description is formatted in one call with the power usage, margin,
+# distance in km and duration in hours.
+_POWER_THRESHOLDS = (20, 40, 60)
+_POWER_SUFFIX = " Total distance: {:.2f} km, estimated duration: {:.1f} hours."
+_POWER_LEVELS = tuple((level, desc + _POWER_SUFFIX, mitigation) for level, desc, mitigation in (
+    (RiskLevel.CRITICAL, "Severe power constraints. Mission requires {:.1f} Wh with only {:.1f}% margin.",
+     "Reduce mission scope or upgrade battery capacity."),
+    (RiskLevel.HIGH, "Limited power margin. Mission requires {:.1f} Wh with {:.1f}% margin.",
+     "Optimize route for energy efficiency or include recharging point."),
+    (RiskLevel.MEDIUM, "Moderate power usage. Mission requires {:.1f} Wh with {:.1f}% margin.",
+     "Monitor power levels during operation."),
+    (RiskLevel.LOW, "Sufficient power available. Mission requires {:.1f} Wh with {:.1f}% margin.",
+     "Standard power management procedures are sufficient.")
+))
+
+# Redundant system names, in redundancy mask bit order
+_REDUNDANCY_NAMES = ("Power", "Propulsion", "Navigation", "Communication", "Control")
+
+def _redundancy_factor(redundancy_mask: int) -> RiskFactor:
+    """
+    Build the system redundancy risk factor for a set of redundant systems.
+    
+    Args:
+        redundancy_mask: Bit mask of redundant systems in _REDUNDANCY_NAMES order
+    
+    Returns:
+        System redundancy risk factor
+    """
+    # Count redundant systems
+    redundant_count = redundancy_mask.bit_count()
+    
+    # Assess risk based on number of redundant systems
+    if redundant_count == 0:
+        level = RiskLevel.CRITICAL
+        desc = "No redundant systems available. Single point failures could compromise mission."
+        mitigation = "Add redundancy for critical systems before mission."
+    elif redundant_count < 2:
+        level = RiskLevel.HIGH
+        desc = "Limited system redundancy available."
+        mitigation = "Add redundancy for navigation and propulsion systems."
+    elif redundant_count < 4:
+        level = RiskLevel.MEDIUM
+        desc = "Moderate system redundancy available."
+        mitigation = "Consider adding redundancy for remaining critical systems."
+    else:
+        level = RiskLevel.LOW
+        desc = "Good system redundancy available."
+        mitigation = "Standard system monitoring procedures are sufficient."
+    
+    # Build detailed description
+    redundant_systems = [name for i, name in enumerate(_REDUNDANCY_NAMES) if redundancy_mask >> i & 1]
+    detail = "\nRedundant systems: " + (", ".join(redundant_systems) or "None")
+    
+    return RiskFactor(
+        name="System Redundancy",
+        category="Operational",
+        level=level,
+        description=desc + detail,
+        mitigation=mitigation,
+        weight=0.8
+    )
+
+# System redundancy risk factors indexed by redundancy mask
+_REDUNDANCY_FACTORS = tuple(_redundancy_factor(mask) for mask in range(1 << len(_REDUNDANCY_NAMES)))
+
+# Default communications setup: (range in meters, base station (lat, lon),
+# satellite available, interference level)
+_DEFAULT_COMMS = (5000, (37.7749, -122.4194), False, "low")
+
+# Communication risks within radio range as (level, description, mitigation)
+_COMMS_MODERATE = (RiskLevel.MEDIUM, "Moderate communication challenges expected.",
+                   "Ensure regular communication checks during mission.")
+_COMMS_GOOD = (RiskLevel.LOW, "Good communication conditions expected throughout mission.",
+               "Standard communication protocols are sufficient.")
+
+# Complexity risk factors for mission types whose complexity does not depend on the route
+_FIXED_COMPLEXITY = {
+    "docking": RiskFactor("Mission Complexity", "Operational", RiskLevel.HIGH,
+                          "Docking missions involve precise positioning and control.",
+                          "Ensure approach vectors are clear and sensors are fully operational.", 0.9),
+    "station_keeping": RiskFactor("Mission Complexity", "Operational", RiskLevel.MEDIUM,
+                                  "Station keeping requires maintaining position in varying conditions.",
+                                  "Verify accurate positioning systems and redundant sensors.", 0.9)
+}
+
+# Communication risks for elevated interference levels (lower case)
+_INTERFERENCE_RISKS = {
+    "high": (RiskLevel.HIGH, "High interference expected in the operational area.",
+             "Use robust communication protocols and backup channels."),
+    "medium": _COMMS_MODERATE
+}
+
+@njit(cache=True, nogil=True)
+def _haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance in meters between two points given in radians."""
+    d_lat = lat2 - lat1
+    d_lon = lon2 - lon1
+    a = math.sin(d_lat/2) * math.sin(d_lat/2) + \
+        math.cos(lat1) * math.cos(lat2) * \
+        math.sin(d_lon/2) * math.sin(d_lon/2)
+    return 6371000.0 * 2 * math.asin(min(1.0, math.sqrt(a)))
+
+@njit(cache=True, nogil=True)
+def _analyze_waypoints_loop(lats, lons, base_lat, base_lon):
+    """
+    Compute route statistics for a list of waypoints in a single pass.
+    
+    Args:
+        lats: Waypoint latitudes in degrees, array or list of length N
+        lons: Waypoint longitudes in degrees, array or list of length N
+        base_lat: Base station latitude in degrees
+        base_lon: Base station longitude in degrees
+        
+    Returns:
+        Tuple of (total distance in meters, number of significant turns,
+        maximum distance from base in meters, index of the furthest
+        waypoint or -1)
+    """
+    base_lat = math.radians(base_lat)
+    base_lon = math.radians(base_lon)
+    
+    total_distance = 0.0
+    significant_turns = 0
+    max_distance = 0.0
+    furthest_idx = -1
+    prev_lat = 0.0
+    prev_lon = 0.0
+    prev_bearing = 0.0
+    for i in range(len(lats)):
+        lat = math.radians(lats[i])
+        lon = math.radians(lons[i])
+        
+        distance = _haversine(lat, lon, base_lat, base_lon)
+        if distance > max_distance:
+            max_distance = distance
+            furthest_idx = i
+        
+        if i > 0:
+            total_distance += _haversine(prev_lat, prev_lon, lat, lon)
+            
+            y = math.sin(lon - prev_lon) * math.cos(lat)
+            x = math.cos(prev_lat) * math.sin(lat) - \
+                math.sin(prev_lat) * math.cos(lat) * math.cos(lon - prev_lon)
+            bearing = (math.degrees(math.atan2(y, x)) + 360) % 360
+            
+            if i > 1:
+                bearing_diff = abs(prev_bearing - bearing)
+                if bearing_diff > 180:
+                    bearing_diff = 360 - bearing_diff
+                if bearing_diff > 30:
+                    significant_turns += 1
+            prev_bearing = bearing
+        
+        prev_lat = lat
+        prev_lon = lon
+    
+    return total_distance, significant_turns, max_distance, furthest_idx
+
+@njit(cache=True, parallel=True)
+def _analyze_routes_loop(lats, lons, offsets, base_lat, base_lon,
+                         total_distance, significant_turns, max_distance, furthest_idx):
+    """
+    Compute route statistics for many routes, one route per thread.
+    
+    Routes are stored back to back in lats/lons; route i spans
+    offsets[i]:offsets[i + 1]. Results are written into the output arrays.
+    """
+    for i in prange(offsets.shape[0] - 1):
+        start = offsets[i]
+        end = offsets[i + 1]
+        stats = _analyze_waypoints_loop(lats[start:end], lons[start:end], base_lat, base_lon)
+        total_distance[i] = stats[0]
+        significant_turns[i] = stats[1]
+        max_distance[i] = stats[2]
+        furthest_idx[i] = stats[3]
+
 class OperationalRiskAssessor:
     """
     Assesses operational risks for USV missions.
@@ -27,6 +231,8 @@ class OperationalRiskAssessor:
     
     def __init__(self):
         """Initialize the operational risk assessor."""
+        # Route statistics keyed by the waypoint coordinates and base station
+        self._route_cache: Dict[Tuple[bytes, Tuple[float, float]], Tuple[float, int, float, int]] = {}
         logger.info("Operational risk assessor initialized")
     
     def assess_risks(
@@ -47,14 +253,17 @@ class OperationalRiskAssessor:
         risk_factors = []
         
         # Extract mission parameters
-        waypoints = self._extract_waypoints(mission_data)
+        lats, lons = self._extract_waypoints_soa(mission_data)
         mission_type = mission_data.get('mission_type', 'unknown')
+        comms = self._get_comms_config(environment_data)
         
-        # Calculate total mission distance
-        total_distance = self._calculate_mission_distance(waypoints)
+        # Calculate route distance, turns and range from the base station
+        total_distance, significant_turns, max_distance, _ = self._analyze_waypoints(
+            lats, lons, comms[1])
         
         # Assess mission complexity
-        complexity_risk = self._assess_mission_complexity(mission_type, waypoints)
+        complexity_risk = self._assess_mission_complexity(mission_type, len(lats),
+                                                          significant_turns)
         risk_factors.append(complexity_risk)
         
         # Assess power/fuel requirements
@@ -62,12 +271,11 @@ class OperationalRiskAssessor:
         risk_factors.append(power_risk)
         
         # Assess communication reliability
-        comms_risk = self._assess_communication_reliability(waypoints, 
-                                                          environment_data)
+        comms_risk = self._assess_communication_reliability(max_distance, comms)
         risk_factors.append(comms_risk)
         
         # Assess navigation accuracy
-        nav_risk = self._assess_navigation_accuracy(mission_type, waypoints, 
+        nav_risk = self._assess_navigation_accuracy(mission_type, lats, lons, 
                                                   environment_data)
         risk_factors.append(nav_risk)
         
@@ -75,10 +283,59 @@ class OperationalRiskAssessor:
         redundancy_risk = self._assess_system_redundancy(mission_data)
         risk_factors.append(redundancy_risk)
         
-        logger.info(f"Completed operational risk assessment with {len(risk_factors)} factors")
+        logger.info("Completed operational risk assessment with %d factors", len(risk_factors))
         return risk_factors
     
-    def _extract_waypoints(self, mission_data: Dict[str, Any]) -> List[Tuple[float, float]]:
+    def analyze_routes_batch(
+        self,
+        missions: Sequence[Dict[str, Any]],
+        environment_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute route statistics for many candidate missions at once.
+        
+        Intended for optimization and Monte Carlo loops where the per-mission
+        overhead of assess_risks dominates. With Numba available the routes
+        are analyzed in parallel by a compiled kernel; otherwise each route
+        goes through the regular single-route analysis.
+        
+        Args:
+            missions: Mission configurations containing waypoints
+            environment_data: Environmental conditions data, shared by all missions
+            
+        Returns:
+            Dictionary of arrays indexed by mission: 'total_distance',
+            'significant_turns', 'max_distance' and 'furthest_index'
+        """
+        base_station = self._get_comms_config(environment_data)[1]
+        routes = [self._extract_waypoints_soa(mission) for mission in missions]
+        
+        count = len(routes)
+        total_distance = np.zeros(count, dtype=np.float64)
+        significant_turns = np.zeros(count, dtype=np.int64)
+        max_distance = np.zeros(count, dtype=np.float64)
+        furthest_idx = np.full(count, -1, dtype=np.int64)
+        
+        if HAVE_NUMBA and count:
+            offsets = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum([len(lats) for lats, _ in routes], out=offsets[1:])
+            _analyze_routes_loop(np.concatenate([lats for lats, _ in routes]),
+                                 np.concatenate([lons for _, lons in routes]),
+                                 offsets, float(base_station[0]), float(base_station[1]),
+                                 total_distance, significant_turns, max_distance, furthest_idx)
+        else:
+            for i, (lats, lons) in enumerate(routes):
+                (total_distance[i], significant_turns[i],
+                 max_distance[i], furthest_idx[i]) = self._analyze_waypoints(lats, lons, base_station)
+        
+        return {
+            'total_distance': total_distance,
+            'significant_turns': significant_turns,
+            'max_distance': max_distance,
+            'furthest_index': furthest_idx
+        }
+    
+    def _extract_waypoints(self, mission_data: Dict[str, Any]) -> Sequence[Tuple[float, float]]:
         """
         Extract waypoints from mission data.
         
@@ -86,7 +343,8 @@ class OperationalRiskAssessor:
             mission_data: Mission configuration and waypoints
             
         Returns:
-            List of waypoints as (lat, lon) tuples
+            Sequence of waypoints as (lat, lon) pairs; the default route is
+            a shared read-only array
         """
         waypoints = []
         
@@ -99,100 +357,197 @@ class OperationalRiskAssessor:
             waypoints = mission_data['path']
         
         # For a complex mission with multiple segments
-        if not waypoints and 'segments' in mission_data:
+        if not len(waypoints) and 'segments' in mission_data:
+            waypoints = []
             for segment in mission_data['segments']:
                 if 'waypoints' in segment:
                     waypoints.extend(segment['waypoints'])
         
         # Default waypoint for San Francisco Bay if none provided
-        if not waypoints:
-            waypoints = [
-                (37.7749, -122.4194),  # San Francisco
-                (37.8045, -122.4159),  # Golden Gate Bridge
-                (37.8265, -122.3806),  # Alcatraz
-                (37.8155, -122.3440),  # Berkeley
-                (37.7955, -122.3828)   # Bay Area
-            ]
+        if not len(waypoints):
+            return _DEFAULT_WAYPOINTS
         
         return waypoints
     
-    def _calculate_mission_distance(self, waypoints: List[Tuple[float, float]]) -> float:
+    def _extract_waypoints_soa(self, mission_data: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract waypoints from mission data as separate coordinate arrays.
+        
+        Args:
+            mission_data: Mission configuration and waypoints
+            
+        Returns:
+            Tuple of contiguous float64 (latitudes, longitudes) arrays
+        """
+        points = np.asarray(self._extract_waypoints(mission_data), dtype=np.float64).reshape(-1, 2)
+        return np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+    
+    def _get_comms_config(
+        self,
+        environment_data: Optional[Dict[str, Any]]
+    ) -> Tuple[float, Tuple[float, float], bool, str]:
+        """
+        Get communications setup from environment data.
+        
+        Args:
+            environment_data: Environmental data including comms info
+            
+        Returns:
+            Tuple of (comms range in meters, base station (lat, lon),
+            satellite available, lower-case interference level)
+        """
+        comms_range, base_station, has_satellite, interference_level = _DEFAULT_COMMS
+        
+        # Get comms info from environment data if available
+        if environment_data and 'communications' in environment_data:
+            comms_data = environment_data['communications']
+            comms_range = comms_data.get('range', comms_range)
+            base_station = comms_data.get('base_station', base_station)
+            has_satellite = comms_data.get('satellite_available', has_satellite)
+            interference_level = comms_data.get('interference', interference_level)
+        
+        return comms_range, base_station, has_satellite, interference_level.lower()
+    
+    def _analyze_waypoints(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        base_station: Tuple[float, float]
+    ) -> Tuple[float, int, float, int]:
+        """
+        Compute the route statistics used by the operational assessments.
+        
+        Uses a single compiled pass when Numba is available, and the same
+        pass as plain Python for short routes without it. Results are
+        cached by route content, so repeated assessments of the same route
+        reuse them.
+        
+        Args:
+            lats: Waypoint latitudes in degrees
+            lons: Waypoint longitudes in degrees
+            base_station: Base station (lat, lon)
+            
+        Returns:
+            Tuple of (total distance in meters, number of significant turns,
+            maximum distance from base in meters, index of the furthest
+            waypoint or -1)
+        """
+        base_station = (float(base_station[0]), float(base_station[1]))
+        key = (lats.tobytes() + lons.tobytes(), base_station)
+        
+        cached = self._route_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if HAVE_NUMBA:
+            total_distance, significant_turns, max_distance, furthest_idx = _analyze_waypoints_loop(
+                lats, lons, base_station[0], base_station[1])
+            stats = (float(total_distance), int(significant_turns), float(max_distance), int(furthest_idx))
+        elif len(lats) <= _SCALAR_ROUTE_MAX:
+            stats = _analyze_waypoints_loop(lats.tolist(), lons.tolist(), base_station[0], base_station[1])
+        else:
+            max_distance, furthest_idx = self._max_base_distance(lats, lons, base_station)
+            stats = (self._calculate_mission_distance(lats, lons), self._count_significant_turns(lats, lons),
+                     max_distance, furthest_idx)
+        
+        if len(self._route_cache) >= _ROUTE_CACHE_SIZE:
+            self._route_cache.pop(next(iter(self._route_cache)))
+        self._route_cache[key] = stats
+        return stats
+    
+    def _calculate_mission_distance(self, lats: np.ndarray, lons: np.ndarray) -> float:
         """
         Calculate total mission distance.
         
         Args:
-            waypoints: List of mission waypoints
+            lats: Waypoint latitudes in degrees
+            lons: Waypoint longitudes in degrees
             
         Returns:
             Total distance in meters
         """
-        total_distance = 0.0
+        if len(lats) < 2:
+            return 0.0
         
-        for i in range(len(waypoints) - 1):
-            start = waypoints[i]
-            end = waypoints[i + 1]
+        segment_distances = calculate_distances(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        return float(segment_distances.sum())
+    
+    def _count_significant_turns(self, lats: np.ndarray, lons: np.ndarray) -> int:
+        """
+        Count significant direction changes along the route.
+        
+        Args:
+            lats: Waypoint latitudes in degrees
+            lons: Waypoint longitudes in degrees
             
-            segment_distance = calculate_distance(start[0], start[1], end[0], end[1])
-            total_distance += segment_distance
+        Returns:
+            Number of turns with a bearing change above 30 degrees
+        """
+        if len(lats) < 3:
+            return 0
+        
+        # Calculate bearings of all segments
+        bearings = calculate_bearings(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        
+        # Calculate absolute bearing difference between consecutive segments
+        bearing_diffs = np.abs(np.diff(bearings))
+        bearing_diffs = np.minimum(bearing_diffs, 360 - bearing_diffs)
         
-        return total_distance
+        # Count as significant turn if bearing change is > 30 degrees
+        return int((bearing_diffs > 30).sum())
+    
+    def _max_base_distance(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        base_station: Tuple[float, float]
+    ) -> Tuple[float, int]:
+        """
+        Find the waypoint furthest from the base station.
+        
+        Args:
+            lats: Waypoint latitudes in degrees
+            lons: Waypoint longitudes in degrees
+            base_station: Base station (lat, lon)
+            
+        Returns:
+            Tuple of (maximum distance in meters, index of the furthest
+            waypoint or -1)
+        """
+        distances = calculate_distances(lats, lons, base_station[0], base_station[1])
+        if not len(distances):
+            return 0.0, -1
+        
+        furthest_idx = int(distances.argmax())
+        max_distance = float(distances[furthest_idx])
+        if not max_distance > 0:
+            return 0.0, -1
+        return max_distance, furthest_idx
     
     def _assess_mission_complexity(
         self, 
         mission_type: str, 
-        waypoints: List[Tuple[float, float]]
+        num_waypoints: int,
+        significant_turns: int
     ) -> RiskFactor:
         """
         Assess risk based on mission complexity.
         
         Args:
             mission_type: Type of mission
-            waypoints: List of mission waypoints
+            num_waypoints: Number of mission waypoints
+            significant_turns: Number of significant direction changes
             
         Returns:
             Mission complexity risk factor
         """
-        # Count waypoints and calculate path length
-        num_waypoints = len(waypoints)
-        
-        # Calculate number of significant direction changes
-        significant_turns = 0
-        
-        if num_waypoints >= 3:
-            for i in range(1, num_waypoints - 1):
-                prev_point = waypoints[i-1]
-                curr_point = waypoints[i]
-                next_point = waypoints[i+1]
-                
-                # Calculate bearings between segments
-                bearing1 = calculate_bearing(prev_point[0], prev_point[1], 
-                                            curr_point[0], curr_point[1])
-                bearing2 = calculate_bearing(curr_point[0], curr_point[1], 
-                                            next_point[0], next_point[1])
-                
-                # Calculate absolute bearing difference
-                bearing_diff = abs(bearing1 - bearing2)
-                if bearing_diff > 180:
-                    bearing_diff = 360 - bearing_diff
-                
-                # Count as significant turn if bearing change is > 30 degrees
-                if bearing_diff > 30:
-                    significant_turns += 1
+        # Docking and station keeping complexity is fixed by the mission type
+        fixed_complexity = _FIXED_COMPLEXITY.get(mission_type)
+        if fixed_complexity is not None:
+            return fixed_complexity
         
-        # Assess complexity based on mission type, waypoints, and turns
-        if mission_type == 'docking':
-            # Docking is inherently complex
-            complexity_level = RiskLevel.HIGH
-            desc = "Docking missions involve precise positioning and control."
-            mitigation = "Ensure approach vectors are clear and sensors are fully operational."
-            
-        elif mission_type == 'station_keeping':
-            # Station keeping is moderate complexity
-            complexity_level = RiskLevel.MEDIUM
-            desc = "Station keeping requires maintaining position in varying conditions."
-            mitigation = "Verify accurate positioning systems and redundant sensors."
-            
-        elif num_waypoints > 10 or significant_turns > 5:
+        # Otherwise assess complexity based on waypoints and turns
+        if num_waypoints > 10 or significant_turns > 5:
             # Complex waypoint mission
             complexity_level = RiskLevel.HIGH
             desc = f"Complex mission with {num_waypoints} waypoints and {significant_turns} significant turns."
@@ -239,84 +594,41 @@ class OperationalRiskAssessor:
         battery_capacity = 2000.0  # Wh
         
         # Adjust consumption based on mission type
-        if mission_type == 'docking':
-            # Docking uses more power for precision movements
-            power_consumption_rate *= 1.3
-        elif mission_type == 'station_keeping':
-            # Station keeping involves maintaining position
-            power_consumption_rate *= 1.2
-            
+        power_consumption_rate *= _MISSION_POWER_MULT.get(mission_type, 1.0)
+        
         # Calculate estimated mission duration and power requirements
         estimated_duration_hours = total_distance / (avg_speed * 3600)
         estimated_power_usage = distance_km * power_consumption_rate
         power_margin = (battery_capacity - estimated_power_usage) / battery_capacity * 100
         
         # Assess risk based on power margin
-        if power_margin < 20:
-            level = RiskLevel.CRITICAL
-            desc = f"Severe power constraints. Mission requires {estimated_power_usage:.1f} Wh with only {power_margin:.1f}% margin."
-            mitigation = "Reduce mission scope or upgrade battery capacity."
-        elif power_margin < 40:
-            level = RiskLevel.HIGH
-            desc = f"Limited power margin. Mission requires {estimated_power_usage:.1f} Wh with {power_margin:.1f}% margin."
-            mitigation = "Optimize route for energy efficiency or include recharging point."
-        elif power_margin < 60:
-            level = RiskLevel.MEDIUM
-            desc = f"Moderate power usage. Mission requires {estimated_power_usage:.1f} Wh with {power_margin:.1f}% margin."
-            mitigation = "Monitor power levels during operation."
-        else:
-            level = RiskLevel.LOW
-            desc = f"Sufficient power available. Mission requires {estimated_power_usage:.1f} Wh with {power_margin:.1f}% margin."
-            mitigation = "Standard power management procedures are sufficient."
+        level, desc, mitigation = _POWER_LEVELS[bisect.bisect_right(_POWER_THRESHOLDS, power_margin)]
         
         return RiskFactor(
             name="Power Requirements",
             category="Operational",
             level=level,
-            description=desc + f" Total distance: {distance_km:.2f} km, estimated duration: {estimated_duration_hours:.1f} hours.",
+            description=desc.format(estimated_power_usage, power_margin, distance_km, estimated_duration_hours),
             mitigation=mitigation,
             weight=1.0
         )
     
     def _assess_communication_reliability(
         self, 
-        waypoints: List[Tuple[float, float]],
-        environment_data: Optional[Dict[str, Any]]
+        max_distance: float,
+        comms: Tuple[float, Tuple[float, float], bool, str]
     ) -> RiskFactor:
         """
         Assess risk based on communication reliability.
         
         Args:
-            waypoints: List of mission waypoints
-            environment_data: Environmental data including comms info
+            max_distance: Maximum distance from the base station in meters
+            comms: Communications setup from _get_comms_config
             
         Returns:
             Communication risk factor
         """
-        # Default values
-        comms_range = 5000  # meters, typical radio range
-        base_station = (37.7749, -122.4194)  # Default base station location
-        has_satellite = False
-        interference_level = "low"
-        
-        # Get comms info from environment data if available
-        if environment_data and 'communications' in environment_data:
-            comms_data = environment_data['communications']
-            comms_range = comms_data.get('range', comms_range)
-            base_station = comms_data.get('base_station', base_station)
-            has_satellite = comms_data.get('satellite_available', has_satellite)
-            interference_level = comms_data.get('interference', interference_level)
-        
-        # Calculate maximum distance from base station
-        max_distance = 0
-        furthest_point = None
-        
-        for waypoint in waypoints:
-            distance = calculate_distance(waypoint[0], waypoint[1], 
-                                         base_station[0], base_station[1])
-            if distance > max_distance:
-                max_distance = distance
-                furthest_point = waypoint
+        comms_range, _, has_satellite, interference_level = comms
         
         # Assess comms reliability based on distance and conditions
         if max_distance > comms_range and not has_satellite:
@@ -327,18 +639,9 @@ class OperationalRiskAssessor:
             level = RiskLevel.HIGH
             desc = f"Mission approaches communication range limits with no satellite backup."
             mitigation = "Monitor communications closely and be prepared for autonomous operation."
-        elif interference_level.lower() == "high":
-            level = RiskLevel.HIGH
-            desc = "High interference expected in the operational area."
-            mitigation = "Use robust communication protocols and backup channels."
-        elif interference_level.lower() == "medium" or max_distance > comms_range * 0.6:
-            level = RiskLevel.MEDIUM
-            desc = "Moderate communication challenges expected."
-            mitigation = "Ensure regular communication checks during mission."
         else:
-            level = RiskLevel.LOW
-            desc = "Good communication conditions expected throughout mission."
-            mitigation = "Standard communication protocols are sufficient."
+            default_risk = _COMMS_MODERATE if max_distance > comms_range * 0.6 else _COMMS_GOOD
+            level, desc, mitigation = _INTERFERENCE_RISKS.get(interference_level, default_risk)
         
         return RiskFactor(
             name="Communication Reliability",
@@ -352,7 +655,8 @@ class OperationalRiskAssessor:
     def _assess_navigation_accuracy(
         self, 
         mission_type: str,
-        waypoints: List[Tuple[float, float]],
+        lats: np.ndarray,
+        lons: np.ndarray,
         environment_data: Optional[Dict[str, Any]]
     ) -> RiskFactor:
         """
@@ -360,7 +664,8 @@ class OperationalRiskAssessor:
         
         Args:
             mission_type: Type of mission
-            waypoints: List of mission waypoints
+            lats: Waypoint latitudes in degrees
+            lons: Waypoint longitudes in degrees
             environment_data: Environmental data
             
         Returns:
@@ -461,56 +766,12 @@ class OperationalRiskAssessor:
         has_redundant_communication = redundancy_info.get('communication', False)
         has_fallback_control = redundancy_info.get('control', False)
         
-        # Count redundant systems
-        redundant_count = sum([
-            has_redundant_power,
-            has_redundant_propulsion,
-            has_redundant_navigation,
-            has_redundant_communication,
-            has_fallback_control
-        ])
-        
-        # Assess risk based on number of redundant systems
-        if redundant_count == 0:
-            level = RiskLevel.CRITICAL
-            desc = "No redundant systems available. Single point failures could compromise mission."
-            mitigation = "Add redundancy for critical systems before mission."
-        elif redundant_count < 2:
-            level = RiskLevel.HIGH
-            desc = "Limited system redundancy available."
-            mitigation = "Add redundancy for navigation and propulsion systems."
-        elif redundant_count < 4:
-            level = RiskLevel.MEDIUM
-            desc = "Moderate system redundancy available."
-            mitigation = "Consider adding redundancy for remaining critical systems."
-        else:
-            level = RiskLevel.LOW
-            desc = "Good system redundancy available."
-            mitigation = "Standard system monitoring procedures are sufficient."
-        
-        # Build detailed description
-        detail = "\nRedundant systems: "
-        if has_redundant_power:
-            detail += "Power, "
-        if has_redundant_propulsion:
-            detail += "Propulsion, "
-        if has_redundant_navigation:
-            detail += "Navigation, "
-        if has_redundant_communication:
-            detail += "Communication, "
-        if has_fallback_control:
-            detail += "Control, "
-        
-        if redundant_count > 0:
-            detail = detail[:-2]  # Remove trailing comma and space
-        else:
-            detail += "None"
+        # Encode the flags as a bit mask
+        redundancy_mask = (bool(has_redundant_power) |
+                           bool(has_redundant_propulsion) << 1 |
+                           bool(has_redundant_navigation) << 2 |
+                           bool(has_redundant_communication) << 3 |
+                           bool(has_fallback_control) << 4)
         
-        return RiskFactor(
-            name="System Redundancy",
-            category="Operational",
-            level=level,
-            description=desc + detail,
-            mitigation=mitigation,
-            weight=0.8
-        )
\ No newline at end of file
+        # Every combination of flags maps to one precomputed risk factor
+        return _REDUNDANCY_FACTORS[redundancy_mask]
\ No newline at end of file
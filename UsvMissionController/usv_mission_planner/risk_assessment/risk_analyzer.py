@@ -6,13 +6,22 @@ and evaluating mission risks across different categories.
 """
 
 import enum
-from typing import Dict, List, Tuple, Any, Optional
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple, Any, Optional
+import numpy as np
 from utils.logger import get_logger
+from risk_assessment.risk_kernels import HAVE_NUMBA, njit
 
 logger = get_logger(__name__)
 
-class RiskLevel(enum.Enum):
-    """Risk severity levels."""
+class RiskLevel(enum.IntEnum):
+    """
+    Risk severity levels.
+    
+    Levels are ints, so they compare and aggregate directly and can be
+    stored in integer NumPy arrays.
+    """
     LOW = 1
     MEDIUM = 2
     HIGH = 3
@@ -20,18 +29,69 @@ class RiskLevel(enum.Enum):
     
     def get_color(self):
         """Get color code for risk level visualization."""
-        colors = {
-            RiskLevel.LOW: "#28a745",      # Green
-            RiskLevel.MEDIUM: "#ffc107",   # Yellow/Amber
-            RiskLevel.HIGH: "#fd7e14",     # Orange
-            RiskLevel.CRITICAL: "#dc3545", # Red
-        }
-        return colors.get(self, "#6c757d")  # Default gray
+        return _LEVEL_COLORS.get(self, "#6c757d")  # Default gray
+
+# Color codes for risk level visualization
+_LEVEL_COLORS = {
+    RiskLevel.LOW: "#28a745",      # Green
+    RiskLevel.MEDIUM: "#ffc107",   # Yellow/Amber
+    RiskLevel.HIGH: "#fd7e14",     # Orange
+    RiskLevel.CRITICAL: "#dc3545", # Red
+}
+
+# (name, value, color) of each risk level, used when serializing risk factors
+_LEVEL_META = {level: (level.name, level.value, _LEVEL_COLORS[level]) for level in RiskLevel}
 
+# Average risk values at which the MEDIUM, HIGH and CRITICAL levels start
+_LEVEL_THRESHOLDS = np.array([1.5, 2.5, 3.5])
+_LEVELS = tuple(RiskLevel)
+
+# Length of level count arrays indexed by level value
+_NUM_LEVEL_VALUES = len(RiskLevel) + 1
+
+@njit(cache=True, nogil=True)
+def _aggregate_factors(levels, weights, category_ids, num_categories):
+    """
+    Accumulate level counts and weighted level sums in a single pass.
+    
+    Args:
+        levels: Risk level value of each factor
+        weights: Weight of each factor
+        category_ids: Category index of each factor
+        num_categories: Number of distinct categories
+        
+    Returns:
+        Tuple of (weighted sum, total weight, level counts indexed by level
+        value, per-category factor counts, per-category weighted sums,
+        per-category total weights)
+    """
+    counts = np.zeros(_NUM_LEVEL_VALUES, dtype=np.int64)
+    category_counts = np.zeros(num_categories, dtype=np.int64)
+    category_sums = np.zeros(num_categories, dtype=np.float64)
+    category_weights = np.zeros(num_categories, dtype=np.float64)
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for i in range(levels.shape[0]):
+        level = levels[i]
+        weight = weights[i]
+        category = category_ids[i]
+        counts[level] += 1
+        category_counts[category] += 1
+        category_sums[category] += level * weight
+        category_weights[category] += weight
+        weighted_sum += level * weight
+        total_weight += weight
+    return weighted_sum, total_weight, counts, category_counts, category_sums, category_weights
+
+@dataclass(slots=True, frozen=True)
 class RiskFactor:
     """
     Represents a specific risk factor that can affect mission safety.
     
+    Risk factors are immutable; use dataclasses.replace to derive a
+    modified copy. Performance-sensitive assessors construct factors with
+    positional arguments, so the field order below must not change.
+    
     Attributes:
         name: Name of the risk factor
         category: Category of risk (environmental, collision, operational)
@@ -40,51 +100,43 @@ class RiskFactor:
         mitigation: Suggested mitigation measures
         weight: Weight of this risk in overall calculation (0.0-1.0)
     """
+    name: str
+    category: str
+    level: RiskLevel = RiskLevel.LOW
+    description: str = ""
+    mitigation: str = ""
+    weight: float = 1.0
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
-    def __init__(
-        self,
-        name: str,
-        category: str,
-        level: RiskLevel = RiskLevel.LOW,
-        description: str = "",
-        mitigation: str = "",
-        weight: float = 1.0
-    ):
-        """
-        Initialize a risk factor.
-        
-        Args:
-            name: Name of the risk factor
-            category: Category of risk
-            level: Current risk level
-            description: Detailed description of the risk
-            mitigation: Suggested mitigation measures
-            weight: Weight of this risk in overall calculation (0.0-1.0)
-        """
-        self.name = name
-        self.category = category
-        self.level = level
-        self.description = description
-        self.mitigation = mitigation
-        self.weight = max(0.0, min(1.0, weight))  # Clamp between 0 and 1
+    def __post_init__(self):
+        """Clamp the weight between 0 and 1."""
+        object.__setattr__(self, 'weight', max(0.0, min(1.0, self.weight)))
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert risk factor to dictionary for JSON serialization.
         
+        The dictionary is built on first use and shared by later calls, so
+        callers must not modify it.
+        
         Returns:
             Dictionary representation of the risk factor
         """
-        return {
+        if self._cached_dict is not None:
+            return self._cached_dict
+        
+        level_name, level_value, color = _LEVEL_META[self.level]
+        object.__setattr__(self, '_cached_dict', {
             "name": self.name,
             "category": self.category,
-            "level": self.level.name,
-            "level_value": self.level.value,
+            "level": level_name,
+            "level_value": level_value,
             "description": self.description,
             "mitigation": self.mitigation,
             "weight": self.weight,
-            "color": self.level.get_color()
-        }
+            "color": color
+        })
+        return self._cached_dict
 
 class RiskAnalyzer:
     """
@@ -100,6 +152,8 @@ class RiskAnalyzer:
         """Initialize the risk analyzer."""
         self.risk_factors: List[RiskFactor] = []
         self.risk_assessors = []
+        # Bound assess_risks methods of the assessors, in the same order
+        self._assess_fns = []
         logger.info("Risk analyzer initialized")
     
     def add_risk_assessor(self, assessor: Any) -> None:
@@ -110,6 +164,7 @@ class RiskAnalyzer:
             assessor: Risk assessor object that provides risk factors
         """
         self.risk_assessors.append(assessor)
+        self._assess_fns.append(assessor.assess_risks)
         logger.info(f"Added risk assessor: {assessor.__class__.__name__}")
     
     def assess_mission_risks(
@@ -127,13 +182,12 @@ class RiskAnalyzer:
         Returns:
             Dictionary containing risk assessment results
         """
-        # Reset risk factors
-        self.risk_factors = []
-        
         # Collect risk factors from all assessors
-        for assessor in self.risk_assessors:
-            risk_factors = assessor.assess_risks(mission_data, environment_data)
-            self.risk_factors.extend(risk_factors)
+        self.risk_factors = [
+            factor
+            for assess_risks in self._assess_fns
+            for factor in assess_risks(mission_data, environment_data)
+        ]
         
         # Calculate overall risk metrics
         results = self._calculate_risk_metrics()
@@ -143,6 +197,19 @@ class RiskAnalyzer:
         
         return results
     
+    def iter_factor_dicts(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the serialized risk factors of the last assessment.
+        
+        Lets callers stream factors, e.g. one JSON record at a time, without
+        building the full results dictionary.
+        
+        Yields:
+            Dictionary representation of each risk factor
+        """
+        for factor in self.risk_factors:
+            yield factor.to_dict()
+    
     def _calculate_risk_metrics(self) -> Dict[str, Any]:
         """
         Calculate overall risk metrics from individual risk factors.
@@ -160,32 +227,66 @@ class RiskAnalyzer:
                 "risk_summary": "No risk factors identified."
             }
         
-        # Count risks by level and calculate weighted average
-        level_counts = {level: 0 for level in RiskLevel}
-        category_risks = {}
-        total_weight = 0.0
-        weighted_sum = 0.0
+        factors = self.risk_factors
+        num_factors = len(factors)
         
-        for factor in self.risk_factors:
-            level_counts[factor.level] += 1
-            
-            # Track risk by category
-            if factor.category not in category_risks:
-                category_risks[factor.category] = {
-                    "count": 0,
-                    "weighted_sum": 0.0,
-                    "total_weight": 0.0,
-                    "factors": []
-                }
-            
-            category_risks[factor.category]["count"] += 1
-            category_risks[factor.category]["weighted_sum"] += factor.level.value * factor.weight
-            category_risks[factor.category]["total_weight"] += factor.weight
-            category_risks[factor.category]["factors"].append(factor.to_dict())
-            
-            # Overall weighted calculation
-            weighted_sum += factor.level.value * factor.weight
-            total_weight += factor.weight
+        # Serialize the factors and gather their levels, weights and category
+        # ids in a single pass; categories are numbered in order of first appearance
+        category_index: Dict[str, int] = {}
+        category_factors: List[List[Dict[str, Any]]] = []
+        factor_dicts = []
+        levels = []
+        weights = []
+        category_ids = []
+        
+        # Bind the lookups used for every factor once
+        get_category_id = category_index.get
+        add_factor_dict = factor_dicts.append
+        add_level = levels.append
+        add_weight = weights.append
+        add_category_id = category_ids.append
+        
+        for factor in factors:
+            category = factor.category
+            category_id = get_category_id(category)
+            if category_id is None:
+                category_id = category_index[category] = len(category_factors)
+                category_factors.append([])
+            factor_dict = factor.to_dict()
+            add_factor_dict(factor_dict)
+            category_factors[category_id].append(factor_dict)
+            add_level(factor.level)
+            add_weight(factor.weight)
+            add_category_id(category_id)
+        levels = np.array(levels, dtype=np.int8)
+        weights = np.array(weights, dtype=np.float64)
+        category_ids = np.array(category_ids, dtype=np.intp)
+        
+        # Count risks by level and sum weighted levels overall and by category
+        if HAVE_NUMBA:
+            (weighted_sum, total_weight, counts, category_counts,
+             category_sums, category_weights) = _aggregate_factors(levels, weights, category_ids,
+                                                                   len(category_index))
+        else:
+            weighted_levels = levels * weights
+            weighted_sum = float(weighted_levels.sum())
+            total_weight = float(weights.sum())
+            counts = np.bincount(levels, minlength=_NUM_LEVEL_VALUES)
+            category_counts = np.bincount(category_ids)
+            category_sums = np.bincount(category_ids, weights=weighted_levels)
+            category_weights = np.bincount(category_ids, weights=weights)
+        
+        # Risk counts indexed by level value; RiskLevel members index it directly
+        level_counts = counts.tolist()
+        
+        category_risks = {}
+        for category, i in category_index.items():
+            category_risks[category] = {
+                "count": int(category_counts[i]),
+                "weighted_sum": float(category_sums[i]),
+                "total_weight": float(category_weights[i]),
+                "factors": category_factors[i]
+            }
         
         # Calculate overall risk level
         if total_weight > 0:
@@ -196,59 +297,46 @@ class RiskAnalyzer:
         # Determine overall risk level based on average and presence of CRITICAL risks
         if level_counts[RiskLevel.CRITICAL] > 0:
             overall_risk = RiskLevel.CRITICAL
-        elif average_risk >= 3.5:
-            overall_risk = RiskLevel.CRITICAL
-        elif average_risk >= 2.5:
-            overall_risk = RiskLevel.HIGH
-        elif average_risk >= 1.5:
-            overall_risk = RiskLevel.MEDIUM
         else:
-            overall_risk = RiskLevel.LOW
+            overall_risk = _LEVELS[np.searchsorted(_LEVEL_THRESHOLDS, average_risk, side='right')]
         
-        # Calculate category risk levels
-        for category in category_risks:
-            cat_data = category_risks[category]
-            if cat_data["total_weight"] > 0:
-                cat_avg = cat_data["weighted_sum"] / cat_data["total_weight"]
-                
-                if cat_avg >= 3.5:
-                    cat_risk = RiskLevel.CRITICAL
-                elif cat_avg >= 2.5:
-                    cat_risk = RiskLevel.HIGH
-                elif cat_avg >= 1.5:
-                    cat_risk = RiskLevel.MEDIUM
-                else:
-                    cat_risk = RiskLevel.LOW
-                    
-                cat_data["risk_level"] = cat_risk.name
-                cat_data["risk_value"] = cat_risk.value
-                cat_data["risk_color"] = cat_risk.get_color()
+        # Calculate category risk levels for all weighted categories at once
+        weighted = category_weights > 0
+        category_levels = np.searchsorted(_LEVEL_THRESHOLDS, category_sums[weighted] / category_weights[weighted],
+                                          side='right')
+        for cat_data, level_index in zip(itertools.compress(category_risks.values(), weighted), category_levels):
+            cat_data["risk_level"], cat_data["risk_value"], cat_data["risk_color"] = _LEVEL_META[_LEVELS[level_index]]
         
         # Generate risk summary
-        risk_summary = self._generate_risk_summary(level_counts, overall_risk)
+        risk_summary = self._generate_risk_summary(level_counts, overall_risk, num_factors)
         
         return {
             "overall_risk_level": overall_risk.name,
             "overall_risk_value": overall_risk.value,
             "overall_risk_color": overall_risk.get_color(),
-            "risk_factors": [factor.to_dict() for factor in self.risk_factors],
+            "risk_factors": factor_dicts,
             "category_risks": category_risks,
-            "level_counts": {level.name: count for level, count in level_counts.items()},
+            "level_counts": {level.name: level_counts[level] for level in RiskLevel},
             "risk_summary": risk_summary
         }
     
-    def _generate_risk_summary(self, level_counts: Dict[RiskLevel, int], overall_risk: RiskLevel) -> str:
+    def _generate_risk_summary(
+        self,
+        level_counts: List[int],
+        overall_risk: RiskLevel,
+        total_factors: int
+    ) -> str:
         """
         Generate a human-readable risk summary.
         
         Args:
-            level_counts: Count of risks by level
+            level_counts: Count of risks indexed by level value
             overall_risk: Overall assessed risk level
+            total_factors: Total number of risk factors
             
         Returns:
             String containing risk summary
         """
-        total_factors = sum(level_counts.values())
         critical_count = level_counts[RiskLevel.CRITICAL]
         high_count = level_counts[RiskLevel.HIGH]
         
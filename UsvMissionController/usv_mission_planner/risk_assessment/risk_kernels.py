@@ -0,0 +1,548 @@
+"""
+Geometry kernels for collision risk assessment.
+
+This module provides the distance and intersection primitives used by the
+collision risk assessor. Inputs are (N, 2) arrays of (x, y) positions in a
+local metric frame (see project_local). When Numba is installed the kernels
+are compiled to native loops that release the GIL; otherwise pure Python/NumPy
+fallbacks are used. When SciPy is installed, large obstacle sets are pruned
+with a k-d tree.
+"""
+
+import math
+from typing import Any, Optional, Tuple
+import numpy as np
+from utils.geo_utils import METERS_PER_DEGREE
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    from scipy.spatial import cKDTree
+    HAVE_SCIPY = True
+except ImportError:
+    HAVE_SCIPY = False
+
+# Fast-math flags without 'nnan'/'ninf', since the kernels start their
+# running minimums at infinity
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Below this many segments a brute-force distance scan is cheaper than
+# pre-filtering through a spatial index
+PREFILTER_MIN_SEGMENTS = 32
+
+# Search margin beyond each segment, in meters; covers the largest distance
+# at which any collision risk threshold applies
+PREFILTER_MARGIN_M = 500.0
+
+# Below this many disks a full clearance scan is cheaper than pruning
+PRUNE_MIN_DISKS = 64
+
+# Search margin beyond each disk edge, in meters; covers the largest
+# clearance at which any obstacle risk threshold applies
+PRUNE_MARGIN_M = 200.0
+
+def project_local(points: np.ndarray, lat0: float, lon0: float) -> np.ndarray:
+    """
+    Project geographic points into a local equirectangular frame.
+    
+    Args:
+        points: Array of shape (N, 2) with (lat, lon) in degrees
+        lat0: Origin latitude in degrees
+        lon0: Origin longitude in degrees
+        
+    Returns:
+        Array of shape (N, 2) with (x, y) in meters east and north of the origin
+    """
+    kx = METERS_PER_DEGREE * math.cos(math.radians(lat0))
+    xy = np.empty_like(points)
+    xy[:, 0] = (points[:, 1] - lon0) * kx
+    xy[:, 1] = (points[:, 0] - lat0) * METERS_PER_DEGREE
+    return xy
+
+def _kernel_args(*arrays):
+    """Coerce coordinate columns to the contiguous float64 arrays the compiled kernels take."""
+    return [np.ascontiguousarray(a, dtype=np.float64) for a in arrays]
+
+# ---------------------------------------------------------------------------
+# Loop kernels (compiled with Numba when available)
+# ---------------------------------------------------------------------------
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def segment_dist(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """
+    Calculate the distance from point p to segment ab.
+    
+    Args:
+        px, py: Point coordinates in local meters
+        ax, ay: Segment start coordinates in local meters
+        bx, by: Segment end coordinates in local meters
+        
+    Returns:
+        Distance in meters
+    """
+    abx = bx - ax
+    aby = by - ay
+    ab_sq = abx*abx + aby*aby
+    t = 0.0
+    if ab_sq > 0:
+        t = ((px - ax) * abx + (py - ay) * aby) / ab_sq
+        t = max(0.0, min(1.0, t))
+    ex = ax + t * abx - px
+    ey = ay + t * aby - py
+    return math.sqrt(ex*ex + ey*ey)
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _min_point_segment_dist_loop(px, py, ax, ay, bx, by):
+    """Minimum distance between points and segments."""
+    min_dist = math.inf
+    for i in range(len(px)):
+        for j in range(len(ax)):
+            d = segment_dist(px[i], py[i], ax[j], ay[j], bx[j], by[j])
+            if d < min_dist:
+                min_dist = d
+    return min_dist
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _segment_min_distances_loop(px, py, ax, ay, bx, by, out):
+    """Per-segment distance to the nearest point."""
+    for j in range(len(ax)):
+        min_dist = math.inf
+        for i in range(len(px)):
+            d = segment_dist(px[i], py[i], ax[j], ay[j], bx[j], by[j])
+            if d < min_dist:
+                min_dist = d
+        out[j] = min_dist
+    return out
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _segment_disk_clearances_loop(px, py, cx, cy, r, out):
+    """Per-disk minimum clearance from a polyline."""
+    for k in range(len(cx)):
+        min_dist = math.inf
+        for i in range(len(px) - 1):
+            d = segment_dist(cx[k], cy[k], px[i], py[i], px[i + 1], py[i + 1])
+            if d < min_dist:
+                min_dist = d
+        out[k] = min_dist - r[k]
+    return out
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _nearest_disk_clearance_loop(px, py, cx, cy, r):
+    """
+    Smallest disk clearance from a polyline, with bounding-box pruning.
+    
+    Ties go to the lowest disk index, as with argmin over all clearances.
+    """
+    best = math.inf
+    best_k = -1
+    for k in range(len(cx)):
+        for i in range(len(px) - 1):
+            # A segment can only beat the best clearance if the center lies
+            # within the radius plus that clearance of it; once the path is
+            # deeper inside another disk than this radius, none can
+            reach = r[k] + best
+            if reach <= 0:
+                break
+            
+            # Skip segments whose bounding box, expanded by the reach, does
+            # not contain the center
+            if (cx[k] < min(px[i], px[i + 1]) - reach or cx[k] > max(px[i], px[i + 1]) + reach or
+                    cy[k] < min(py[i], py[i + 1]) - reach or cy[k] > max(py[i], py[i + 1]) + reach):
+                continue
+            d = segment_dist(cx[k], cy[k], px[i], py[i], px[i + 1], py[i + 1]) - r[k]
+            if d < best:
+                best = d
+                best_k = k
+    return best, best_k
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def _point_disk_clearances_loop(px, py, cx, cy, r, out):
+    """Per-disk minimum clearance from a set of points."""
+    for k in range(len(cx)):
+        min_dist = math.inf
+        for i in range(len(px)):
+            dx = px[i] - cx[k]
+            dy = py[i] - cy[k]
+            d = math.sqrt(dx*dx + dy*dy)
+            if d < min_dist:
+                min_dist = d
+        out[k] = min_dist - r[k]
+    return out
+
+@njit(cache=True, nogil=True)
+def segments_intersect(x1: float, y1: float, x2: float, y2: float,
+                       x3: float, y3: float, x4: float, y4: float) -> bool:
+    """
+    Test segment (x1, y1)-(x2, y2) against segment (x3, y3)-(x4, y4).
+    
+    Scalar form of segments_intersect_batch. Compiled without fast-math so
+    the sign checks stay exact for touching segments.
+    
+    Returns:
+        True if the segments intersect, False otherwise
+    """
+    d1 = (x1 - x3) * (y4 - y3) - (y1 - y3) * (x4 - x3)
+    d2 = (x2 - x3) * (y4 - y3) - (y2 - y3) * (x4 - x3)
+    d3 = (x1 - x3) * (y2 - y1) - (y1 - y3) * (x2 - x1)
+    d4 = (x4 - x3) * (y2 - y1) - (y4 - y3) * (x2 - x1)
+    return d1 * d2 <= 0 and d3 * d4 <= 0
+
+@njit(cache=True, nogil=True)
+def _count_path_crossings_loop(px, py, ax, ay, bx, by, groups, out):
+    """Per-group number of polyline segments crossing a segment of the group."""
+    crossed = np.zeros(len(out), dtype=np.bool_)
+    for i in range(len(px) - 1):
+        x1 = px[i]
+        y1 = py[i]
+        x2 = px[i + 1]
+        y2 = py[i + 1]
+        crossed[:] = False
+        for j in range(len(ax)):
+            g = groups[j]
+            if crossed[g]:
+                continue
+            if segments_intersect(x1, y1, x2, y2, ax[j], ay[j], bx[j], by[j]):
+                crossed[g] = True
+                out[g] += 1
+    return out
+
+# ---------------------------------------------------------------------------
+# NumPy implementations
+# ---------------------------------------------------------------------------
+
+def _segment_distance(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Calculate point-to-segment distances for broadcast-compatible arrays.
+    
+    Args:
+        p: Points with (x, y) in the last axis, in local meters
+        a: Segment start points with (x, y) in the last axis
+        b: Segment end points with (x, y) in the last axis
+        
+    Returns:
+        Array of distances in meters with the broadcast shape of the inputs
+    """
+    ab = b - a
+    ap = p - a
+    ab_sq = np.sum(ab * ab, axis=-1)
+    
+    # Projection parameter of each point on each segment, clamped to the segment
+    t = np.sum(ap * ab, axis=-1) / np.where(ab_sq > 0, ab_sq, 1.0)
+    np.clip(t, 0.0, 1.0, out=t)
+    
+    closest = a + t[..., None] * ab
+    return np.linalg.norm(p - closest, axis=-1)
+
+def point_segment_distances(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Calculate the distance from every point to every line segment.
+    
+    Args:
+        p: Points as an array of shape (P, 2) in local meters
+        a: Segment start points as an array of shape (S, 2) in local meters
+        b: Segment end points as an array of shape (S, 2) in local meters
+        
+    Returns:
+        Array of shape (P, S) with distances in meters
+    """
+    return _segment_distance(p[:, None, :], a[None, :, :], b[None, :, :])
+
+def _cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """2D cross product over the last axis."""
+    return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+def segments_intersect_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Test segments ab against segments cd for intersection.
+    
+    The test is branchless and broadcasts over all leading axes, so a whole
+    (W-1, 1, 2) by (1, S, 2) batch is evaluated at once.
+    
+    Args:
+        a: First segment start points with (x, y) in the last axis
+        b: First segment end points with (x, y) in the last axis
+        c: Second segment start points with (x, y) in the last axis
+        d: Second segment end points with (x, y) in the last axis
+        
+    Returns:
+        Boolean array with the broadcast shape of the inputs
+    """
+    d1 = _cross(a - c, d - c)
+    d2 = _cross(b - c, d - c)
+    d3 = _cross(a - c, b - a)
+    d4 = _cross(d - c, b - a)
+    return (d1 * d2 <= 0) & (d3 * d4 <= 0)
+
+def _segment_disk_clearances_numpy(path: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    Per-disk clearance from a polyline using a single broadcast.
+    
+    The (W-1, D) segment-to-center distance matrix is computed at once and
+    reduced over the segments.
+    """
+    if len(path) < 2:
+        return np.full(len(centers), np.inf)
+    
+    distances = _segment_distance(centers[None, :, :], path[:-1, None, :], path[1:, None, :])
+    return distances.min(axis=0) - radii
+
+# ---------------------------------------------------------------------------
+# Public kernels
+# ---------------------------------------------------------------------------
+
+def min_point_segment_dist(
+    p: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    index: Optional[Any] = None
+) -> float:
+    """
+    Calculate the minimum distance between a set of points and a set of segments.
+    
+    With a spatial index from build_segment_index, only segments whose
+    midpoints lie within reach of a point (half the longest segment plus
+    PREFILTER_MARGIN_M) are measured exactly. If none of those lie within
+    the margin, all segments are measured so the result is always exact.
+    
+    Args:
+        p: Points as an array of shape (P, 2) in local meters
+        a: Segment start points as an array of shape (S, 2) in local meters
+        b: Segment end points as an array of shape (S, 2) in local meters
+        index: Optional spatial index from build_segment_index
+        
+    Returns:
+        Minimum distance in meters, or infinity if either set is empty
+    """
+    if not len(p) or not len(a):
+        return float('inf')
+    
+    if index is not None:
+        reach = np.hypot(b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]).max() / 2 + PREFILTER_MARGIN_M
+        hits = index.query_ball_point(p, reach)
+        candidates = np.unique(np.concatenate([np.asarray(h, dtype=np.intp) for h in hits]))
+        
+        if candidates.size:
+            min_distance = _min_point_segment_dist(p, a[candidates], b[candidates])
+            if min_distance <= PREFILTER_MARGIN_M:
+                return min_distance
+    
+    return _min_point_segment_dist(p, a, b)
+
+def _min_point_segment_dist(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> float:
+    """Minimum point-to-segment distance over all pairs."""
+    if not HAVE_NUMBA:
+        return float(point_segment_distances(p, a, b).min())
+    
+    return float(_min_point_segment_dist_loop(
+        *_kernel_args(p[:, 0], p[:, 1], a[:, 0], a[:, 1], b[:, 0], b[:, 1])))
+
+def segment_min_distances(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Calculate the distance from each segment to the nearest of a set of points.
+    
+    Args:
+        p: Points as an array of shape (P, 2) in local meters
+        a: Segment start points as an array of shape (S, 2) in local meters
+        b: Segment end points as an array of shape (S, 2) in local meters
+        
+    Returns:
+        Array of shape (S,) with distances in meters (infinity if there are
+        no points)
+    """
+    if not len(p) or not len(a):
+        return np.full(len(a), np.inf)
+    
+    if not HAVE_NUMBA:
+        return point_segment_distances(p, a, b).min(axis=0)
+    
+    out = np.empty(len(a))
+    _segment_min_distances_loop(
+        *_kernel_args(p[:, 0], p[:, 1], a[:, 0], a[:, 1], b[:, 0], b[:, 1]), out)
+    return out
+
+def segment_disk_clearances(path: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    Calculate the clearance between a polyline and each of a set of disks.
+    
+    Args:
+        path: Polyline vertices as an array of shape (W, 2) in local meters
+        centers: Disk centers as an array of shape (D, 2) in local meters
+        radii: Disk radii in meters, shape (D,)
+        
+    Returns:
+        Array of shape (D,) with the minimum distance from the polyline to each
+        disk edge in meters (negative if the polyline enters the disk, infinity
+        if the polyline has no segments)
+    """
+    if not HAVE_NUMBA:
+        return _segment_disk_clearances_numpy(path, centers, radii)
+    
+    out = np.empty(len(centers))
+    px, py, cx, cy, r = _kernel_args(path[:, 0], path[:, 1], centers[:, 0], centers[:, 1], radii)
+    _segment_disk_clearances_loop(px, py, cx, cy, r, out)
+    return out
+
+def build_disk_index(centers: np.ndarray) -> Optional[Any]:
+    """
+    Build a spatial index over disk centers for nearest_disk_clearance.
+    
+    Args:
+        centers: Disk centers as an array of shape (D, 2) in local meters
+        
+    Returns:
+        A k-d tree over the centers, or None if SciPy is not installed or the
+        set is too small to benefit from pruning
+    """
+    if not HAVE_SCIPY or len(centers) < PRUNE_MIN_DISKS:
+        return None
+    return cKDTree(centers)
+
+def build_segment_index(a: np.ndarray, b: np.ndarray) -> Optional[Any]:
+    """
+    Build a spatial index over segment midpoints for min_point_segment_dist.
+    
+    Args:
+        a: Segment start points as an array of shape (S, 2) in local meters
+        b: Segment end points as an array of shape (S, 2) in local meters
+        
+    Returns:
+        A k-d tree over the segment midpoints, or None if SciPy is not
+        installed or the set is too small to benefit from pre-filtering
+    """
+    if not HAVE_SCIPY or len(a) < PREFILTER_MIN_SEGMENTS:
+        return None
+    return cKDTree((a + b) / 2)
+
+def nearest_disk_clearance(
+    path: np.ndarray,
+    centers: np.ndarray,
+    radii: np.ndarray,
+    index: Optional[Any] = None
+) -> Tuple[float, int]:
+    """
+    Find the disk with the smallest clearance from a polyline.
+    
+    For large disk sets, only disks whose centers lie within reach of a
+    segment midpoint (half the segment length plus the largest radius plus
+    PRUNE_MARGIN_M) are measured exactly, found with the k-d tree from
+    build_disk_index if given. If none of those lie within the margin, all
+    disks are measured so the result is always exact.
+    
+    Args:
+        path: Polyline vertices as an array of shape (W, 2) in local meters
+        centers: Disk centers as an array of shape (D, 2) in local meters
+        radii: Disk radii in meters, shape (D,)
+        index: Optional spatial index from build_disk_index
+        
+    Returns:
+        Tuple of (clearance in meters, disk index), or (infinity, -1) if the
+        polyline has no segments or there are no disks
+    """
+    if len(path) < 2 or not len(centers):
+        return float('inf'), -1
+    
+    if len(centers) >= PRUNE_MIN_DISKS:
+        mid = (path[:-1] + path[1:]) / 2
+        reach = np.linalg.norm(path[1:] - path[:-1], axis=-1) / 2 + radii.max() + PRUNE_MARGIN_M
+        
+        if index is not None:
+            hits = index.query_ball_point(mid, reach)
+            candidates = np.unique(np.concatenate([np.asarray(h, dtype=np.intp) for h in hits]))
+        else:
+            dist_sq = np.sum((centers[None, :, :] - mid[:, None, :]) ** 2, axis=-1)
+            candidates = np.flatnonzero((dist_sq <= reach[:, None] ** 2).any(axis=0))
+        
+        if candidates.size:
+            clearance, k = _min_disk_clearance(path, centers[candidates], radii[candidates])
+            if clearance <= PRUNE_MARGIN_M:
+                return clearance, int(candidates[k])
+    
+    return _min_disk_clearance(path, centers, radii)
+
+def _min_disk_clearance(path: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> Tuple[float, int]:
+    """
+    Smallest disk clearance from a polyline and the index of that disk.
+    
+    The compiled kernel skips segment/disk pairs that cannot beat the best
+    clearance so far. Both backends return the deepest intersection, or the
+    nearest disk if the path intersects none.
+    """
+    if not HAVE_NUMBA:
+        clearances = segment_disk_clearances(path, centers, radii)
+        k = int(np.argmin(clearances))
+        return float(clearances[k]), k
+    
+    clearance, k = _nearest_disk_clearance_loop(
+        *_kernel_args(path[:, 0], path[:, 1], centers[:, 0], centers[:, 1], radii))
+    return float(clearance), int(k)
+
+def point_disk_clearances(points: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    Calculate the clearance between a set of points and each of a set of disks.
+    
+    Args:
+        points: Points as an array of shape (P, 2) in local meters
+        centers: Disk centers as an array of shape (D, 2) in local meters
+        radii: Disk radii in meters, shape (D,)
+        
+    Returns:
+        Array of shape (D,) with the minimum distance from any point to each
+        disk edge in meters (negative if a point lies inside the disk)
+    """
+    if not HAVE_NUMBA:
+        if not len(points):
+            return np.full(len(centers), np.inf)
+        
+        # Full (P, D) point-to-center distance matrix in one broadcast
+        distances = np.hypot(points[:, None, 0] - centers[None, :, 0],
+                             points[:, None, 1] - centers[None, :, 1])
+        return (distances - radii[None, :]).min(axis=0)
+    
+    out = np.empty(len(centers))
+    px, py, cx, cy, r = _kernel_args(points[:, 0], points[:, 1], centers[:, 0], centers[:, 1], radii)
+    _point_disk_clearances_loop(px, py, cx, cy, r, out)
+    return out
+
+def count_path_crossings(
+    path: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    groups: np.ndarray,
+    n_groups: int
+) -> np.ndarray:
+    """
+    Count, per group of segments, the polyline segments that cross the group.
+    
+    Args:
+        path: Polyline vertices as an array of shape (W, 2) in local meters
+        a: Segment start points as an array of shape (S, 2) in local meters
+        b: Segment end points as an array of shape (S, 2) in local meters
+        groups: Group index of each segment, shape (S,)
+        n_groups: Number of groups
+        
+    Returns:
+        Array of shape (n_groups,) with the number of polyline segments
+        crossing at least one segment of each group
+    """
+    out = np.zeros(n_groups, dtype=np.int64)
+    if len(path) < 2 or not len(a):
+        return out
+    
+    if not HAVE_NUMBA:
+        hits = segments_intersect_batch(path[:-1, None, :], path[1:, None, :], a[None, :, :], b[None, :, :])
+        membership = groups[:, None] == np.arange(n_groups)
+        return (hits.astype(np.int64) @ membership > 0).sum(axis=0)
+    
+    px, py, ax, ay, bx, by = _kernel_args(path[:, 0], path[:, 1], a[:, 0], a[:, 1], b[:, 0], b[:, 1])
+    return _count_path_crossings_loop(px, py, ax, ay, bx, by, np.ascontiguousarray(groups, dtype=np.int64), out)
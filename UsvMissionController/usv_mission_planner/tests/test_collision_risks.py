@@ -0,0 +1,228 @@
+"""
+Test script for the Collision Risk Assessor.
+
+This module tests the collision risk assessment functionality.
+"""
+
+import unittest
+from unittest import mock
+import numpy as np
+from risk_assessment import risk_kernels
+from risk_assessment.collision_risks import CollisionRiskAssessor
+from risk_assessment.risk_analyzer import RiskLevel
+from utils.geo_utils import METERS_PER_DEGREE
+
+
+class TestCollisionRisks(unittest.TestCase):
+    """Test case for collision risk assessment."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.assessor = CollisionRiskAssessor()
+    
+    def _descriptions(self, mission_data, have_numba):
+        """Assess a mission with the loop kernels or the NumPy path forced."""
+        with mock.patch.object(risk_kernels, 'HAVE_NUMBA', have_numba):
+            return [factor.description for factor in self.assessor.assess_risks(mission_data)]
+    
+    def test_default_geometry(self):
+        """Test levels and clearances for the default San Francisco Bay mission."""
+        factors = self.assessor.assess_risks({})
+        
+        self.assertEqual([(factor.name, factor.level) for factor in factors], [
+            ("Obstacle Collision", RiskLevel.CRITICAL),
+            ("Shipping Lane Proximity", RiskLevel.HIGH),
+            ("Shore Proximity", RiskLevel.LOW),
+            ("Restricted Areas", RiskLevel.HIGH),
+            ("Traffic Density", RiskLevel.LOW)
+        ])
+        self.assertIn("Closest obstacle at (37.8270, -122.3770) with 200m radius.", factors[0].description)
+        self.assertIn("crosses 1 shipping lane(s)", factors[1].description)
+        self.assertIn("Minimum distance to shore: 271.6m.", factors[2].description)
+        self.assertIn("Minimum distance: 23.4m. Closest restricted area: Naval Restricted Zone.",
+                      factors[3].description)
+    
+    def test_clear_mission_distances(self):
+        """Test distances reported for a mission that keeps clear of all geometry."""
+        mission = {'waypoints': [(37.80, -122.45), (37.83, -122.36)]}
+        factors = self.assessor.assess_risks(mission, {'traffic_density': 'HIGH'})
+        
+        self.assertEqual([factor.level for factor in factors], [
+            RiskLevel.MEDIUM, RiskLevel.LOW, RiskLevel.LOW, RiskLevel.LOW, RiskLevel.HIGH
+        ])
+        self.assertIn("Minimum clearance: 73.5m.", factors[0].description)
+        self.assertIn("Minimum distance: 776.8m.", factors[1].description)
+        self.assertIn("Minimum distance to shore: 657.4m.", factors[2].description)
+        self.assertIn("Minimum distance: 2656.9m.", factors[3].description)
+    
+    def test_project_local(self):
+        """Test the local equirectangular projection."""
+        points = np.array([[37.8, -122.4], [37.81, -122.4], [37.8, -122.39]])
+        xy = risk_kernels.project_local(points, 37.8, -122.4)
+        
+        np.testing.assert_allclose(xy[0], [0.0, 0.0], atol=1e-9)
+        np.testing.assert_allclose(xy[1], [0.0, 0.01 * METERS_PER_DEGREE], atol=1e-6)
+        np.testing.assert_allclose(xy[2], [0.01 * METERS_PER_DEGREE * np.cos(np.radians(37.8)), 0.0], atol=1e-6)
+    
+    def test_lane_crossing_counts(self):
+        """Test per-lane counts of path segments crossing each lane."""
+        rng = np.random.default_rng(5)
+        path = rng.uniform(-1000.0, 1000.0, (12, 2))
+        a = rng.uniform(-1000.0, 1000.0, (40, 2))
+        b = a + rng.uniform(-300.0, 300.0, (40, 2))
+        groups = np.sort(rng.integers(0, 6, 40))
+        
+        # A path segment counts once per lane, however many of the lane's
+        # segments it crosses
+        expected = [0] * 6
+        for i in range(len(path) - 1):
+            crossed = {int(groups[j]) for j in range(len(a))
+                       if risk_kernels.segments_intersect(*path[i], *path[i + 1], *a[j], *b[j])}
+            for g in crossed:
+                expected[g] += 1
+        self.assertGreater(sum(expected), 0)
+        
+        for have_numba in (True, False):
+            with mock.patch.object(risk_kernels, 'HAVE_NUMBA', have_numba):
+                counts = risk_kernels.count_path_crossings(path, a, b, groups, 6)
+            self.assertEqual(counts.tolist(), expected)
+    
+    def test_last_crossed_lane_reported(self):
+        """Test that the lane reported for crossings is the last one crossed along the path."""
+        # Lanes that segments_intersect counts as crossed by the path segments
+        # spanning their longitude
+        environment = {'shipping_lanes': [
+            {'name': 'East Lane', 'points': [(37.82, -122.40), (37.90, -122.40)], 'width': 0.2},
+            {'name': 'West Lane', 'points': [(37.82, -122.45), (37.90, -122.45)], 'width': 0.2}
+        ]}
+        eastbound = [(37.80, -122.50), (37.80, -122.42), (37.80, -122.35)]
+        
+        for waypoints, expected in ((eastbound, 'East Lane'), (eastbound[::-1], 'West Lane')):
+            for have_numba in (True, False):
+                with mock.patch.object(risk_kernels, 'HAVE_NUMBA', have_numba):
+                    description = self.assessor.assess_risks({'waypoints': waypoints}, environment)[1].description
+                self.assertIn("crosses 2 shipping lane(s)", description)
+                self.assertIn(f"Closest lane: {expected}.", description)
+    
+    def test_prepared_environment_cache(self):
+        """Test that prepared geometry is reused only for the same geometry lists."""
+        environment = {'obstacles': [(37.80, -122.40, 0.1)], 'traffic_density': 'low'}
+        env = self.assessor._prepare_environment(environment)
+        
+        self.assertIs(self.assessor._prepare_environment(environment), env)
+        self.assertEqual(env.obstacles_xyr.shape, (1, 3))
+        self.assertAlmostEqual(env.obstacles_xyr[0, 2], 100.0)
+        
+        # Non-geometry keys do not invalidate the entry
+        environment['traffic_density'] = 'high'
+        self.assertIs(self.assessor._prepare_environment(environment), env)
+        
+        # Replacing a geometry list does
+        environment['obstacles'] = [(37.80, -122.40, 0.1), (37.81, -122.41, 0.2)]
+        replaced = self.assessor._prepare_environment(environment)
+        self.assertIsNot(replaced, env)
+        self.assertEqual(len(replaced.obstacles), 2)
+        
+        # An equal but distinct environment gets its own entry
+        self.assertIsNot(self.assessor._prepare_environment(dict(environment)), replaced)
+    
+    def test_nearest_disk_pruning(self):
+        """Test that pruned nearest-disk searches match a full scan."""
+        rng = np.random.default_rng(3)
+        count = 4 * risk_kernels.PRUNE_MIN_DISKS
+        centers = rng.uniform(-5000.0, 5000.0, (count, 2))
+        radii = rng.uniform(10.0, 150.0, count)
+        index = risk_kernels.build_disk_index(centers)
+        
+        paths = [
+            rng.uniform(-5000.0, 5000.0, (6, 2)),            # Among the disks
+            np.array([[20000.0, 20000.0], [21000.0, 20500.0]])  # Beyond the pruning margin
+        ]
+        for path in paths:
+            expected = risk_kernels._segment_disk_clearances_numpy(path, centers, radii)
+            for have_numba in (True, False):
+                with mock.patch.object(risk_kernels, 'HAVE_NUMBA', have_numba):
+                    for disk_index in (index, None):
+                        clearance, k = risk_kernels.nearest_disk_clearance(path, centers, radii, disk_index)
+                        self.assertEqual(k, int(np.argmin(expected)))
+                        self.assertAlmostEqual(clearance, expected.min(), places=6)
+    
+    def test_shore_prefilter(self):
+        """Test that index pre-filtering matches a full point/segment scan."""
+        count = 2 * risk_kernels.PREFILTER_MIN_SEGMENTS
+        angles = np.linspace(0.0, np.pi, count + 1)
+        shore = np.column_stack([3000.0 * np.cos(angles), 3000.0 * np.sin(angles)])
+        a, b = shore[:-1], shore[1:]
+        index = risk_kernels.build_segment_index(a, b)
+        self.assertIsNone(risk_kernels.build_segment_index(a[:8], b[:8]))
+        
+        for points in (np.array([[0.0, 2900.0], [100.0, 0.0]]),   # 100 m from shore
+                       np.array([[0.0, 2450.0]]),                 # Just beyond the margin
+                       np.array([[0.0, 0.0]]),                    # Far beyond the margin
+                       np.array([[0.0, 20000.0]])):
+            expected = risk_kernels.point_segment_distances(points, a, b).min()
+            for have_numba in (True, False):
+                with mock.patch.object(risk_kernels, 'HAVE_NUMBA', have_numba):
+                    for segment_index in (index, None):
+                        self.assertAlmostEqual(risk_kernels.min_point_segment_dist(points, a, b, segment_index),
+                                               expected, places=6)
+    
+    def test_large_environment_matches_backends(self):
+        """Test full assessments above the pruning thresholds on both backends."""
+        rng = np.random.default_rng(11)
+        count = 2 * risk_kernels.PRUNE_MIN_DISKS
+        obstacles = np.column_stack([
+            rng.uniform(37.76, 37.84, count), rng.uniform(-122.46, -122.34, count), rng.uniform(0.02, 0.1, count)
+        ])
+        shoreline = np.column_stack([
+            np.linspace(37.75, 37.85, 2 * risk_kernels.PREFILTER_MIN_SEGMENTS),
+            np.full(2 * risk_kernels.PREFILTER_MIN_SEGMENTS, -122.47)
+        ])
+        environment = {'obstacles': obstacles.tolist(), 'shorelines': [shoreline.tolist()]}
+        
+        for _ in range(20):
+            waypoints = np.column_stack([rng.uniform(37.77, 37.83, 5), rng.uniform(-122.45, -122.35, 5)])
+            mission = {'waypoints': waypoints.tolist()}
+            results = []
+            for have_numba in (True, False):
+                with mock.patch.object(risk_kernels, 'HAVE_NUMBA', have_numba):
+                    results.append([factor.to_dict() for factor in CollisionRiskAssessor().assess_risks(mission, environment)])
+            self.assertEqual(results[0], results[1])
+    
+    def test_parallel_assessor(self):
+        """Test that a parallel assessor matches a serial one and shuts down its pool."""
+        expected = [factor.to_dict() for factor in self.assessor.assess_risks({})]
+        
+        with CollisionRiskAssessor(parallel=True) as assessor:
+            self.assertEqual([factor.to_dict() for factor in assessor.assess_risks({})], expected)
+            executor = assessor._executor
+        
+        self.assertIsNone(assessor._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(len, ())
+        self.assertEqual([factor.to_dict() for factor in assessor.assess_risks({})], expected)
+    
+    def test_deepest_obstacle_intersection_reported(self):
+        """Test that the deepest of several intersected obstacles is named."""
+        # Starts just inside the (37.8100, -122.4000) obstacle, then passes
+        # through the center of the (37.7900, -122.3900) one
+        mission = {'waypoints': [(37.8100, -122.3985), (37.7900, -122.3900), (37.7800, -122.3800)]}
+        
+        for have_numba in (True, False):
+            description = self._descriptions(mission, have_numba)[0]
+            self.assertIn("intersects with an obstacle", description)
+            self.assertIn("Closest obstacle at (37.7900, -122.3900) with 100m radius.", description)
+    
+    def test_backends_give_same_descriptions(self):
+        """Test that the loop kernels and the NumPy path agree on random missions."""
+        rng = np.random.default_rng(7)
+        for _ in range(100):
+            count = int(rng.integers(2, 9))
+            waypoints = np.column_stack([rng.uniform(37.78, 37.83, count), rng.uniform(-122.43, -122.36, count)])
+            mission = {'waypoints': waypoints.tolist()}
+            
+            self.assertEqual(self._descriptions(mission, True), self._descriptions(mission, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
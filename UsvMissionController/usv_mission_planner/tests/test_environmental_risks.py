@@ -0,0 +1,77 @@
+"""
+Test script for the Environmental Risk Assessor.
+
+This module tests the environmental risk assessment functionality.
+"""
+
+import unittest
+import numpy as np
+from risk_assessment.environmental_risks import EnvironmentalRiskAssessor, EnvConditions
+
+
+class TestEnvironmentalRisks(unittest.TestCase):
+    """Test case for environmental risk assessment."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.assessor = EnvironmentalRiskAssessor()
+        
+        # Samples covering every threshold boundary
+        self.samples = {
+            'wind_speed': np.array([0.0, 4.9, 5.0, 10.0, 14.9, 15.0, 30.0]),
+            'wave_height': np.array([0.0, 0.5, 0.9, 1.0, 2.0, 1.5, 5.0]),
+            'visibility': np.array([10.0, 5.1, 5.0, 2.0, 0.6, 0.5, 0.0]),
+            'current_speed': np.array([0.0, 0.5, 1.0, 1.9, 2.0, 0.4, 3.0]),
+            'is_daytime': np.array([True, False, True, False, True, False, True]),
+            'precipitation': np.array([0.0, 1.0, 4.9, 5.0, 10.0, 0.9, 20.0])
+        }
+    
+    def test_batch_matches_scalar_assessment(self):
+        """Test that batched levels match the per-sample risk factors."""
+        levels = self.assessor.assess_risks_batch(self.samples)
+        
+        for i in range(len(self.samples['wind_speed'])):
+            sample = {key: values[i].item() for key, values in self.samples.items()}
+            factors = self.assessor.assess_risks({}, sample)
+            expected = [factor.level.value for factor in factors]
+            actual = [int(levels[key][i]) for key in self.samples]
+            self.assertEqual(actual, expected)
+    
+    def test_env_conditions_match_dict(self):
+        """Test that EnvConditions and dictionary inputs give the same factors."""
+        conditions = EnvConditions(wind_speed=12.0, visibility=1.5, is_daytime=False)
+        from_tuple = self.assessor.assess_risks({}, conditions)
+        from_dict = self.assessor.assess_risks({}, conditions._asdict())
+        
+        self.assertEqual([factor.to_dict() for factor in from_tuple],
+                         [factor.to_dict() for factor in from_dict])
+    
+    def test_partial_dict_defaults(self):
+        """Test that dictionaries missing fields fall back to the defaults."""
+        conditions = EnvConditions(wind_speed=12.0, precipitation=6.0)
+        from_dict = self.assessor.assess_risks({}, {'wind_speed': 12.0, 'precipitation': 6.0, 'sea_state': 3})
+        
+        self.assertEqual([factor.to_dict() for factor in self.assessor.assess_risks({}, conditions)],
+                         [factor.to_dict() for factor in from_dict])
+    
+    def test_batch_grid_shape(self):
+        """Test that gridded inputs keep their shape."""
+        wind = np.array([[1.0, 6.0, 12.0], [16.0, np.nan, 4.0]])
+        levels = self.assessor.assess_risks_batch({'wind_speed': wind, 'is_daytime': False})
+        
+        self.assertEqual(levels['wind_speed'].tolist(), [[1, 2, 3], [4, 4, 1]])
+        self.assertEqual(levels['is_daytime'].shape, wind.shape)
+        self.assertTrue((levels['is_daytime'] == 2).all())
+    
+    def test_batch_defaults(self):
+        """Test that missing variables fall back to the scalar defaults."""
+        levels = self.assessor.assess_risks_batch({'wind_speed': np.array([1.0, 20.0])})
+        defaults = [factor.level.value for factor in self.assessor.assess_risks({}, {})]
+        
+        self.assertEqual(levels['wind_speed'].tolist(), [1, 4])
+        for key, expected in zip(list(levels)[1:], defaults[1:]):
+            self.assertEqual(levels[key].tolist(), [expected, expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
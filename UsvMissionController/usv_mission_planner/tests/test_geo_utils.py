@@ -0,0 +1,118 @@
+"""
+Test script for the geographic utilities.
+
+This module tests the distance, bearing and offset calculations.
+"""
+
+import unittest
+from unittest import mock
+import numpy as np
+from utils import geo_utils
+from utils.geo_utils import AnchorFrame, WaypointArray, calculate_distance, calculate_distances, calculate_bearing, offset_position, offset_positions
+
+
+class TestGeoUtils(unittest.TestCase):
+    """Test case for geographic utilities."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = np.random.default_rng(1)
+        
+        # Anchors with targets at short range (equirectangular path) and long
+        # range (Haversine path)
+        self.anchors = np.column_stack([rng.uniform(-80.0, 80.0, 50), rng.uniform(-180.0, 180.0, 50)])
+        self.offsets = np.concatenate([rng.uniform(-0.09, 0.09, (50, 2)), rng.uniform(-5.0, 5.0, (50, 2))])
+    
+    def test_anchor_frame_matches_functions(self):
+        """Test that AnchorFrame gives exactly the results of the module functions."""
+        for lat0, lon0 in self.anchors.tolist():
+            anchor = AnchorFrame(lat0, lon0)
+            for d_lat, d_lon in self.offsets.tolist():
+                lat, lon = lat0 + d_lat, lon0 + d_lon
+                self.assertEqual(anchor.distance_to(lat, lon), calculate_distance(lat0, lon0, lat, lon))
+                self.assertEqual(anchor.bearing_to(lat, lon), calculate_bearing(lat0, lon0, lat, lon))
+            
+            for bearing, distance in ((0.0, 0.0), (45.0, 150.0), (200.0, 12000.0), (359.9, 250000.0)):
+                self.assertEqual(anchor.offset(bearing, distance), offset_position(lat0, lon0, bearing, distance))
+    
+    def test_waypoint_array_growth(self):
+        """Test that appends grow WaypointArray storage geometrically and keep every point."""
+        waypoints = WaypointArray()
+        self.assertEqual(len(waypoints), 0)
+        self.assertEqual(waypoints.lats.shape, (0,))
+        
+        points = self.anchors[:20]
+        capacities = []
+        for i, (lat, lon) in enumerate(points.tolist()):
+            waypoints.append(lat, lon)
+            self.assertEqual(len(waypoints), i + 1)
+            capacities.append(len(waypoints._lats))
+        
+        # Capacity starts at 8 and doubles each time it fills up
+        self.assertEqual(sorted(set(capacities)), [8, 16, 32])
+        np.testing.assert_array_equal(waypoints.lats, points[:, 0])
+        np.testing.assert_array_equal(waypoints.lons, points[:, 1])
+    
+    def test_waypoint_array_from_points(self):
+        """Test WaypointArray construction from points followed by appends."""
+        waypoints = WaypointArray([(37.80, -122.40), (37.81, -122.41)])
+        self.assertEqual(len(waypoints), 2)
+        
+        waypoints.append(37.82, -122.42)
+        self.assertEqual(len(waypoints), 3)
+        np.testing.assert_array_equal(waypoints.lats, [37.80, 37.81, 37.82])
+        np.testing.assert_array_equal(waypoints.lons, [-122.40, -122.41, -122.42])
+    
+    def test_waypoint_array_distances(self):
+        """Test WaypointArray.distances_to against calculate_distances."""
+        points = self.anchors[:20]
+        waypoints = WaypointArray()
+        for lat, lon in points.tolist():
+            waypoints.append(lat, lon)
+        
+        distances = waypoints.distances_to(37.8, -122.4)
+        self.assertEqual(distances.shape, (20,))
+        np.testing.assert_array_equal(distances, calculate_distances(points[:, 0], points[:, 1], 37.8, -122.4))
+    
+    def test_pairwise_distances(self):
+        """Test calculate_pairwise_distances against broadcast calculate_distances."""
+        rng = np.random.default_rng(2)
+        points1 = np.column_stack([rng.uniform(-80.0, 80.0, geo_utils._PAIRWISE_BLOCK_ROWS + 88),
+                                   rng.uniform(-180.0, 180.0, geo_utils._PAIRWISE_BLOCK_ROWS + 88)])
+        points2 = points1[:40] + rng.uniform(-0.5, 0.5, (40, 2))
+        
+        # The parallel kernel only exists when Numba is installed
+        backends = (False, True) if geo_utils.HAVE_NUMBA else (False,)
+        for have_numba in backends:
+            with mock.patch.object(geo_utils, 'HAVE_NUMBA', have_numba):
+                for other in (points2, None):
+                    expected_other = points1 if other is None else other
+                    expected = calculate_distances(points1[:, None, 0], points1[:, None, 1],
+                                                   expected_other[None, :, 0], expected_other[None, :, 1])
+                    
+                    distances = geo_utils.calculate_pairwise_distances(points1, other)
+                    self.assertEqual(distances.shape, expected.shape)
+                    np.testing.assert_allclose(distances, expected, rtol=1e-12, atol=1e-6)
+    
+    def test_offset_positions(self):
+        """Test offset_positions against the scalar offset_position."""
+        rng = np.random.default_rng(4)
+        bearings = rng.uniform(0.0, 360.0, 200)
+        distances = rng.uniform(0.0, 50000.0, 200)
+        
+        for lat0, lon0 in self.anchors[:10].tolist():
+            lats, lons = offset_positions(lat0, lon0, bearings, distances)
+            self.assertEqual(lats.shape, (200,))
+            expected = np.array([offset_position(lat0, lon0, b, d) for b, d in zip(bearings.tolist(), distances.tolist())])
+            np.testing.assert_allclose(lats, expected[:, 0], rtol=0, atol=1e-9)
+            np.testing.assert_allclose(lons, expected[:, 1], rtol=0, atol=1e-9)
+        
+        # Bearings and distances broadcast against each other
+        lats, lons = offset_positions(37.8, -122.4, bearings, 1000.0)
+        self.assertEqual(lats.shape, (200,))
+        np.testing.assert_array_equal(lats, offset_positions(37.8, -122.4, bearings, np.full(200, 1000.0))[0])
+        np.testing.assert_allclose(calculate_distances(37.8, -122.4, lats, lons), 1000.0, rtol=1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Test script for the logging utilities.
+
+This module tests the background rotating file handler and the cached
+time formatter.
+"""
+
+import os
+import logging
+import tempfile
+import unittest
+from utils.logger import BackgroundRotatingFileHandler, CachedTimeFormatter
+
+
+class TestLogger(unittest.TestCase):
+    """Test case for logging utilities."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmpdir.name, 'test.log')
+    
+    def tearDown(self):
+        """Remove the log files."""
+        self.tmpdir.cleanup()
+    
+    def _write_records(self, count, backup_count):
+        """Log numbered records through a batched handler, then close it."""
+        handler = BackgroundRotatingFileHandler(self.log_file, maxBytes=120, backupCount=backup_count, batched=True)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        for i in range(count):
+            handler.handle(logging.makeLogRecord({'msg': 'record %04d', 'args': (i,)}))
+        handler.close()
+    
+    def _read_records(self, backup_count):
+        """Read the records of the backups, oldest first, then the active log."""
+        paths = [f"{self.log_file}.{i}" for i in range(backup_count, 0, -1)] + [self.log_file]
+        lines = []
+        for path in paths:
+            if os.path.exists(path):
+                with open(path) as f:
+                    lines.extend(f.read().splitlines())
+        self.assertFalse(os.path.exists(self.log_file + '.rollover'))
+        return lines
+    
+    def test_rollover_keeps_all_records(self):
+        """Test that batched writes across several rollovers keep records contiguous."""
+        self._write_records(60, backup_count=10)
+        
+        self.assertTrue(os.path.exists(self.log_file + '.5'))
+        self.assertEqual(self._read_records(10), ['record %04d' % i for i in range(60)])
+    
+    def test_rollover_drops_oldest_records(self):
+        """Test that only the newest records are kept once backups run out."""
+        self._write_records(100, backup_count=3)
+        
+        records = self._read_records(3)
+        self.assertFalse(os.path.exists(self.log_file + '.4'))
+        self.assertLess(len(records), 100)
+        self.assertEqual(records, ['record %04d' % i for i in range(100 - len(records), 100)])
+    
+    def test_batched_records_wait_for_flush(self):
+        """Test that batched records stay buffered until flush with a size limit set."""
+        handler = BackgroundRotatingFileHandler(self.log_file, maxBytes=5*1024*1024, backupCount=3, batched=True)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        try:
+            for i in range(5):
+                handler.handle(logging.makeLogRecord({'msg': 'record %04d', 'args': (i,)}))
+                self.assertEqual(os.path.getsize(self.log_file), 0)
+            
+            handler.flush()
+            self.assertEqual(self._read_records(3), ['record %04d' % i for i in range(5)])
+        finally:
+            handler.close()
+    
+    def test_size_count_includes_existing_log(self):
+        """Test that the rollover size count starts from an existing log's size."""
+        with open(self.log_file, 'w') as f:
+            f.write('x' * 100 + '\n')
+        self._write_records(2, backup_count=3)
+        
+        # 101 bytes were already written, so the second 12 byte record
+        # reaches the 120 byte limit and rolls over
+        self.assertEqual(self._read_records(3), ['x' * 100, 'record 0000', 'record 0001'])
+        with open(self.log_file) as f:
+            self.assertEqual(f.read().splitlines(), ['record 0001'])
+    
+    def test_cached_time_formatter(self):
+        """Test that CachedTimeFormatter output matches logging.Formatter."""
+        fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        start = 1700000000.0
+        
+        for datefmt in (None, '%Y-%m-%d %H:%M:%S'):
+            cached = CachedTimeFormatter(fmt, datefmt=datefmt)
+            plain = logging.Formatter(fmt, datefmt=datefmt)
+            for offset in (0.0, 0.25, 0.999, 1.0, 1.5, 61.125, 0.5):
+                record = logging.makeLogRecord({'name': 'usv', 'levelname': 'INFO', 'msg': 'message',
+                                                'created': start + offset,
+                                                'msecs': (offset * 1000) % 1000})
+                self.assertEqual(cached.format(record), plain.format(record))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,8 +6,6 @@ MissionManager class.
 """
 
 import unittest
-from unittest.mock import patch
-import time
 from usv_mission_planner.planners.mission_manager import MissionManager, MissionStatus
 from usv_mission_planner.missions.waypoint_mission import WaypointMission
 from usv_mission_planner.missions.station_keeping import StationKeepingMission
@@ -5,19 +5,23 @@ This module tests the operational risk assessment functionality.
 """
 
 import unittest
+from collections import Counter
+from unittest import mock
+import numpy as np
+from risk_assessment import operational_risks
 from risk_assessment.operational_risks import OperationalRiskAssessor
 from risk_assessment.risk_analyzer import RiskLevel
+from utils.geo_utils import calculate_distances, calculate_bearings
 
 
 class TestOperationalRisks(unittest.TestCase):
     """Test case for operational risk assessment."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.assessor = OperationalRiskAssessor()
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests; tests must not modify them."""
         # Sample mission data for testing
-        self.simple_mission = {
+        cls.simple_mission = {
             'mission_type': 'waypoint',
             'waypoints': [
                 (37.7749, -122.4194),  # San Francisco
@@ -33,7 +37,7 @@ class TestOperationalRisks(unittest.TestCase):
             }
         }
         
-        self.complex_mission = {
+        cls.complex_mission = {
             'mission_type': 'waypoint',
             'waypoints': [
                 (37.7749, -122.4194),  # San Francisco
@@ -58,7 +62,7 @@ class TestOperationalRisks(unittest.TestCase):
             }
         }
         
-        self.docking_mission = {
+        cls.docking_mission = {
             'mission_type': 'docking',
             'waypoints': [
                 (37.7749, -122.4194),  # Start
@@ -77,7 +81,7 @@ class TestOperationalRisks(unittest.TestCase):
         }
         
         # Sample environment data for testing
-        self.good_environment = {
+        cls.good_environment = {
             'gps_quality': 'good',
             'rtk_available': True,
             'ins_available': True,
@@ -89,7 +93,7 @@ class TestOperationalRisks(unittest.TestCase):
             }
         }
         
-        self.poor_environment = {
+        cls.poor_environment = {
             'gps_quality': 'poor',
             'rtk_available': False,
             'ins_available': False,
@@ -101,6 +105,10 @@ class TestOperationalRisks(unittest.TestCase):
             }
         }
     
+    def setUp(self):
+        """Set up a fresh assessor for each test."""
+        self.assessor = OperationalRiskAssessor()
+    
     def test_simple_mission_good_environment(self):
         """Test risk assessment for a simple mission in good environment."""
         risks = self.assessor.assess_risks(self.simple_mission, self.good_environment)
@@ -115,10 +123,11 @@ class TestOperationalRisks(unittest.TestCase):
         self.assertIn(RiskLevel.LOW, risk_levels)
         
         # Count risk levels
-        low_count = sum(1 for level in risk_levels if level == RiskLevel.LOW)
-        medium_count = sum(1 for level in risk_levels if level == RiskLevel.MEDIUM)
-        high_count = sum(1 for level in risk_levels if level == RiskLevel.HIGH)
-        critical_count = sum(1 for level in risk_levels if level == RiskLevel.CRITICAL)
+        level_counts = Counter(risk_levels)
+        low_count = level_counts[RiskLevel.LOW]
+        medium_count = level_counts[RiskLevel.MEDIUM]
+        high_count = level_counts[RiskLevel.HIGH]
+        critical_count = level_counts[RiskLevel.CRITICAL]
         
         # Simple mission in good conditions should have more low/medium risks than high/critical
         self.assertGreaterEqual(low_count + medium_count, high_count + critical_count)
@@ -138,10 +147,11 @@ class TestOperationalRisks(unittest.TestCase):
         self.assertIn(RiskLevel.CRITICAL, risk_levels)
         
         # Count risk levels
-        low_count = sum(1 for level in risk_levels if level == RiskLevel.LOW)
-        medium_count = sum(1 for level in risk_levels if level == RiskLevel.MEDIUM)
-        high_count = sum(1 for level in risk_levels if level == RiskLevel.HIGH)
-        critical_count = sum(1 for level in risk_levels if level == RiskLevel.CRITICAL)
+        level_counts = Counter(risk_levels)
+        low_count = level_counts[RiskLevel.LOW]
+        medium_count = level_counts[RiskLevel.MEDIUM]
+        high_count = level_counts[RiskLevel.HIGH]
+        critical_count = level_counts[RiskLevel.CRITICAL]
         
         # Complex mission in poor conditions should have more high/critical risks than low/medium
         self.assertGreaterEqual(high_count + critical_count, low_count + medium_count)
@@ -249,6 +259,37 @@ class TestOperationalRisks(unittest.TestCase):
         self.assertIsNotNone(full_redundancy_risk)
         self.assertEqual(no_redundancy_risk.level, RiskLevel.CRITICAL)
         self.assertEqual(full_redundancy_risk.level, RiskLevel.LOW)
+    
+    def test_batch_route_analysis_matches_single(self):
+        """Test batch route statistics against independently computed values."""
+        missions = [self.simple_mission, self.complex_mission, {'mission_type': 'waypoint'}]
+        base_lat, base_lon = self.assessor._get_comms_config(self.good_environment)[1]
+        
+        expected = []
+        for mission in missions:
+            lats, lons = self.assessor._extract_waypoints_soa(mission)
+            base_distances = calculate_distances(base_lat, base_lon, lats, lons)
+            bearings = calculate_bearings(lats[:-1], lons[:-1], lats[1:], lons[1:])
+            turns = np.abs(np.diff(bearings))
+            turns = np.minimum(turns, 360 - turns)
+            expected.append((
+                float(calculate_distances(lats[:-1], lons[:-1], lats[1:], lons[1:]).sum()),
+                int((turns > 30).sum()),
+                float(base_distances.max()),
+                int(base_distances.argmax())
+            ))
+        
+        # Run both the per-route analysis and the parallel route kernel (plain
+        # Python without Numba), each on a fresh assessor with an empty cache
+        for have_numba in (False, True):
+            with mock.patch.object(operational_risks, 'HAVE_NUMBA', have_numba):
+                stats = OperationalRiskAssessor().analyze_routes_batch(missions, self.good_environment)
+            
+            for i, (total, turns, max_distance, furthest) in enumerate(expected):
+                self.assertAlmostEqual(stats['total_distance'][i], total, places=6)
+                self.assertEqual(stats['significant_turns'][i], turns)
+                self.assertAlmostEqual(stats['max_distance'][i], max_distance, places=6)
+                self.assertEqual(stats['furthest_index'][i], furthest)
 
 
 if __name__ == '__main__':
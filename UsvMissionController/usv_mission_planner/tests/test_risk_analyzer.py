@@ -0,0 +1,153 @@
+"""
+Test script for the Risk Analyzer.
+
+This module tests the aggregation of risk factors into overall and
+per-category risk levels.
+"""
+
+import unittest
+from unittest import mock
+import numpy as np
+from risk_assessment import risk_analyzer
+from risk_assessment.risk_analyzer import RiskAnalyzer, RiskFactor, RiskLevel
+
+
+class _FixedAssessor:
+    """Assessor returning a fixed list of risk factors."""
+    
+    def __init__(self, factors):
+        self.factors = factors
+    
+    def assess_risks(self, mission_data, environment_data=None):
+        return self.factors
+
+
+class TestRiskAnalyzer(unittest.TestCase):
+    """Test case for risk aggregation."""
+    
+    def _assess(self, factors, have_numba):
+        """Assess fixed factors with the compiled aggregation or the NumPy path forced."""
+        analyzer = RiskAnalyzer()
+        analyzer.add_risk_assessor(_FixedAssessor(factors))
+        with mock.patch.object(risk_analyzer, 'HAVE_NUMBA', have_numba):
+            return analyzer.assess_mission_risks({})
+    
+    def _assess_both(self, factors):
+        """Assess fixed factors on both backends and check that they agree."""
+        results = [self._assess(factors, have_numba) for have_numba in (True, False)]
+        self.assertEqual(results[0], results[1])
+        return results[0]
+    
+    def test_weight_clamped(self):
+        """Test that factor weights are clamped between 0 and 1."""
+        self.assertEqual(RiskFactor("a", "collision", weight=5.0).weight, 1.0)
+        self.assertEqual(RiskFactor("a", "collision", weight=-2.0).weight, 0.0)
+        self.assertEqual(RiskFactor("a", "collision", weight=0.4).weight, 0.4)
+        
+        # A clamped weight of 0 drops the factor out of the average
+        results = self._assess_both([
+            RiskFactor("a", "collision", RiskLevel.HIGH, weight=-2.0),
+            RiskFactor("b", "collision", RiskLevel.LOW, weight=5.0)
+        ])
+        self.assertEqual(results["overall_risk_level"], "LOW")
+        self.assertEqual(results["category_risks"]["collision"]["total_weight"], 1.0)
+        self.assertEqual(results["category_risks"]["collision"]["weighted_sum"], 1.0)
+    
+    def test_threshold_averages(self):
+        """Test that averages exactly on a threshold take the higher level."""
+        for lower, upper, expected in ((RiskLevel.LOW, RiskLevel.MEDIUM, "MEDIUM"),
+                                       (RiskLevel.MEDIUM, RiskLevel.HIGH, "HIGH")):
+            results = self._assess_both([RiskFactor("a", "environmental", lower),
+                                         RiskFactor("b", "environmental", upper)])
+            self.assertEqual(results["overall_risk_level"], expected)
+            self.assertEqual(results["category_risks"]["environmental"]["risk_level"], expected)
+        
+        # An average of 3.5 needs a CRITICAL factor, so check it per category
+        results = self._assess_both([
+            RiskFactor("a", "collision", RiskLevel.HIGH),
+            RiskFactor("b", "collision", RiskLevel.CRITICAL),
+            RiskFactor("c", "operational", RiskLevel.HIGH),
+            RiskFactor("d", "operational", RiskLevel.CRITICAL, weight=0.99)
+        ])
+        self.assertEqual(results["category_risks"]["collision"]["risk_level"], "CRITICAL")
+        self.assertEqual(results["category_risks"]["operational"]["risk_level"], "HIGH")
+    
+    def test_critical_override(self):
+        """Test that any CRITICAL factor makes the overall risk CRITICAL."""
+        factors = [RiskFactor(f"low {i}", "environmental", RiskLevel.LOW) for i in range(10)]
+        factors.append(RiskFactor("critical", "collision", RiskLevel.CRITICAL, weight=0.1))
+        results = self._assess_both(factors)
+        
+        self.assertEqual(results["overall_risk_level"], "CRITICAL")
+        self.assertEqual(results["overall_risk_value"], RiskLevel.CRITICAL.value)
+        self.assertEqual(results["level_counts"], {"LOW": 10, "MEDIUM": 0, "HIGH": 0, "CRITICAL": 1})
+        self.assertEqual(results["category_risks"]["environmental"]["risk_level"], "LOW")
+    
+    def test_no_factors(self):
+        """Test the result for an empty factor list."""
+        results = self._assess_both([])
+        
+        self.assertEqual(results["overall_risk_level"], "LOW")
+        self.assertEqual(results["risk_factors"], [])
+        self.assertEqual(results["category_risks"], {})
+        self.assertEqual(results["risk_summary"], "No risk factors identified.")
+    
+    def test_zero_weight_category(self):
+        """Test that a category with no total weight gets no risk level."""
+        results = self._assess_both([
+            RiskFactor("a", "collision", RiskLevel.HIGH, weight=0.0),
+            RiskFactor("b", "collision", RiskLevel.MEDIUM, weight=0.0),
+            RiskFactor("c", "environmental", RiskLevel.MEDIUM)
+        ])
+        
+        collision = results["category_risks"]["collision"]
+        self.assertEqual(collision["count"], 2)
+        self.assertEqual(collision["total_weight"], 0.0)
+        self.assertNotIn("risk_level", collision)
+        self.assertEqual(results["category_risks"]["environmental"]["risk_level"], "MEDIUM")
+        self.assertEqual(results["overall_risk_level"], "MEDIUM")
+        
+        # With no weight at all the average defaults to LOW
+        results = self._assess_both([RiskFactor("a", "collision", RiskLevel.HIGH, weight=0.0)])
+        self.assertEqual(results["overall_risk_level"], "LOW")
+    
+    def test_random_factors(self):
+        """Test aggregation of random factor sets against a direct computation."""
+        rng = np.random.default_rng(9)
+        categories = ["environmental", "collision", "operational"]
+        
+        def level_for(average):
+            for threshold, level in ((3.5, RiskLevel.CRITICAL), (2.5, RiskLevel.HIGH), (1.5, RiskLevel.MEDIUM)):
+                if average >= threshold:
+                    return level
+            return RiskLevel.LOW
+        
+        for _ in range(50):
+            count = int(rng.integers(1, 12))
+            factors = [
+                RiskFactor(f"factor {i}", categories[int(rng.integers(0, 3))],
+                           RiskLevel(int(rng.integers(1, 5))), weight=float(rng.choice([0.0, 0.25, 0.5, 1.0])))
+                for i in range(count)
+            ]
+            results = self._assess_both(factors)
+            
+            weights = sum(f.weight for f in factors)
+            average = sum(f.level * f.weight for f in factors) / weights if weights > 0 else 1.0
+            if any(f.level == RiskLevel.CRITICAL for f in factors):
+                self.assertEqual(results["overall_risk_level"], "CRITICAL")
+            else:
+                self.assertEqual(results["overall_risk_level"], level_for(average).name)
+            
+            for category, cat_data in results["category_risks"].items():
+                members = [f for f in factors if f.category == category]
+                self.assertEqual(cat_data["count"], len(members))
+                cat_weights = sum(f.weight for f in members)
+                if cat_weights > 0:
+                    cat_average = sum(f.level * f.weight for f in members) / cat_weights
+                    self.assertEqual(cat_data["risk_level"], level_for(cat_average).name)
+                else:
+                    self.assertNotIn("risk_level", cat_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,12 +8,16 @@ This package contains utility functions including:
 """
 
 from .geo_utils import (
-    calculate_distance, calculate_bearing, offset_position
+    calculate_distance, calculate_bearing, offset_position, offset_positions,
+    calculate_distances, calculate_bearings, calculate_pairwise_distances,
+    WaypointArray
 )
 from .config import get_config_value
 from .logger import get_logger
 
 __all__ = [
-    'calculate_distance', 'calculate_bearing', 'offset_position',
+    'calculate_distance', 'calculate_bearing', 'offset_position', 'offset_positions',
+    'calculate_distances', 'calculate_bearings', 'calculate_pairwise_distances',
+    'WaypointArray',
     'get_config_value', 'get_logger'
 ]
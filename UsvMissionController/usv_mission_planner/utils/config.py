@@ -5,9 +5,41 @@ This module provides functionality for loading and accessing configuration value
 """
 
 import os
+import copy
 import json
+import mmap
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# orjson parses considerably faster when installed; json.loads also
+# accepts the raw bytes read from the file
+try:
+    import orjson
+    _parse_json = orjson.loads
+    HAVE_ORJSON = True
+except ImportError:
+    _parse_json = json.loads
+    HAVE_ORJSON = False
+
+# Files at least this large are memory-mapped and parsed in place when the
+# parser accepts buffers (orjson only), avoiding a copy into a bytes object
+_MMAP_MIN_BYTES = 1 << 20
+
+def _read_json_file(path: str) -> Any:
+    """
+    Parse a JSON file.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        The parsed JSON value
+    """
+    with open(path, 'rb') as f:
+        if HAVE_ORJSON and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _parse_json(view)
+        return _parse_json(f.read())
 
 logger = logging.getLogger(__name__)
 
@@ -38,39 +70,74 @@ _default_config = {
 }
 
 # Current active configuration
-_config = _default_config.copy()
+_config = copy.deepcopy(_default_config)
+
+# (path, modification time) of the file _config was loaded from, if any
+_config_source: Optional[Tuple[str, int]] = None
+
+# Values of the active configuration keyed by (section, key)
+_config_values: Dict[Tuple[str, str], Any] = {}
+
+def _index_config(config: Dict[str, Any]) -> Dict[Tuple[str, str], Any]:
+    """
+    Flatten the sections of a configuration into a (section, key) lookup.
+    
+    Args:
+        config: Configuration dict
+        
+    Returns:
+        Dict mapping (section, key) to the configuration value
+    """
+    return {
+        (section, key): value
+        for section, values in config.items() if isinstance(values, dict)
+        for key, value in values.items()
+    }
+
+_config_values = _index_config(_config)
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from a file.
     
+    Loading the same file again is a no-op unless its modification time has
+    changed. The returned dict is shared with get_config_value, so callers
+    must not modify it.
+    
     Args:
         config_path: Path to the configuration file
         
     Returns:
         The loaded configuration dict
     """
-    global _config
-    
-    # Start with default configuration
-    _config = _default_config.copy()
+    global _config, _config_source, _config_values
     
     # If config path provided, try to load it
     if config_path and os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
-                
+            source = (os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+            if source == _config_source:
+                return _config
+            
+            user_config = _read_json_file(config_path)
+            
             # Update default config with user values (nested update)
+            _config = copy.deepcopy(_default_config)
             _update_nested_dict(_config, user_config)
+            _config_source = source
             logger.info(f"Loaded configuration from {config_path}")
         except Exception as e:
+            _config = copy.deepcopy(_default_config)
+            _config_source = None
             logger.error(f"Error loading configuration: {str(e)}")
     else:
         if config_path:
             logger.warning(f"Configuration file not found: {config_path}")
         logger.info("Using default configuration")
+        _config = copy.deepcopy(_default_config)
+        _config_source = None
     
+    _config_values = _index_config(_config)
     return _config
 
 def get_config_value(section: str, key: str, default: Any = None) -> Any:
@@ -85,17 +152,15 @@ def get_config_value(section: str, key: str, default: Any = None) -> Any:
     Returns:
         The configuration value
     """
-    global _config
-    
-    try:
-        return _config.get(section, {}).get(key, default)
-    except:
-        return default
+    return _config_values.get((section, key), default)
 
 def _update_nested_dict(d: Dict[str, Any], u: Dict[str, Any]) -> Dict[str, Any]:
     """
     Update a nested dictionary with values from another dict.
     
+    Nested dictionaries are merged in place, walking the levels with an
+    explicit stack rather than recursion.
+    
     Args:
         d: Dictionary to update
         u: Dictionary containing updates
@@ -103,9 +168,13 @@ def _update_nested_dict(d: Dict[str, Any], u: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Updated dictionary
     """
-    for k, v in u.items():
-        if isinstance(v, dict) and k in d and isinstance(d[k], dict):
-            d[k] = _update_nested_dict(d[k], v)
-        else:
-            d[k] = v
+    stack = [(d, u)]
+    while stack:
+        target, updates = stack.pop()
+        for k, v in updates.items():
+            current = target.get(k)
+            if isinstance(v, dict) and isinstance(current, dict):
+                stack.append((current, v))
+            else:
+                target[k] = v
     return d
\ No newline at end of file
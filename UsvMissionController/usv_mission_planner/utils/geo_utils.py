@@ -2,17 +2,45 @@
 Geographic utilities for USV Mission Planner.
 
 This module provides functions for geographic calculations, such as
-distance and bearing between coordinates.
+distance and bearing between coordinates. When Numba is installed, compiled
+scalar variants (the *_fast functions) are provided for hot loops.
 """
 
 import math
-from typing import Tuple
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Approximate meters per degree of latitude, used for local equirectangular
+# ("flat earth") projections over bay-scale areas
+METERS_PER_DEGREE = 111320.0
+
+# Angle conversion factors; multiplying by these gives the same results as
+# math.radians and math.degrees without the function calls
+_DEG_TO_RAD = math.pi / 180.0
+_RAD_TO_DEG = 180.0 / math.pi
+
+# Below this difference in both latitude and longitude (degrees), scalar
+# distances use the equirectangular approximation, which stays within 5 mm
+# of the Haversine distance at that range
+_LOCAL_DISTANCE_DEGREES = 0.1
+
+# Rows computed at a time by calculate_pairwise_distances, keeping the
+# temporaries of large distance matrices cache sized
+_PAIRWISE_BLOCK_ROWS = 512
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the distance between two points on the Earth's surface.
     
-    Uses the Haversine formula for calculating great-circle distance.
+    Uses the Haversine formula for calculating great-circle distance, or
+    the equirectangular approximation of calculate_distance_local for
+    points less than 0.1 degrees apart.
     
     Args:
         lat1: Latitude of first point in degrees
@@ -26,11 +54,18 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     # Earth's radius in meters
     R = 6371000.0
     
+    # Short range: equirectangular approximation (same as calculate_distance_local,
+    # inlined so the function also compiles with Numba)
+    if abs(lat2 - lat1) < _LOCAL_DISTANCE_DEGREES and abs(lon2 - lon1) < _LOCAL_DISTANCE_DEGREES:
+        x = (lon2 - lon1) * _DEG_TO_RAD * math.cos((lat1 + lat2) * 0.5 * _DEG_TO_RAD)
+        y = (lat2 - lat1) * _DEG_TO_RAD
+        return R * math.hypot(x, y)
+    
     # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    lat1_rad = lat1 * _DEG_TO_RAD
+    lon1_rad = lon1 * _DEG_TO_RAD
+    lat2_rad = lat2 * _DEG_TO_RAD
+    lon2_rad = lon2 * _DEG_TO_RAD
     
     # Differences
     d_lat = lat2_rad - lat1_rad
@@ -40,11 +75,111 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     a = math.sin(d_lat/2) * math.sin(d_lat/2) + \
         math.cos(lat1_rad) * math.cos(lat2_rad) * \
         math.sin(d_lon/2) * math.sin(d_lon/2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    c = 2 * math.asin(min(1.0, math.sqrt(a)))
     distance = R * c
     
     return distance
 
+def calculate_distance_local(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Calculate the distance between two nearby points.
+    
+    Uses an equirectangular projection around the mean latitude, which is
+    much cheaper than the Haversine formula and accurate to millimeters for
+    points up to about 10 km apart.
+    
+    Args:
+        lat1: Latitude of first point in degrees
+        lon1: Longitude of first point in degrees
+        lat2: Latitude of second point in degrees
+        lon2: Longitude of second point in degrees
+        
+    Returns:
+        Distance in meters between the two points
+    """
+    # Earth's radius in meters
+    R = 6371000.0
+    
+    x = (lon2 - lon1) * _DEG_TO_RAD * math.cos((lat1 + lat2) * 0.5 * _DEG_TO_RAD)
+    y = (lat2 - lat1) * _DEG_TO_RAD
+    return R * math.hypot(x, y)
+
+def calculate_distances(lat1: np.ndarray, lon1: np.ndarray,
+                        lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Calculate element-wise distances between arrays of points.
+    
+    Vectorized form of calculate_distance; inputs broadcast against each
+    other.
+    
+    Args:
+        lat1: Latitudes of first points in degrees
+        lon1: Longitudes of first points in degrees
+        lat2: Latitudes of second points in degrees
+        lon2: Longitudes of second points in degrees
+        
+    Returns:
+        Array of distances in meters
+    """
+    # Earth's radius in meters
+    R = 6371000.0
+    
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    d_lat = lat2_rad - lat1_rad
+    d_lon = np.radians(lon2) - np.radians(lon1)
+    
+    # Haversine formula
+    a = np.sin(d_lat/2)**2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(d_lon/2)**2
+    return R * 2 * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+def calculate_pairwise_distances(points1: np.ndarray,
+                                 points2: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate distances between all pairs of points.
+    
+    With Numba the matrix is filled by a parallel compiled kernel, which
+    agrees with the NumPy path to within floating point rounding.
+    
+    Args:
+        points1: Array of (latitude, longitude) rows in degrees, shape (N, 2)
+        points2: Optional array of (latitude, longitude) rows in degrees,
+            shape (M, 2); defaults to points1
+        
+    Returns:
+        Array of distances in meters, shape (N, M), where element [i, j] is
+        the distance from points1[i] to points2[j]
+    """
+    # Earth's radius in meters
+    R = 6371000.0
+    
+    points1 = np.radians(np.asarray(points1, dtype=np.float64).reshape(-1, 2))
+    points2 = points1 if points2 is None else np.radians(np.asarray(points2, dtype=np.float64).reshape(-1, 2))
+    lat1, lon1 = points1[:, 0:1], points1[:, 1:2]
+    lat2, lon2 = points2[:, 0], points2[:, 1]
+    cos_lat1 = np.cos(lat1)
+    cos_lat2 = np.cos(lat2)
+    
+    distances = np.empty((len(points1), len(points2)))
+    if HAVE_NUMBA:
+        _pairwise_distances_kernel(
+            np.ascontiguousarray(lat1[:, 0]), np.ascontiguousarray(lon1[:, 0]), cos_lat1[:, 0],
+            np.ascontiguousarray(lat2), np.ascontiguousarray(lon2), cos_lat2, distances
+        )
+        return distances
+    
+    for start in range(0, len(points1), _PAIRWISE_BLOCK_ROWS):
+        rows = slice(start, start + _PAIRWISE_BLOCK_ROWS)
+        d_lat = lat2 - lat1[rows]
+        d_lon = lon2 - lon1[rows]
+        
+        # Haversine formula
+        a = np.sin(d_lat/2)**2 + cos_lat1[rows] * cos_lat2 * np.sin(d_lon/2)**2
+        distances[rows] = np.arcsin(np.minimum(1.0, np.sqrt(a)))
+    
+    distances *= 2 * R
+    return distances
+
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the bearing from one point to another.
@@ -59,10 +194,10 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
         Bearing in degrees (0-360, where 0 is North)
     """
     # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    lat1_rad = lat1 * _DEG_TO_RAD
+    lon1_rad = lon1 * _DEG_TO_RAD
+    lat2_rad = lat2 * _DEG_TO_RAD
+    lon2_rad = lon2 * _DEG_TO_RAD
     
     # Calculate the bearing
     y = math.sin(lon2_rad - lon1_rad) * math.cos(lat2_rad)
@@ -71,11 +206,37 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
     bearing_rad = math.atan2(y, x)
     
     # Convert to degrees and normalize to 0-360
-    bearing_deg = math.degrees(bearing_rad)
+    bearing_deg = bearing_rad * _RAD_TO_DEG
     bearing_normalized = (bearing_deg + 360) % 360
     
     return bearing_normalized
 
+def calculate_bearings(lat1: np.ndarray, lon1: np.ndarray,
+                       lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Calculate element-wise bearings between arrays of points.
+    
+    Vectorized form of calculate_bearing; inputs broadcast against each
+    other.
+    
+    Args:
+        lat1: Latitudes of first points in degrees
+        lon1: Longitudes of first points in degrees
+        lat2: Latitudes of second points in degrees
+        lon2: Longitudes of second points in degrees
+        
+    Returns:
+        Array of bearings in degrees (0-360, where 0 is North)
+    """
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    d_lon = np.radians(lon2) - np.radians(lon1)
+    
+    y = np.sin(d_lon) * np.cos(lat2_rad)
+    x = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(d_lon)
+    
+    return (np.degrees(np.arctan2(y, x)) + 360) % 360
+
 def offset_position(lat: float, lon: float, bearing: float, distance: float) -> Tuple[float, float]:
     """
     Calculate the resulting position after moving from a starting position.
@@ -93,9 +254,9 @@ def offset_position(lat: float, lon: float, bearing: float, distance: float) ->
     R = 6371000.0
     
     # Convert to radians
-    lat_rad = math.radians(lat)
-    lon_rad = math.radians(lon)
-    bearing_rad = math.radians(bearing)
+    lat_rad = lat * _DEG_TO_RAD
+    lon_rad = lon * _DEG_TO_RAD
+    bearing_rad = bearing * _DEG_TO_RAD
     
     # Angular distance in radians
     angular_distance = distance / R
@@ -113,22 +274,282 @@ def offset_position(lat: float, lon: float, bearing: float, distance: float) ->
     )
     
     # Convert back to degrees
-    new_lat = math.degrees(new_lat_rad)
-    new_lon = math.degrees(new_lon_rad)
+    new_lat = new_lat_rad * _RAD_TO_DEG
+    new_lon = new_lon_rad * _RAD_TO_DEG
     
     return (new_lat, new_lon)
 
-def haversine_distance(point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
+def offset_positions(lat: float, lon: float, bearings: np.ndarray,
+                     distances: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the positions reached by moving from one starting position.
+    
+    Vectorized form of offset_position for fanning out many samples around
+    an anchor; bearings and distances broadcast against each other, and the
+    trigonometry of the start is computed once.
+    
+    Args:
+        lat: Starting latitude in degrees
+        lon: Starting longitude in degrees
+        bearings: Directions of movement in degrees (0-360, where 0 is North)
+        distances: Distances to move in meters
+        
+    Returns:
+        Tuple of (latitudes, longitudes) arrays for the new positions
+    """
+    # Earth's radius in meters
+    R = 6371000.0
+    
+    lat_rad = lat * _DEG_TO_RAD
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    
+    bearings_rad = np.radians(bearings)
+    angular_distances = np.asarray(distances, dtype=np.float64) / R
+    sin_distances = np.sin(angular_distances)
+    cos_distances = np.cos(angular_distances)
+    
+    new_lat_rad = np.arcsin(sin_lat * cos_distances + cos_lat * sin_distances * np.cos(bearings_rad))
+    new_lon_rad = lon * _DEG_TO_RAD + np.arctan2(
+        np.sin(bearings_rad) * sin_distances * cos_lat,
+        cos_distances - sin_lat * np.sin(new_lat_rad)
+    )
+    return (np.degrees(new_lat_rad), np.degrees(new_lon_rad))
+
+class AnchorFrame:
+    """
+    Fixed reference point for repeated calculations from one position.
+    
+    Caches the radians and trigonometry of the anchor, so sweeping many
+    distances, bearings or offsets from the same position skips recomputing
+    them. Results are identical to calculate_distance, calculate_bearing and
+    offset_position.
+    
+    Attributes:
+        lat: Anchor latitude in degrees
+        lon: Anchor longitude in degrees
+    """
+    
+    __slots__ = ('lat', 'lon', '_lat_rad', '_lon_rad', '_sin_lat', '_cos_lat')
+    
+    def __init__(self, lat: float, lon: float):
+        """
+        Initialize the anchor frame.
+        
+        Args:
+            lat: Anchor latitude in degrees
+            lon: Anchor longitude in degrees
+        """
+        self.lat = lat
+        self.lon = lon
+        self._lat_rad = lat * _DEG_TO_RAD
+        self._lon_rad = lon * _DEG_TO_RAD
+        self._sin_lat = math.sin(self._lat_rad)
+        self._cos_lat = math.cos(self._lat_rad)
+    
+    def distance_to(self, lat: float, lon: float) -> float:
+        """
+        Calculate the distance from the anchor to a point.
+        
+        Args:
+            lat: Latitude of the point in degrees
+            lon: Longitude of the point in degrees
+            
+        Returns:
+            Distance in meters
+        """
+        # Earth's radius in meters
+        R = 6371000.0
+        
+        # Short range: equirectangular approximation, as in calculate_distance
+        if abs(lat - self.lat) < _LOCAL_DISTANCE_DEGREES and abs(lon - self.lon) < _LOCAL_DISTANCE_DEGREES:
+            x = (lon - self.lon) * _DEG_TO_RAD * math.cos((self.lat + lat) * 0.5 * _DEG_TO_RAD)
+            y = (lat - self.lat) * _DEG_TO_RAD
+            return R * math.hypot(x, y)
+        
+        lat_rad = lat * _DEG_TO_RAD
+        d_lat = lat_rad - self._lat_rad
+        d_lon = lon * _DEG_TO_RAD - self._lon_rad
+        
+        # Haversine formula
+        a = math.sin(d_lat/2) * math.sin(d_lat/2) + \
+            self._cos_lat * math.cos(lat_rad) * \
+            math.sin(d_lon/2) * math.sin(d_lon/2)
+        c = 2 * math.asin(min(1.0, math.sqrt(a)))
+        return R * c
+    
+    def bearing_to(self, lat: float, lon: float) -> float:
+        """
+        Calculate the bearing from the anchor to a point.
+        
+        Args:
+            lat: Latitude of the point in degrees
+            lon: Longitude of the point in degrees
+            
+        Returns:
+            Bearing in degrees (0-360, where 0 is North)
+        """
+        lat_rad = lat * _DEG_TO_RAD
+        d_lon = lon * _DEG_TO_RAD - self._lon_rad
+        cos_lat2 = math.cos(lat_rad)
+        
+        y = math.sin(d_lon) * cos_lat2
+        x = self._cos_lat * math.sin(lat_rad) - self._sin_lat * cos_lat2 * math.cos(d_lon)
+        return (math.atan2(y, x) * _RAD_TO_DEG + 360) % 360
+    
+    def offset(self, bearing: float, distance: float) -> Tuple[float, float]:
+        """
+        Calculate the position reached by moving from the anchor.
+        
+        Args:
+            bearing: Direction of movement in degrees (0-360, where 0 is North)
+            distance: Distance to move in meters
+            
+        Returns:
+            Tuple of (latitude, longitude) for the new position
+        """
+        # Earth's radius in meters
+        R = 6371000.0
+        
+        bearing_rad = bearing * _DEG_TO_RAD
+        angular_distance = distance / R
+        sin_distance = math.sin(angular_distance)
+        cos_distance = math.cos(angular_distance)
+        
+        new_lat_rad = math.asin(
+            self._sin_lat * cos_distance +
+            self._cos_lat * sin_distance * math.cos(bearing_rad)
+        )
+        new_lon_rad = self._lon_rad + math.atan2(
+            math.sin(bearing_rad) * sin_distance * self._cos_lat,
+            cos_distance - self._sin_lat * math.sin(new_lat_rad)
+        )
+        return (new_lat_rad * _RAD_TO_DEG, new_lon_rad * _RAD_TO_DEG)
+
+class WaypointArray:
+    """
+    Growable waypoint storage with separate latitude and longitude arrays.
+    
+    Keeping the coordinates in two contiguous arrays lets distance queries
+    over all waypoints run as single vectorized passes. Appends grow the
+    storage geometrically, so building an array point by point stays
+    amortized O(1).
+    """
+    
+    __slots__ = ('_lats', '_lons', '_size')
+    
+    def __init__(self, points: Union[Sequence[Tuple[float, float]], np.ndarray] = ()):
+        """
+        Initialize the waypoint array.
+        
+        Args:
+            points: Initial (latitude, longitude) pairs in degrees
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._lats = np.ascontiguousarray(points[:, 0])
+        self._lons = np.ascontiguousarray(points[:, 1])
+        self._size = len(points)
+    
+    def __len__(self) -> int:
+        """Number of waypoints."""
+        return self._size
+    
+    @property
+    def lats(self) -> np.ndarray:
+        """Waypoint latitudes in degrees."""
+        return self._lats[:self._size]
+    
+    @property
+    def lons(self) -> np.ndarray:
+        """Waypoint longitudes in degrees."""
+        return self._lons[:self._size]
+    
+    def append(self, lat: float, lon: float) -> None:
+        """
+        Add a waypoint at the end.
+        
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+        """
+        if self._size == len(self._lats):
+            capacity = max(8, 2 * self._size)
+            lats = np.empty(capacity)
+            lons = np.empty(capacity)
+            lats[:self._size] = self._lats[:self._size]
+            lons[:self._size] = self._lons[:self._size]
+            self._lats = lats
+            self._lons = lons
+        
+        self._lats[self._size] = lat
+        self._lons[self._size] = lon
+        self._size += 1
+    
+    def distances_to(self, lat: float, lon: float) -> np.ndarray:
+        """
+        Calculate the distance from every waypoint to a point.
+        
+        Args:
+            lat: Latitude of the point in degrees
+            lon: Longitude of the point in degrees
+            
+        Returns:
+            Array of distances in meters
+        """
+        return calculate_distances(self.lats, self.lons, lat, lon)
+
+def haversine_distance(
+    point1: Union[Tuple[float, float], np.ndarray],
+    point2: Union[Tuple[float, float], np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate the distance between two points on the Earth's surface.
     
-    Uses the Haversine formula for calculating great-circle distance.
+    Uses the Haversine formula for calculating great-circle distance. If
+    either argument is a NumPy array of (latitude, longitude) rows, the
+    distances are computed in one vectorized pass with calculate_distances.
     
     Args:
-        point1: Tuple of (latitude, longitude) for the first point
-        point2: Tuple of (latitude, longitude) for the second point
+        point1: Tuple of (latitude, longitude) for the first point, or an
+            array of shape (..., 2)
+        point2: Tuple of (latitude, longitude) for the second point, or an
+            array of shape (..., 2)
         
     Returns:
-        Distance in meters between the two points
+        Distance in meters between the two points, or an array of distances
     """
-    return calculate_distance(point1[0], point1[1], point2[0], point2[1])
\ No newline at end of file
+    if isinstance(point1, np.ndarray) or isinstance(point2, np.ndarray):
+        point1 = np.asarray(point1, dtype=np.float64)
+        point2 = np.asarray(point2, dtype=np.float64)
+        return calculate_distances(point1[..., 0], point1[..., 1], point2[..., 0], point2[..., 1])
+    
+    return calculate_distance(point1[0], point1[1], point2[0], point2[1])
+
+# Compiled scalar versions for hot loops, usable from Python and from other
+# Numba kernels; without Numba they are the plain Python functions
+if HAVE_NUMBA:
+    calculate_distance_fast = njit(cache=True)(calculate_distance)
+    calculate_bearing_fast = njit(cache=True)(calculate_bearing)
+    offset_position_fast = njit(cache=True)(offset_position)
+    
+    @njit(cache=True, parallel=True)
+    def _pairwise_distances_kernel(lat1, lon1, cos_lat1, lat2, lon2, cos_lat2, out):
+        """
+        Fill out[i, j] with the Haversine distance between point i of the
+        first set and point j of the second, one row per parallel iteration.
+        
+        Coordinates are in radians, with their latitude cosines precomputed.
+        """
+        # Earth's radius in meters
+        R = 6371000.0
+        
+        for i in prange(lat1.shape[0]):
+            for j in range(lat2.shape[0]):
+                sin_d_lat = math.sin((lat2[j] - lat1[i]) / 2)
+                sin_d_lon = math.sin((lon2[j] - lon1[i]) / 2)
+                a = sin_d_lat * sin_d_lat + cos_lat1[i] * cos_lat2[j] * sin_d_lon * sin_d_lon
+                out[i, j] = 2 * R * math.asin(min(1.0, math.sqrt(a)))
+else:
+    calculate_distance_fast = calculate_distance
+    calculate_bearing_fast = calculate_bearing
+    offset_position_fast = offset_position
\ No newline at end of file
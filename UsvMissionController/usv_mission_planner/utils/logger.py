@@ -5,17 +5,199 @@ This module provides a standardized logging setup for the application.
 """
 
 import os
+import stat
+import time
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Listener writing queued records to the log file, and the queue handler
+# feeding it from the root logger
+_listener = None
+_queue_handler = None
+
+def stop_logging():
+    """
+    Stop the background log writer, flushing any queued records to the file.
+    """
+    global _listener, _queue_handler
+    
+    if _queue_handler is not None:
+        logging.getLogger('').removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(stop_logging)
+
+class _FlushingQueueListener(QueueListener):
+    """
+    Queue listener that flushes its handlers whenever the queue runs empty.
+    
+    Lets batched handlers hold records in their buffers during bursts
+    without leaving them unwritten once logging goes quiet.
+    """
+    
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second.
+    
+    Output is identical to logging.Formatter; strftime only runs when a
+    record falls in a new second or asks for a different date format.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ((second, datefmt), formatted time), replaced as a whole so
+        # threads sharing the formatter never see a mismatched pair
+        self._cached_time = (None, None)
+    
+    def formatTime(self, record, datefmt=None):
+        key = (int(record.created), datefmt)
+        cached_key, text = self._cached_time
+        if key != cached_key:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._cached_time = (key, text)
+        if not datefmt and self.default_msec_format:
+            return self.default_msec_format % (text, record.msecs)
+        return text
+
+class BackgroundRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that shifts backup files on a worker thread.
+    
+    On rollover the active log is renamed aside and a fresh file opened
+    straight away; renumbering the existing backups happens in the
+    background. Rollovers are serialized by a single worker.
+    
+    With batched set, records are not flushed one at a time: the file
+    buffer, sized from the file system block size, is written out when
+    full or when flush is called. The rollover check then uses a running
+    count of the characters written instead of seeking the stream, which
+    would force the buffer out on every record.
+    """
+    
+    def __init__(self, *args, batched=False, **kwargs):
+        # Size of the active log and whether it is a regular file, set
+        # whenever it is opened
+        self._stream_size = 0
+        self._regular_file = True
+        super().__init__(*args, **kwargs)
+        self.batched = batched
+        self._rollover_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-rollover')
+        self._pending_rollover = None
+    
+    def emit(self, record):
+        """Write a record, rolling the file over first if needed."""
+        if not self.batched:
+            super().emit(record)
+            return
+        
+        try:
+            msg = self.format(record) + self.terminator
+            if self.shouldRollover(record, len(msg)):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._stream_size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def shouldRollover(self, record, size=None):
+        """
+        Determine if writing a record should roll the file over first.
+        
+        Args:
+            record: Record about to be written
+            size: Length of the formatted record; when given, the check
+                uses the running size of the active log instead of
+                formatting the record again and seeking the stream
+        """
+        if size is None:
+            return super().shouldRollover(record)
+        
+        if self.stream is None:
+            self.stream = self._open()
+        # Like the stdlib check, never roll over anything but regular files
+        return self._regular_file and self.maxBytes > 0 and self._stream_size + size >= self.maxBytes
+    
+    def _open(self):
+        """Open the active log and record its current size."""
+        stream = super()._open()
+        st = os.fstat(stream.fileno())
+        self._stream_size = st.st_size
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+    
+    def doRollover(self):
+        """Move the active log aside and open a new one."""
+        if self.backupCount <= 0:
+            super().doRollover()
+            return
+        
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            # Same filesystem rename, so this is atomic and cheap
+            if self._pending_rollover is not None:
+                self._pending_rollover.result()
+            pending = self.baseFilename + '.rollover'
+            os.replace(self.baseFilename, pending)
+            self._pending_rollover = self._rollover_executor.submit(self._shift_backups, pending)
+        if not self.delay:
+            self.stream = self._open()
+    
+    def _shift_backups(self, pending):
+        """
+        Renumber the backup files and install the rotated log as backup 1.
+        
+        Args:
+            pending: Path the active log was renamed to
+        """
+        for i in range(self.backupCount - 1, 0, -1):
+            source = self.rotation_filename(f"{self.baseFilename}.{i}")
+            dest = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+            if os.path.exists(source):
+                os.replace(source, dest)
+        dest = self.rotation_filename(self.baseFilename + '.1')
+        if os.path.exists(dest):
+            os.remove(dest)
+        self.rotate(pending, dest)
+    
+    def close(self):
+        """Wait for pending rollovers, then close the file."""
+        self._rollover_executor.shutdown(wait=True)
+        super().close()
 
 def setup_logging(level='INFO', log_file='usv_mission.log'):
     """
     Set up application-wide logging.
     
+    File output goes through a queue drained by a background thread, so
+    logging calls never block on file writes or rotation. Call
+    stop_logging to flush the queue.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to the log file
     """
+    global _listener, _queue_handler
+    
     # Set up root logger level
     level_map = {
         'DEBUG': logging.DEBUG,
@@ -27,24 +209,32 @@ def setup_logging(level='INFO', log_file='usv_mission.log'):
     log_level = level_map.get(level.upper(), logging.INFO)
     
     # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(CachedTimeFormatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    ))
+    logging.basicConfig(level=log_level, handlers=[console_handler])
     
     # Create a file handler for logging to a file
-    file_handler = RotatingFileHandler(
+    file_handler = BackgroundRotatingFileHandler(
         log_file,
         maxBytes=5*1024*1024,  # 5MB max file size
-        backupCount=3  # Keep 3 backup files
+        backupCount=3,  # Keep 3 backup files
+        batched=True  # The listener flushes when its queue runs empty
     )
     file_handler.setLevel(log_level)
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(file_formatter)
     
-    # Add the file handler to the root logger
-    logging.getLogger('').addHandler(file_handler)
+    # Replace any previous file writer, then route root logger records to
+    # the file handler through the queue
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    _listener = _FlushingQueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    _queue_handler = QueueHandler(log_queue)
+    logging.getLogger('').addHandler(_queue_handler)
     
     # Return the root logger
     return logging.getLogger('')